@@ -0,0 +1,45 @@
+"""
+Compares writing a CSV report row at a time through ``file_writer``
+with writing it through a buffered ``CsvSink``.
+
+Run from the root of the repository::
+
+    python benchmarks/csv_sink.py --rows 100000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from jiraone import file_writer, CsvSink
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+    row = ["IP-1", "10001", "A summary of the issue", "2024-01-01T10:00"]
+    folder = tempfile.mkdtemp()
+
+    start = time.perf_counter()
+    for _ in range(args.rows):
+        # one open, write and close per row, as the reports did before
+        file_writer(folder, "file_writer.csv", data=row)
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with CsvSink(folder, "csv_sink.csv", mode="w+") as sink:
+        for _ in range(args.rows):
+            sink.writerow(row)
+    after = time.perf_counter() - start
+
+    for name in ("file_writer.csv", "csv_sink.csv"):
+        os.remove(os.path.join(folder, name))
+    os.rmdir(folder)
+    print(f"{args.rows} rows")
+    print(f"file_writer: {args.rows / before:12,.0f} rows/sec")
+    print(f"CsvSink:     {args.rows / after:12,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compares the sub-task links of a synthetic JSON export resolved with a
+scan of every issue per sub-task, as ``run_multi_check`` did, and with
+a ``SubTaskIndex``.
+
+Run from the root of the repository::
+
+    python benchmarks/sub_task_links.py --issues 100000
+"""
+import argparse
+import time
+
+from jiraone.utils import SubTaskIndex
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--issues", type=int, default=100000)
+    parser.add_argument(
+        "--sub-tasks", type=int, default=5, help="one sub-task every N issues"
+    )
+    args = parser.parse_args()
+    projects = [[] for _ in range(4)]
+    for number in range(args.issues):
+        issue = {"id": str(number), "key": f"A-{number}", "issueType": "Task"}
+        if number % args.sub_tasks == 0:
+            issue.update(issueType="Sub-task", parent=str(number + 1))
+        projects[number * len(projects) // args.issues].append(issue)
+
+    start = time.perf_counter()
+    scanned = []
+    for issues in projects:
+        for issue in issues:
+            if issue["issueType"] == "Sub-task":
+                parent = next(
+                    (
+                        other["key"]
+                        for others in projects
+                        for other in others
+                        if other["id"] == issue["parent"]
+                    ),
+                    "",
+                )
+                scanned.append(
+                    {
+                        "name": "jira_subtask_link",
+                        "destinationId": issue["key"],
+                        "sourceId": parent,
+                    }
+                )
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = SubTaskIndex(["Sub-task"])
+    for project_index, issues in enumerate(projects):
+        for issue in issues:
+            index.add(project_index, issue)
+    indexed = index.links()
+    after = time.perf_counter() - start
+
+    assert scanned == indexed, "The links differ"
+    print(f"{args.issues} issues, {len(indexed)} sub-tasks")
+    print(f"scan per sub-task: {before:8.2f}s")
+    print(f"SubTaskIndex:      {after:8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
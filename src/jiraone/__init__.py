@@ -21,13 +21,15 @@ You can dynamically generate a report of
 and many more depending on what you can come up with.
 
 """
-from jiraone.access import LOGIN, endpoint, echo, For, field
+from jiraone.access import LOGIN, ALOGIN, endpoint, echo, For, field
 from jiraone.jira_logs import add_log, WORK_PATH
 from jiraone.reporting import (
     PROJECT,
     USER,
     file_writer,
     file_reader,
+    iter_rows,
+    CsvSink,
     path_builder,
     replacement_placeholder,
     comment,
@@ -40,6 +42,7 @@ __author__ = "Prince Nyeche"
 __version__ = "0.9.4"
 __all__ = [
     "LOGIN",
+    "ALOGIN",
     "endpoint",
     "echo",
     "add_log",
@@ -48,6 +51,8 @@ __all__ = [
     "USER",
     "file_writer",
     "file_reader",
+    "iter_rows",
+    "CsvSink",
     "path_builder",
     "replacement_placeholder",
     "For",
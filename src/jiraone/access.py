@@ -10,15 +10,995 @@
 import string
 import random
 import sys
+import os
+import re
 import json
-from typing import Any, Optional, Union, Dict, List
+import asyncio
+import threading
+import time
+from typing import Any, Optional, Union, Dict, List, Iterable
 from pprint import PrettyPrinter
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from jiraone.exceptions import JiraOneErrors
 from jiraone.jira_logs import add_log
 
 
+class RateLimiter:
+    """class.RateLimiter -> a token bucket shared by every request of a
+    login, which adapts its rate to the rate limit responses of Jira.
+
+    * Every request takes a token from the bucket, which is refilled at
+      ``rate`` tokens per second up to ``burst`` tokens.
+
+    * A ``429`` or ``503`` response halves the rate, and a ``Retry-After``
+      header pauses every thread until the time given has elapsed.
+
+    * The ``X-RateLimit-Remaining`` and ``X-RateLimit-Reset`` headers
+      lower the rate, so the remaining requests are spread until the reset.
+
+    * Successful responses slowly raise the rate back to ``max_rate``.
+
+    .. versionadded:: 0.9.5
+    """
+
+    def __init__(
+        self,
+        rate: Union[float, int] = 100,
+        burst: int = 100,
+        min_rate: Union[float, int] = 0.5,
+        max_rate: Union[float, int] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Instantiate the rate limiter.
+
+        :param rate: The number of requests allowed per second
+
+        :param burst: The number of requests that can be sent at once
+
+        :param min_rate: The lowest rate the limiter can adapt to
+
+        :param max_rate: The highest rate the limiter can adapt to,
+                         defaults to ``rate``
+
+        :param kwargs: Additional keyword arguments
+
+                       **Acceptable options**
+
+                       * increase: The rate added after a successful
+                         response. Defaults to 0.5
+
+                       * backoff_base: The first backoff delay in seconds.
+                         Defaults to 1
+
+                       * backoff_cap: The longest backoff delay in seconds.
+                         Defaults to 60
+
+        :return: None
+        """
+        self.rate = float(rate)
+        self.burst = burst
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate if max_rate is not None else rate)
+        self.increase: float = kwargs.get("increase", 0.5)
+        self.backoff_base: float = kwargs.get("backoff_base", 1)
+        self.backoff_cap: float = kwargs.get("backoff_cap", 60)
+        self.tokens = float(burst)
+        self.paused_until = 0.0
+        self.throttled = 0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token from the bucket.
+
+        :return: The number of seconds to wait before the request is sent
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.paused_until - now)
+
+    def acquire(self) -> None:
+        """Blocks the calling thread until a token is available.
+
+        :return: None
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def update(self, response: requests.Response) -> None:
+        """Adapts the rate to the headers and status of a response.
+
+        :param response: An HTTP response
+
+        :return: None
+        """
+        headers = response.headers
+        retry_after = self.retry_after(response)
+        with self._lock:
+            now = time.monotonic()
+            if response.status_code in (429, 503):
+                self.throttled += 1
+                self.rate = max(self.min_rate, self.rate / 2)
+                if retry_after is not None:
+                    self.paused_until = max(self.paused_until, now + retry_after)
+            else:
+                near_limit = headers.get("X-RateLimit-NearLimit", "")
+                if near_limit.lower() == "true":
+                    self.rate = max(self.min_rate, self.rate * 0.8)
+                elif response.status_code < 400:
+                    self.rate = min(self.max_rate, self.rate + self.increase)
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset = self.__reset_seconds__(headers.get("X-RateLimit-Reset"))
+            if remaining is not None and reset:
+                try:
+                    allowed = int(remaining) / reset
+                except ValueError:
+                    allowed = None
+                if allowed is not None and allowed < self.rate:
+                    self.rate = max(self.min_rate, allowed)
+
+    def backoff(
+        self, attempt: int, response: requests.Response = None
+    ) -> float:
+        """Returns a jittered exponential delay for a retry attempt, which
+        is never shorter than the ``Retry-After`` header of the response.
+
+        :param attempt: The number of retries already made
+
+        :param response: An HTTP response
+
+        :return: A delay in seconds
+        """
+        delay = random.uniform(
+            0, min(self.backoff_cap, self.backoff_base * 2 ** attempt)
+        )
+        retry_after = (
+            self.retry_after(response) if response is not None else None
+        )
+        return max(delay, retry_after) if retry_after is not None else delay
+
+    @staticmethod
+    def retry_after(response: requests.Response) -> Optional[float]:
+        """Reads the ``Retry-After`` header of a response in seconds.
+
+        :param response: An HTTP response
+
+        :return: A number of seconds or None
+        """
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            from email.utils import parsedate_to_datetime
+            from datetime import datetime, timezone
+
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            return max(
+                0.0, (retry_at - datetime.now(timezone.utc)).total_seconds()
+            )
+
+    @staticmethod
+    def __reset_seconds__(value: Optional[str]) -> Optional[float]:
+        """Converts an ``X-RateLimit-Reset`` timestamp into the number of
+        seconds until the reset."""
+        if not value:
+            return None
+        from datetime import datetime, timezone
+
+        try:
+            reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if reset_at.tzinfo is None:
+            reset_at = reset_at.replace(tzinfo=timezone.utc)
+        seconds = (reset_at - datetime.now(timezone.utc)).total_seconds()
+        return seconds if seconds > 0 else None
+
+    @property
+    def stats(self) -> dict:
+        """Returns the current rate and the count of throttled responses."""
+        return {"rate": round(self.rate, 3), "throttled": self.throttled}
+
+
+class SearchPager:
+    """class.SearchPager -> iterates over the pages of a JQL search,
+    using ``nextPageToken`` on Jira Cloud and ``startAt`` on Server or DC.
+
+    * Pages are fetched lazily, so only the current and the next page are
+      held in memory.
+
+    * The next page is prefetched in a background thread while the caller
+      processes the current one.
+
+    * ``cursor`` is the ``startAt`` or ``nextPageToken`` value of the page
+      last yielded and ``next_cursor`` the one of the page after it. Either
+      can be saved and passed back as ``cursor`` to resume a search.
+
+    * ``status_code`` is the status of the last page which failed, so a
+      rejected query (400) can be told apart from a server error.
+
+    * On Server or DC, the first page gives the ``total`` of the search, so
+      the remaining ``startAt`` offsets are fetched by ``workers`` threads
+      at once and still yielded in order.
+
+    Example 1::
+
+      from jiraone import LOGIN
+
+      # previous login statement
+      for page in LOGIN.iter_pages("project = IT", fields=["summary"]):
+          print(len(page["issues"]))
+
+    .. versionadded:: 0.9.5
+    """
+
+    def __init__(
+        self,
+        login: Any,
+        jql: str,
+        *,
+        fields: Union[str, List[str], None] = None,
+        expand: Optional[str] = None,
+        page_size: int = 100,
+        cursor: Union[str, int, None] = None,
+        prefetch: bool = True,
+        max_attempts: int = 10,
+        workers: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Instantiate the search.
+
+        :param login: The login used to send the requests
+
+        :param jql: A valid JQL query
+
+        :param fields: A list or comma separated string of field ids to
+                       return. Defaults to the fields of the search API.
+
+        :param expand: A comma separated string of entities to expand
+                       e.g. "names,changelog"
+
+        :param page_size: The number of issues per page
+
+        :param cursor: A ``startAt`` or ``nextPageToken`` value to start
+                       the search from
+
+        :param prefetch: Fetches the next page while the current page is
+                         processed
+
+        :param max_attempts: The number of times a page is requested
+                             again when the server returns an error
+
+        :param workers: The number of pages fetched at once on Server or
+                        DC. Defaults to the ``search_workers`` attribute of
+                        the login.
+
+        :param kwargs: Other arguments of ``endpoint.search_cloud_issues``
+                       sent with every page on Jira Cloud e.g.
+                       ``properties`` and ``fields_by_keys``
+
+        :return: None
+        """
+        if not isinstance(jql, str):
+            raise JiraOneErrors(
+                "wrong", "Invalid data structure received. Expected a string."
+            )
+        if page_size < 1:
+            raise JiraOneErrors(
+                "value", "The `page_size` argument cannot be lesser than 1."
+            )
+        self.login = login
+        self.jql = jql
+        self.fields = (
+            ",".join(fields) if isinstance(fields, (list, tuple)) else fields
+        )
+        self.expand = expand
+        self.params = kwargs
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.max_attempts = max_attempts
+        self.workers = (
+            workers if workers is not None
+            else getattr(login, "search_workers", 1)
+        )
+        if cursor is None and login.api is False:
+            cursor = 0
+        self.cursor = cursor
+        self.next_cursor = cursor
+        self.total: Optional[int] = None
+        self.status_code: Optional[int] = None
+        self.pages = 0
+        self.count = 0
+
+    def url(self, cursor: Union[str, int, None] = None) -> str:
+        """Returns the search URL of a page.
+
+        :param cursor: A ``startAt`` or ``nextPageToken`` value
+
+        :return: A string of the url
+        """
+        from urllib.parse import quote
+
+        query = quote(self.jql)
+        if self.login.api is True:
+            url = endpoint.search_cloud_issues(
+                query,
+                next_page=quote(cursor) if cursor else None,
+                fields=self.fields,
+                expand=self.expand,
+                max_results=self.page_size,
+                **self.params,
+            )
+        else:
+            url = endpoint.search_issues_jql(
+                query, start_at=cursor, max_results=self.page_size
+            )
+            if self.fields is not None:
+                url += f"&fields={self.fields}"
+            if self.expand is not None:
+                url += f"&expand={self.expand}"
+        return url
+
+    def fetch(self, cursor: Union[str, int, None] = None) -> dict:
+        """Requests a single page of the search.
+
+        :param cursor: A ``startAt`` or ``nextPageToken`` value
+
+        :return: The search result of the page
+        """
+        attempt = 0
+        while True:
+            response = self.login.get(self.url(cursor))
+            if response.status_code < 300:
+                return response.json()
+            # the transport already retried rate limited responses,
+            # so only server errors are attempted again here.
+            attempt += 1
+            self.status_code = response.status_code
+            if response.status_code < 500 or attempt >= self.max_attempts:
+                add_log(
+                    'Searching the issues with query "{}" returned a "{}" '
+                    'error with reason "{}".'.format(
+                        self.jql, response.status_code, response.reason
+                    ),
+                    "error",
+                )
+                raise JiraOneErrors(
+                    "value",
+                    'It seems that the search "{}" cannot be retrieved as '
+                    "we've attempted it {} times".format(self.jql, attempt),
+                )
+            limiter = self.login.rate_limiter
+            time.sleep(
+                limiter.backoff(attempt, response)
+                if limiter is not None
+                else attempt
+            )
+
+    def following(
+        self, page: dict, cursor: Union[str, int, None]
+    ) -> Union[str, int, None]:
+        """Returns the cursor of the page after ``page`` or None on the
+        last page.
+
+        :param page: The search result of a page
+
+        :param cursor: The cursor used to fetch ``page``
+
+        :return: A cursor or None
+        """
+        if self.login.api is True:
+            if page.get("isLast") is True:
+                return None
+            return page.get("nextPageToken")
+        issues = page.get("issues") or []
+        self.total = page.get("total", self.total)
+        following = cursor + len(issues)
+        if not issues or (self.total is not None and following >= self.total):
+            return None
+        return following
+
+    def __iter__(self) -> Iterable[dict]:
+        """Yields the search result of every page."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        if self.login.api is False and self.workers > 1:
+            yield from self.__fan_out__()
+            return
+        cursor = self.next_cursor
+        executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        future = None
+        try:
+            while True:
+                page = (
+                    future.result() if future is not None
+                    else self.fetch(cursor)
+                )
+                following = self.following(page, cursor)
+                future = (
+                    executor.submit(self.fetch, following)
+                    if executor is not None and following is not None
+                    else None
+                )
+                self.cursor, self.next_cursor = cursor, following
+                self.pages += 1
+                self.count += len(page.get("issues") or [])
+                yield page
+                if following is None:
+                    break
+                cursor = following
+        finally:
+            if executor is not None:
+                if future is not None:
+                    future.cancel()
+                executor.shutdown(wait=False)
+
+    def __fan_out__(self) -> Iterable[dict]:
+        """Yields the pages of a Server or DC search, fetching the pages
+        after the first one in parallel."""
+        from jiraone.utils import BoundedExecutor
+
+        cursor = self.next_cursor
+        page = self.fetch(cursor)
+        following = self.following(page, cursor)
+        self.cursor, self.next_cursor = cursor, following
+        self.pages += 1
+        self.count += len(page.get("issues") or [])
+        yield page
+        if following is None:
+            return
+        # the server may return fewer issues than asked for per page
+        step = len(page.get("issues") or []) or self.page_size
+        offsets = range(following, self.total, step)
+        with BoundedExecutor(
+            workers=self.workers, name="jiraone-search"
+        ) as pool:
+            for offset, page in zip(offsets, pool.map(self.fetch, offsets)):
+                issues = page.get("issues") or []
+                following = offset + len(issues)
+                self.cursor = offset
+                self.next_cursor = (
+                    following
+                    if issues and following < (page.get("total") or 0)
+                    else None
+                )
+                self.pages += 1
+                self.count += len(issues)
+                yield page
+
+    def issues(self) -> Iterable[dict]:
+        """Yields every issue of the search one after another.
+
+        :return: An iterator of issues
+        """
+        for page in self:
+            yield from page.get("issues") or []
+
+
+class ShardedSearch:
+    """class.ShardedSearch -> splits a Jira Cloud JQL search into disjoint
+    ``created`` date windows and pages through them concurrently.
+
+    * The ``nextPageToken`` of Jira Cloud cannot be computed ahead, so a
+      single search is one serial cursor. Windows of the ``created`` date
+      are disjoint sub-queries, each with its own cursor.
+
+    * The windows are planned by halving the date range until the
+      approximate count of every window is at most ``shard_size`` issues.
+
+    * Pages are yielded as soon as any window returns them, so the order
+      of the issues is not kept.
+
+    Example 1::
+
+      from jiraone import LOGIN
+
+      # previous login statement
+      search = LOGIN.iter_shards("project = IT", shard_size=2000, workers=4)
+      for issue in search.issues():
+          print(issue["key"])
+
+    .. versionadded:: 0.9.5
+    """
+
+    def __init__(
+        self,
+        login: Any,
+        jql: str,
+        *,
+        shard_size: int = 5000,
+        workers: int = 4,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Instantiate the search.
+
+        :param login: The login used to send the requests
+
+        :param jql: A valid JQL query
+
+        :param shard_size: The highest number of issues in a window
+
+        :param workers: The number of windows searched at once
+
+        :param kwargs: Keyword arguments of :class:`SearchPager` used for
+                       every window e.g. ``fields``, ``expand`` and
+                       ``page_size``
+
+        :return: None
+        """
+        if not isinstance(jql, str):
+            raise JiraOneErrors(
+                "wrong", "Invalid data structure received. Expected a string."
+            )
+        if shard_size < 1 or workers < 1:
+            raise JiraOneErrors(
+                "value",
+                "The `shard_size` and `workers` arguments cannot be "
+                "lesser than 1.",
+            )
+        self.login = login
+        # windows are added to the query, so any ordering is dropped
+        self.jql = re.sub(
+            r"\s*\border\s+by\b.*$", "", jql, flags=re.IGNORECASE | re.DOTALL
+        ).strip()
+        self.shard_size = shard_size
+        self.workers = workers
+        self.kwargs = kwargs
+        self.shards: List[str] = []
+        self.count = 0
+
+    def approximate_count(self, jql: str) -> int:
+        """Returns the approximate number of issues of a query.
+
+        :param jql: A valid JQL query
+
+        :return: A number of issues
+        """
+        response = self.login.post(
+            endpoint.search_issue_count(), payload={"jql": jql}
+        )
+        if response.status_code >= 300:
+            raise JiraOneErrors(
+                "value",
+                'Unable to count the issues of the search "{}" with reason '
+                '"{}".'.format(jql, response.reason),
+            )
+        return response.json().get("count", 0)
+
+    def window(self, start: Any, end: Any) -> str:
+        """Returns the query of the issues created within a window.
+
+        :param start: The datetime the window starts at, included
+
+        :param end: The datetime the window ends at, excluded
+
+        :return: A JQL query
+        """
+        query = 'created >= "{}" AND created < "{}"'.format(
+            start.strftime("%Y/%m/%d %H:%M"), end.strftime("%Y/%m/%d %H:%M")
+        )
+        return f"({self.jql}) AND {query}" if self.jql else query
+
+    def __edge__(self, order: str) -> Any:
+        """Returns the created date of the first issue in a given order."""
+        from datetime import datetime
+
+        query = f"{self.jql} ORDER BY created {order}".strip()
+        pages = SearchPager(
+            self.login, query, fields=["created"], page_size=1, prefetch=False
+        )
+        issues = next(iter(pages)).get("issues") or []
+        if not issues:
+            return None
+        created = issues[0]["fields"]["created"]
+        # JQL dates are read in the timezone of the user, the time of day
+        # is dropped and the range padded instead.
+        return datetime.strptime(created[:10], "%Y-%m-%d")
+
+    def plan(self) -> List[str]:
+        """Splits the search into windows of at most ``shard_size`` issues.
+
+        :return: A list of JQL queries
+        """
+        from datetime import timedelta
+        from jiraone.utils import BoundedExecutor
+
+        first, last = self.__edge__("ASC"), self.__edge__("DESC")
+        if first is None or last is None:
+            self.shards = []
+            return self.shards
+        pending = [(first - timedelta(days=1), last + timedelta(days=2))]
+        windows = []
+        with BoundedExecutor(workers=self.workers) as pool:
+            # every window of a level is counted at once
+            while pending:
+                totals = pool.map(
+                    lambda item: self.approximate_count(self.window(*item)),
+                    pending,
+                )
+                halves = []
+                for (start, end), total in zip(pending, totals):
+                    if (
+                        total > self.shard_size
+                        and end - start > timedelta(minutes=1)
+                    ):
+                        middle = start + timedelta(
+                            minutes=int((end - start).total_seconds() // 120)
+                        )
+                        halves.extend([(start, middle), (middle, end)])
+                    else:
+                        windows.append((start, end, total))
+                pending = halves
+        # the count is approximate and may lag behind the index, a window
+        # counted empty is still searched. Adjacent empty windows are
+        # searched as one.
+        merged = []
+        for start, end, total in sorted(windows):
+            if merged and total == 0 and merged[-1][2] == 0:
+                merged[-1] = (merged[-1][0], end, 0)
+            else:
+                merged.append((start, end, total))
+        shards = [self.window(start, end) for start, end, _ in merged]
+        add_log(
+            'The search "{}" is split into {} windows'.format(
+                self.jql, len(shards)
+            ),
+            "info",
+        )
+        self.shards = shards
+        return shards
+
+    def __iter__(self) -> Iterable[dict]:
+        """Yields the search result of every page of every window."""
+        import queue
+        from jiraone.utils import BoundedExecutor
+
+        shards = self.shards or self.plan()
+        pages: queue.Queue = queue.Queue(maxsize=self.workers * 2)
+        stop = threading.Event()
+        done = object()
+
+        def search(query: str) -> None:
+            """Pages through a single window."""
+            try:
+                for page in SearchPager(
+                    self.login, query, prefetch=False, **self.kwargs
+                ):
+                    while not stop.is_set():
+                        try:
+                            pages.put(page, timeout=0.5)
+                            break
+                        except queue.Full:
+                            continue
+                    if stop.is_set():
+                        return
+            except Exception as error:
+                pages.put(error)
+            finally:
+                pages.put(done)
+
+        pool = BoundedExecutor(
+            workers=self.workers,
+            queue_size=len(shards) or 1,
+            raise_on_error=True,
+            name="jiraone-shard",
+        )
+        try:
+            for query in shards:
+                pool.submit(search, query)
+            remaining = len(shards)
+            while remaining:
+                page = pages.get()
+                if page is done:
+                    remaining -= 1
+                    continue
+                if isinstance(page, Exception):
+                    raise page
+                self.count += len(page.get("issues") or [])
+                yield page
+        finally:
+            stop.set()
+            # unblock the windows still waiting on a full queue
+            while not pages.empty():
+                pages.get_nowait()
+            pool.shutdown(cancel=True)
+
+    def issues(self) -> Iterable[dict]:
+        """Yields every issue of the search one after another.
+
+        :return: An iterator of issues
+        """
+        for page in self:
+            yield from page.get("issues") or []
+
+
+class FieldCatalog:
+    """class.FieldCatalog -> the fields of a Jira instance, loaded once per
+    login and indexed by name, id, ``cf[NNNNN]`` alias and custom type.
+
+    * The fields are loaded from the field endpoint on the first lookup and
+      loaded again when the ``base_url`` of the login changes.
+
+    * A lookup which finds nothing reloads the fields, at most once every
+      ``refresh_interval`` seconds, so a field created meanwhile is found.
+      Call :meth:`refresh` to reload them at once.
+
+    * When ``cache_file`` is set, the fields are saved to that JSON file
+      under the ``base_url`` of the instance and reused for ``ttl`` seconds
+      by the next run.
+
+    .. versionadded:: 0.9.5
+    """
+
+    def __init__(
+        self,
+        login: Any = None,
+        cache_file: str = None,
+        ttl: Union[float, int] = 3600,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Instantiate the field catalog.
+
+        :param login: The login used to load the fields, defaults to LOGIN
+
+        :param cache_file: A path to a JSON file where the fields are kept
+                           between runs. The fields are not saved when None
+
+        :param ttl: The number of seconds the ``cache_file`` stays valid
+
+        :param kwargs: Additional keyword arguments
+
+                       **Acceptable options**
+
+                       * refresh_interval: The least number of seconds
+                         between two reloads caused by a lookup which found
+                         nothing. Defaults to 300
+
+        :return: None
+        """
+        self.login = login
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.refresh_interval: float = kwargs.get("refresh_interval", 300)
+        self.fields: List[dict] = []
+        self.base_url = None
+        self.loads = 0
+        self._loaded_at = 0.0
+        self._names: Dict[str, List[dict]] = {}
+        self._ids: Dict[str, dict] = {}
+        self._custom_types: Dict[str, List[dict]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Returns the number of fields loaded."""
+        self.load()
+        return len(self.fields)
+
+    def __iter__(self) -> Iterable[dict]:
+        """Iterates over the fields in the order Jira returned them."""
+        self.load()
+        return iter(list(self.fields))
+
+    def load(self) -> None:
+        """Loads the fields, unless they are loaded for the current
+        ``base_url`` of the login already.
+
+        :return: None
+        """
+        login = self.login or LOGIN
+        if self.base_url == login.base_url and self._loaded_at:
+            return
+        with self._lock:
+            if self.base_url == login.base_url and self._loaded_at:
+                return
+            fields = self.read_cache(login.base_url)
+            if fields is None:
+                fields = self.fetch()
+            # a failed request leaves the catalog unloaded, so the next
+            # lookup requests the fields again.
+            if fields is not None:
+                self.index(fields)
+
+    def refresh(self) -> None:
+        """Loads the fields from Jira again and saves them to the
+        ``cache_file``. The fields already loaded are kept when the
+        request fails.
+
+        :return: None
+        """
+        with self._lock:
+            fields = self.fetch()
+            if fields is not None:
+                self.index(fields)
+
+    def fetch(self) -> Optional[List[dict]]:
+        """Requests every system and custom field of the instance.
+
+        :return: A list of fields or None if the request failed
+        """
+        login = self.login or LOGIN
+        response = login.get(endpoint.get_field(system="field"))
+        self.loads += 1
+        if response.status_code >= 300:
+            add_log(
+                "Loading the fields of {} failed with {} {}".format(
+                    login.base_url, response.status_code, response.reason
+                ),
+                "error",
+            )
+            return None
+        fields = response.json()
+        self.write_cache(login.base_url, fields)
+        return fields
+
+    def read_cache(self, base_url: str) -> Optional[List[dict]]:
+        """Reads the fields of an instance from the ``cache_file``.
+
+        :param base_url: The URL of the instance
+
+        :return: A list of fields or None if there's no valid cache
+        """
+        if self.cache_file is None or not os.path.isfile(self.cache_file):
+            return None
+        try:
+            with open(self.cache_file, encoding="utf-8") as cache:
+                saved = json.load(cache).get(base_url)
+        except (OSError, ValueError) as err:
+            add_log(f"Unable to read the field cache: {err}", "error")
+            return None
+        if saved is None or time.time() - saved["time"] > self.ttl:
+            return None
+        return saved["fields"]
+
+    def write_cache(self, base_url: str, fields: List[dict]) -> None:
+        """Saves the fields of an instance to the ``cache_file``.
+
+        :param base_url: The URL of the instance
+
+        :param fields: A list of fields
+
+        :return: None
+        """
+        if self.cache_file is None:
+            return
+        saved = {}
+        if os.path.isfile(self.cache_file):
+            try:
+                with open(self.cache_file, encoding="utf-8") as cache:
+                    saved = json.load(cache)
+            except (OSError, ValueError):
+                saved = {}
+        saved[base_url] = {"time": time.time(), "fields": fields}
+        with open(self.cache_file, mode="w+", encoding="utf-8") as cache:
+            json.dump(saved, cache)
+
+    def index(self, fields: List[dict]) -> None:
+        """Builds the lookups of a list of fields.
+
+        :param fields: A list of fields
+
+        :return: None
+        """
+        names, ids, custom_types = {}, {}, {}
+        for jira_field in fields:
+            schema = jira_field.get("schema") or {}
+            names.setdefault(jira_field.get("name"), []).append(jira_field)
+            ids.setdefault(str(jira_field.get("id")).lower(), jira_field)
+            if schema.get("customId") is not None:
+                ids.setdefault(f"cf[{schema['customId']}]", jira_field)
+            if schema.get("custom") is not None:
+                custom_types.setdefault(schema["custom"], []).append(jira_field)
+        (
+            self.fields,
+            self._names,
+            self._ids,
+            self._custom_types,
+        ) = (
+            fields,
+            names,
+            ids,
+            custom_types,
+        )
+        self.base_url = (self.login or LOGIN).base_url
+        self._loaded_at = time.monotonic()
+
+    def __lookup__(self, find: Any) -> Any:
+        """Runs a lookup, the fields are reloaded once when it finds
+        nothing and they are older than ``refresh_interval``.
+
+        :param find: A callable doing the lookup
+
+        :return: The result of the lookup
+        """
+        self.load()
+        found = find()
+        if not found and (
+            time.monotonic() - self._loaded_at > self.refresh_interval
+        ):
+            self.refresh()
+            found = find()
+        return found
+
+    def by_name(self, name: str, custom: bool = None) -> Optional[dict]:
+        """Finds a field by its name.
+
+        :param name: The name of a field e.g. Sprint
+
+        :param custom: When True, only custom fields are searched, when
+                       False, only system fields.
+
+        :return: The first field with that name or None
+        """
+        return self.__lookup__(
+            lambda: next(
+                (
+                    jira_field
+                    for jira_field in self._names.get(name, [])
+                    if custom is None or bool(jira_field.get("custom")) is custom
+                ),
+                None,
+            )
+        )
+
+    def by_id(self, field_id: Union[str, int]) -> Optional[dict]:
+        """Finds a field by its id, e.g. summary, customfield_10020,
+        ``cf[10020]`` or 10020.
+
+        :param field_id: The id or alias of a field
+
+        :return: A field or None
+        """
+        field_id = str(field_id)
+        if re.fullmatch(r"\d+", field_id):
+            field_id = f"cf[{field_id}]"
+        return self.__lookup__(lambda: self._ids.get(field_id.lower()))
+
+    def by_custom_type(self, custom_type: str) -> List[dict]:
+        """Finds the custom fields of a type, e.g.
+        com.pyxis.greenhopper.jira:gh-sprint
+
+        :param custom_type: The custom type of a field
+
+        :return: A list of fields
+        """
+        return list(
+            self.__lookup__(lambda: self._custom_types.get(custom_type, []))
+        )
+
+    def get(self, name_or_id: Union[str, int]) -> Optional[dict]:
+        """Finds a field by its id, alias or name, in that order.
+
+        :param name_or_id: The id, ``cf[NNNNN]`` alias or name of a field
+
+        :return: A field or None
+        """
+        field_id = str(name_or_id)
+        if re.fullmatch(r"\d+", field_id):
+            field_id = f"cf[{field_id}]"
+        return self.__lookup__(
+            lambda: self._ids.get(field_id.lower())
+            or next(iter(self._names.get(name_or_id, [])), None)
+        )
+
+
 class Credentials:
     """class.Credentials -> used for authentication of the user
     to the Instance."""
@@ -27,6 +1007,18 @@ class Credentials:
     headers = None
     api = True
     auth2_0 = None
+    # connection pool settings of the transport adapter
+    pool_connections = 10
+    pool_maxsize = 10
+    pool_block = False
+    keep_alive = True
+    # retry settings of rate limited responses
+    max_retries = 5
+    retry_status = (429, 503)
+    # methods which are safe to send again after a 503 response
+    idempotent_methods = ("GET", "HEAD", "OPTIONS")
+    # pages of a Server or DC search fetched at once
+    search_workers = 1
 
     def __init__(
         self,
@@ -47,6 +1039,27 @@ class Credentials:
 
         session - Provides a means to access the request session.
 
+        .. versionchanged:: 0.9.5
+
+        session - Every HTTP verb (``get``, ``post``, ``put``, ``delete``
+        and ``custom_method``) is now sent through this session, so TCP and
+        TLS connections are pooled and kept alive between requests. When no
+        session is supplied, one is created and mounted with a connection
+        pool adapter, see :meth:`configure_pool`.
+
+        field_catalog - Is an attribute holding the :class:`FieldCatalog`
+        of this login, which loads the fields of the instance once and is
+        used by :class:`Field` to look fields up.
+
+        rate_limiter - Is an attribute holding a :class:`RateLimiter`
+        shared by every thread using this login. Responses with a status in
+        ``retry_status`` are retried up to ``max_retries`` times with a
+        jittered exponential backoff which honours the ``Retry-After``
+        header. Methods not in ``idempotent_methods``, such as POST, are
+        only retried on a 429 response or a 503 response with a
+        ``Retry-After`` header, as Jira may have processed them already.
+        Set it to ``None`` to disable rate limiting and retries.
+
         save_oauth - Is a property value which provides a dictionary
         object of the current oauth token.
 
@@ -73,8 +1086,12 @@ class Credentials:
         self.oauth = oauth
         self.instance_name = None
 
+        self._pool_lock = threading.Lock()
+        self.rate_limiter = RateLimiter()
+        self.field_catalog = FieldCatalog(self)
         if session is None:
             self.session = requests.Session()
+            self.configure_pool()
         else:
             self.session = session
 
@@ -173,12 +1190,13 @@ class Credentials:
 
         def token_update(token) -> None:
             """Updates the token to environment variable."""
-            self.session.auth = token
+            # the bearer token is sent through the headers, the session
+            # auth is left untouched as it is shared by every request.
             self.auth2_0 = f"{json.dumps(token)}"
 
         def get_cloud_id():
             """Retrieve the cloud id of connected instance."""
-            cloud_id = requests.get(
+            cloud_id = self.session.get(
                 oauth_data["cloud_url"], headers=self.headers
             ).json()
             for ids in cloud_id:
@@ -203,7 +1221,7 @@ class Credentials:
                 "client_secret": oauth.get("client_secret"),
                 "refresh_token": tokens.get("refresh_token"),
             }
-            get_token = requests.post(
+            get_token = self.session.post(
                 oauth_data["token_url"], json=body, headers=self.headers
             )
             if get_token.status_code < 300:
@@ -281,7 +1299,7 @@ class Credentials:
                 "code": code,
                 "redirect_uri": redirect_url,
             }
-            get_token = requests.post(
+            get_token = self.session.post(
                 oauth_data["token_url"], json=body, headers=self.headers
             )
             if get_token.status_code < 300:
@@ -386,254 +1404,1201 @@ class Credentials:
             extra = {"type": _type, "token": sess}
             self.__token_only_session__(extra)
 
-    def get(self, url: str, *args, payload: dict = None, **kwargs) -> requests.Response:
+    def configure_pool(
+        self,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+        pool_block: bool = None,
+        keep_alive: bool = None,
+    ) -> None:
+        """Mounts a connection pool adapter on the request session.
+
+        Every HTTP verb of ``LOGIN`` is sent through ``LOGIN.session``, which
+        keeps connections to the instance alive and reuses them between
+        requests. Call this method to tune the pool, for example when
+        several threads make requests at the same time.
+
+        .. versionadded:: 0.9.5
+
+        .. code-block:: python
+
+           from jiraone import LOGIN
+
+           # previous login expression
+           LOGIN.configure_pool(pool_maxsize=50, pool_block=True)
+
+        :param pool_connections: The number of hosts to keep a
+                                 connection pool for. Defaults to 10
+
+        :param pool_maxsize: The maximum number of connections kept open
+                             per host. Defaults to 10
+
+        :param pool_block: When True, a thread waits for a free connection
+                           once ``pool_maxsize`` is reached instead of
+                           opening a connection that is discarded after use.
+
+        :param keep_alive: When False, every connection is closed after
+                           its request.
+
+        :return: None
+        """
+        with self._pool_lock:
+            if pool_connections is not None:
+                self.pool_connections = pool_connections
+            if pool_maxsize is not None:
+                self.pool_maxsize = pool_maxsize
+            if pool_block is not None:
+                self.pool_block = pool_block
+            if keep_alive is not None:
+                self.keep_alive = keep_alive
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                pool_block=self.pool_block,
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.session.headers.update(
+                {"Connection": "keep-alive" if self.keep_alive else "close"}
+            )
+            add_log(
+                "Connection pool configured with {} connections "
+                "per host".format(self.pool_maxsize),
+                "debug",
+            )
+
+    @property
+    def pool_stats(self) -> dict:
+        """Returns the statistics of the session connection pools.
+
+        .. versionadded:: 0.9.5
+
+        .. code-block:: python
+
+           from jiraone import LOGIN, endpoint
+
+           # previous login expression
+           LOGIN.get(endpoint.myself())
+           LOGIN.get(endpoint.myself())
+           print(LOGIN.pool_stats)
+           # {'pools': 1, 'requests': 2, 'connections': 1,
+           # 'open_connections': 1, 'reuse_ratio': 0.5}
+
+        :return: A dictionary of the pool count, requests sent, connections
+                 opened, idle connections kept alive and the ratio of
+                 requests which reused an existing connection.
+        """
+        stats = {
+            "pools": 0,
+            "requests": 0,
+            "connections": 0,
+            "open_connections": 0,
+            "reuse_ratio": 0.0,
+        }
+        adapters = {
+            id(adapter): adapter for adapter in self.session.adapters.values()
+        }
+        for adapter in adapters.values():
+            manager = getattr(adapter, "poolmanager", None)
+            if manager is None:
+                continue
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+                if pool is None:
+                    continue
+                stats["pools"] += 1
+                stats["requests"] += pool.num_requests
+                stats["connections"] += pool.num_connections
+                stats["open_connections"] += sum(
+                    1 for conn in list(pool.pool.queue) if conn is not None
+                ) if pool.pool is not None else 0
+        if stats["requests"] > 0:
+            stats["reuse_ratio"] = round(
+                1 - stats["connections"] / stats["requests"], 4
+            )
+        return stats
+
+    def __send__(
+        self, method: str, send: Any, *args, **kwargs
+    ) -> requests.Response:
+        """Sends a request through the rate limiter and retries it when the
+        response is rate limited.
+
+        :param method: The HTTP method of the request
+
+        :param send: A session method that sends the request
+
+        :param args: Positional arguments to the session method
+
+        :param kwargs: Keyword arguments to the session method
+
+        :return: An HTTP response
+        """
+        limiter = self.rate_limiter
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+            response = send(*args, **kwargs)
+            if limiter is None:
+                return response
+            limiter.update(response)
+            if (
+                not self.__retry__(method, response)
+                or attempt >= self.max_retries
+            ):
+                return response
+            delay = limiter.backoff(attempt, response)
+            add_log(
+                "Request to {} returned {}, retrying in {:.2f} "
+                "seconds".format(response.url, response.status_code, delay),
+                "debug",
+            )
+            # release the connection of a streamed response to the pool
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def __retry__(self, method: str, response: requests.Response) -> bool:
+        """Tells whether a response should be retried.
+
+        A rate limited response is always retried. Any other response with
+        a status in ``retry_status`` is only retried for the
+        ``idempotent_methods``, or when the server asks for it with a
+        ``Retry-After`` header, since a create or transition may have been
+        processed before the error was returned.
+
+        :param method: The HTTP method of the request
+
+        :param response: The HTTP response
+
+        :return: True if the request can be sent again
+        """
+        if response.status_code not in self.retry_status:
+            return False
+        return (
+            response.status_code == 429
+            or method.upper() in self.idempotent_methods
+            or "Retry-After" in response.headers
+        )
+
+    def get(self, url: str, *args, payload: dict = None, **kwargs) -> requests.Response:
+        """
+        A get request to HTTP request.
+
+        :param url: A valid URL
+
+        :param args: Additional arguments if any
+
+        :param payload: A JSON data representation
+
+        :param kwargs: Additional keyword arguments to ``requests`` module
+
+        :return: An HTTP response
+        """
+        response = self.__send__(
+            "GET",
+            self.session.request,
+            "GET",
+            url,
+            *args,
+            auth=self.auth_request,
+            json=payload,
+            headers=self.headers,
+            **kwargs,
+        )
+        return response
+
+    def post(
+        self, url: str, *args: Any, payload: dict = None, **kwargs
+    ) -> requests.Response:
+        """
+        A post  request to HTTP request.
+
+        :param url: A valid URL
+
+        :param args: Additional arguments if any
+
+        :param payload: A JSON data representation
+
+        :param kwargs: Additional keyword arguments to ``requests`` module
+
+
+        :return: An HTTP response
+        """
+        response = self.__send__(
+            "POST",
+            self.session.post,
+            url,
+            *args,
+            auth=self.auth_request,
+            json=payload,
+            headers=self.headers,
+            **kwargs,
+        )
+        return response
+
+    def put(self, url: str, *args, payload: dict = None, **kwargs) -> requests.Response:
+        """
+        A put request to HTTP request.
+
+        :param url: A valid URL
+
+        :param args: Additional arguments if any
+
+        :param payload: A JSON data representation
+
+        :param kwargs: Additional keyword arguments to ``requests`` module
+
+        :return: An HTTP response
+        """
+        response = self.__send__(
+            "PUT",
+            self.session.put,
+            url,
+            *args,
+            auth=self.auth_request,
+            json=payload,
+            headers=self.headers,
+            **kwargs,
+        )
+        return response
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        """
+        A delete request to HTTP request.
+
+        :param url: A valid URL
+
+        :param kwargs: Additional keyword arguments to ``requests`` module
+
+        :return: An HTTP response
+        """
+        response = self.__send__(
+            "DELETE",
+            self.session.delete,
+            url,
+            auth=self.auth_request,
+            headers=self.headers,
+            **kwargs,
+        )
+        return response
+
+    def custom_method(self, *args, **kwargs) -> requests.Response:
+        """
+        A custom request to HTTP request.
+
+        .. code-block:: python
+
+           import jiraone
+           # previous login expression
+           req = jiraone.LOGIN.custom_method('GET', 'https://nexusfive.atlassian.net')
+           print(req)
+           # <Response [200]>
+
+        :param args: The HTTP method type e.g. PUT, PATCH, DELETE etc
+
+                    Also, includes the URL that needs to be queried.
+
+        :param kwargs: Additional keyword arguments to ``requests`` module
+
+                     For example::
+
+                       json={"file": content}
+                       data={"file": content}
+
+        :return: An HTTP response
+        """
+        response = self.__send__(
+            args[0] if args else kwargs.get("method", ""),
+            self.session.request,
+            *args,
+            auth=self.auth_request,
+            headers=self.headers,
+            **kwargs,
+        )
+        return response
+
+    def iter_pages(self, jql: str, **kwargs: Any) -> SearchPager:
+        """
+        Iterates over the pages of a JQL search on Jira Cloud or Server/DC.
+
+        .. code-block:: python
+
+           from jiraone import LOGIN
+
+           # previous login statement
+           pages = LOGIN.iter_pages("project = IT", fields=["summary"])
+           for page in pages:
+               print(pages.cursor, len(page["issues"]))
+
+        :param jql: A valid JQL query
+
+        :param kwargs: Keyword arguments of :class:`SearchPager` e.g.
+                       ``fields``, ``expand``, ``page_size``, ``cursor``
+                       and ``prefetch``
+
+        .. versionadded:: 0.9.5
+
+        :return: A SearchPager object
+        """
+        return SearchPager(self, jql, **kwargs)
+
+    def iter_issues(self, jql: str, **kwargs: Any) -> Iterable[dict]:
+        """
+        Yields every issue of a JQL search on Jira Cloud or Server/DC,
+        while the next page is fetched in the background.
+
+        .. code-block:: python
+
+           from jiraone import LOGIN
+
+           # previous login statement
+           for issue in LOGIN.iter_issues("project = IT", fields=["summary"]):
+               print(issue["key"], issue["fields"]["summary"])
+
+        :param jql: A valid JQL query
+
+        :param kwargs: Keyword arguments of :class:`SearchPager` e.g.
+                       ``fields``, ``expand``, ``page_size``, ``cursor``
+                       and ``prefetch``
+
+        .. versionadded:: 0.9.5
+
+        :return: An iterator of issues
+        """
+        return self.iter_pages(jql, **kwargs).issues()
+
+    def iter_shards(
+        self, jql: str, **kwargs: Any
+    ) -> Union[SearchPager, ShardedSearch]:
+        """
+        Iterates over the pages of a JQL search using several cursors at once.
+
+        On Jira Cloud, the search is split into disjoint ``created`` date
+        windows which are searched concurrently, see :class:`ShardedSearch`.
+        On Server or DC, the pages are fetched in parallel from their
+        ``startAt`` offsets. With a single worker, it is the same as
+        ``iter_pages``. The pages are not yielded in the order of the JQL.
+
+        .. code-block:: python
+
+           from jiraone import LOGIN
+
+           # previous login statement
+           for page in LOGIN.iter_shards("project = IT", workers=4):
+               print(len(page["issues"]))
+
+        :param jql: A valid JQL query
+
+        :param kwargs: Keyword arguments of :class:`ShardedSearch` e.g.
+                       ``shard_size`` and ``workers``, any other argument is
+                       passed to :class:`SearchPager`. ``workers`` defaults
+                       to ``search_workers``.
+
+        .. versionadded:: 0.9.5
+
+        :return: A ShardedSearch or SearchPager object
+        """
+        workers = kwargs.pop("workers", None) or self.search_workers
+        shard_size = kwargs.pop("shard_size", 5000)
+        if self.api is True and workers > 1:
+            return ShardedSearch(
+                self, jql, shard_size=shard_size, workers=workers, **kwargs
+            )
+        return SearchPager(self, jql, workers=workers, **kwargs)
+
+    def iter_bulk_issues(
+        self,
+        issues: Iterable[Union[str, int]],
+        *,
+        fields: Optional[List[str]] = None,
+        expand: Optional[str] = None,
+        batch_size: int = 100,
+        workers: Optional[int] = None,
+        with_keys: bool = False,
+    ) -> Iterable[Union[dict, tuple]]:
+        """
+        Yields many issues by their keys or ids, instead of requesting
+        them one at a time.
+
+        The keys are grouped in batches of ``batch_size`` as they are read
+        from ``issues``, and the batches are requested concurrently. On
+        Jira Cloud, each batch is one request to the bulk fetch endpoint,
+        see ``endpoint.bulk_fetch_issues``. Server or DC has no such
+        endpoint, so the issues of a batch are requested one by one. The
+        issues are yielded in the order of ``issues``, any issue which
+        cannot be read is logged and left out. An issue moved to another
+        project is returned with its new key, use ``with_keys`` to match
+        it with the key it was requested by.
+
+        .. code-block:: python
+
+           from jiraone import LOGIN
+
+           # previous login statement
+           for issue in LOGIN.iter_bulk_issues(
+               ["IT-1", "IT-2"], fields=["summary", "attachment"]
+           ):
+               print(issue["key"], issue["fields"]["summary"])
+
+        :param issues: An iterable of issue keys or ids
+
+        :param fields: The fields to return for each issue, all the
+                       navigable fields are returned by default
+
+        :param expand: A comma separated string of properties to expand
+
+        :param batch_size: The number of issues per request, at most 100
+
+        :param workers: The number of batches requested at once, defaults
+                        to ``search_workers`` or 4, whichever is larger
+
+        :param with_keys: If True, a tuple of the key or id requested and
+                          its issue is yielded instead of the issue
+
+        .. versionadded:: 0.9.5
+
+        :return: An iterator of issues or tuples
+        """
+        from jiraone.utils import BoundedExecutor
+
+        def batches() -> Iterable[list]:
+            """Groups the issues as they are read."""
+            batch = []
+            for issue in issues:
+                batch.append(str(issue))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        def fetch(batch: list) -> list:
+            """Requests a batch of issues and returns them in order, paired
+            with the key or id they were requested by."""
+            found = {}
+            if self.api is True:
+                payload = {"issueIdsOrKeys": batch}
+                if fields is not None:
+                    payload["fields"] = fields
+                if expand is not None:
+                    payload["expand"] = expand
+                response = self.post(endpoint.bulk_fetch_issues(), payload=payload)
+                if response.status_code >= 300:
+                    raise JiraOneErrors(
+                        "value",
+                        "Unable to fetch {} issues, status code {}".format(
+                            len(batch), response.status_code
+                        ),
+                    )
+                data = response.json()
+                failed = set()
+                for error in data.get("issueErrors") or []:
+                    failed.add(str(error.get("issueIdOrKey")))
+                    add_log(
+                        "Unable to fetch issue {}: {}".format(
+                            error.get("issueIdOrKey"),
+                            error.get("errorMessages"),
+                        ),
+                        "error",
+                    )
+                by_name = {}
+                for issue in data.get("issues") or []:
+                    by_name[str(issue.get("key"))] = issue
+                    by_name[str(issue.get("id"))] = issue
+                for key in batch:
+                    if key in by_name:
+                        found[key] = by_name[key]
+                    elif key not in failed:
+                        # the key of an issue moved to another project is
+                        # resolved to its id, which the response holds.
+                        response = self.get(
+                            endpoint.issues(key, query="fields=key")
+                        )
+                        if response.status_code < 300:
+                            issue_id = str(response.json().get("id"))
+                            if issue_id in by_name:
+                                found[key] = by_name[issue_id]
+            else:
+                query = "&".join(
+                    option
+                    for option in (
+                        f"fields={','.join(fields)}" if fields else None,
+                        f"expand={expand}" if expand else None,
+                    )
+                    if option
+                )
+                for key in batch:
+                    response = self.get(
+                        endpoint.issues(key, query=query or None)
+                    )
+                    if response.status_code < 300:
+                        found[key] = response.json()
+                    else:
+                        add_log(
+                            "Unable to fetch issue {} due to {}".format(
+                                key, response.reason
+                            ),
+                            "error",
+                        )
+            return [(key, found[key]) for key in batch if key in found]
+
+        with BoundedExecutor(
+            workers=workers or max(self.search_workers, 4),
+            name="jiraone-issues",
+        ) as pool:
+            for found in pool.map(fetch, batches()):
+                for key, issue in found:
+                    yield (key, issue) if with_keys is True else issue
+
+    def iter_changelogs(
+        self,
+        issue_ids: Iterable[Union[str, int]],
+        *,
+        field_ids: Optional[List[str]] = None,
+        batch_size: int = 1000,
+    ) -> Iterable[tuple]:
+        """
+        Yields the change histories of many issues using the bulk
+        changelog endpoint of Jira Cloud, see ``endpoint.bulk_changelog``.
+
+        The issue ids are sent in batches of up to ``batch_size`` and every
+        page of a batch is read before its issues are yielded, so the
+        histories of an issue are complete and in order. Issues without any
+        change are yielded with an empty list.
+
+        .. code-block:: python
+
+           from jiraone import LOGIN
+
+           # previous login statement
+           for issue_id, histories in LOGIN.iter_changelogs(
+               ["10000", "10001"], field_ids=["status"]
+           ):
+               print(issue_id, len(histories))
+
+        :param issue_ids: An iterable of issue ids, in the order they are
+                          yielded
+
+        :param field_ids: Only return the changes of these fields, at most
+                          10 field ids are accepted
+
+        :param batch_size: The number of issues sent per request, at most
+                           1000
+
+        .. versionadded:: 0.9.5
+
+        :return: An iterator of ``(issue_id, histories)`` tuples
+        """
+        batch = []
+
+        def bulk_fetch() -> Iterable[tuple]:
+            """Reads every page of a batch of issues."""
+            ids = [str(issue_id) for issue_id in batch]
+            histories = {issue_id: [] for issue_id in ids}
+            payload = {"issueIdsOrKeys": ids, "maxResults": 1000}
+            if field_ids:
+                payload["fieldIds"] = field_ids
+            while True:
+                response = self.post(endpoint.bulk_changelog(), payload=payload)
+                if response.status_code >= 300:
+                    add_log(
+                        "The bulk changelog request returned a "
+                        '"{}" error with reason "{}".'.format(
+                            response.status_code, response.reason
+                        ),
+                        "error",
+                    )
+                    raise JiraOneErrors(
+                        "value",
+                        "Unable to fetch the changelog of {} issues, "
+                        "status code {}".format(
+                            len(batch), response.status_code
+                        ),
+                    )
+                page = response.json()
+                for change_log in page.get("issueChangeLogs") or []:
+                    histories.setdefault(
+                        str(change_log.get("issueId")), []
+                    ).extend(change_log.get("changeHistories") or [])
+                if not page.get("nextPageToken"):
+                    break
+                payload["nextPageToken"] = page["nextPageToken"]
+            return [(issue_id, histories[issue_id]) for issue_id in ids]
+
+        for issue_id in issue_ids:
+            batch.append(issue_id)
+            if len(batch) >= batch_size:
+                yield from bulk_fetch()
+                batch = []
+        if batch:
+            yield from bulk_fetch()
+
+    @staticmethod
+    def from_jira(obj: Any) -> Any:
+        """Performs a login initialization from a ``JIRA`` object.
+        The authentication, looks into basic auth from
+        the ``jira`` python package. It returns the same JIRA object
+        after authentication happens, so you can easily access all
+        the authenticated instances of both ``jira`` and ``jiraone``
+        packages.
+
+        Example 1::
+
+         from jira import JIRA
+         from jiraone import LOGIN, endpoint
+
+         my_jira = JIRA(server="https://nexusfive.atlassian.net",
+                 basic_auth=("prince@example.com",
+                 "MXKSlsXXXXX"))
+         LOGIN.from_jira(my_jira)
+         print(LOGIN.get(endpoint.myself()))
+         # response
+         # <Response [200]>
+
+
+        You can assign a variable to the jiraone :meth:`LOGIN.from_jira`
+        and continue to use both ``jira`` and ``jiraone`` packages
+        simultaneously.
+
+        Example 2::
+
+         from jira import JIRA
+         from jiraone import LOGIN, PROJECT
+
+         jiras = JIRA(server="https://nexusfive.atlassian.net",
+                 basic_auth=("prince@example.com",
+                 "MXKSlsXXXXX"))
+         my_jira = LOGIN.from_jira(jiras)
+         # Making a request to JIRA's methods
+         print(my_jira.myself())
+         # response
+         # {'self': 'https://example.atlassian.net/rest/api/2/user?
+         #            accountId=557058:xxx',
+         #           'accountId': '557058:xxx'}
+         # Making a request to jiraone's methods
+         jql = "project = CT ORDER BY Created DESC"
+         print(PROJECT.issue_count(jql))
+         # response
+         # {'count': 18230, 'max_page': 18}
+
+        :param obj: A call to a ``JIRA`` Interface
+
+        :return: JIRA object
+        """
+        try:
+            if hasattr(obj, "_session"):
+                if obj._session.auth:
+                    auth = {
+                        "user": obj._session.auth[0],
+                        "password": obj._session.auth[1],
+                        "url": obj._options["server"],
+                    }
+                    LOGIN(**auth)
+                    return obj
+                else:
+                    sys.exit(
+                        "Unable to read other values within the ``JIRA``"
+                        " object. Authentication cannot proceed further."
+                    )
+            else:
+                sys.exit(
+                    "Could not detect a `JIRA` object from the command."
+                    " Please check that you have the `jira` python package "
+                    "installed."
+                )
+        except Exception as err:
+            raise JiraOneErrors(
+                "wrong",
+                "An unknown exception has occurred " "Other errors: " f" {err}.",
+            ) from err
+
+
+class Echo(PrettyPrinter):
+    """A Class used to inherit from PrettyPrinter."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Inherit from the parent.
+
+        :param args: positional arguments
+
+        :param kwargs: additional arguments
+
+        :return: None
+        """
+        super().__init__(*args, **kwargs)
+
+    def __call__(self, *args, **kwargs):
+        """Makes our class callable."""
+        return self.__init__(*args, **kwargs)
+
+    def echo(self, raw: Any):
+        """
+        Prints the formatted representation of object on stream,
+        followed by a newline.
+
+        :param raw: Any object data
+
+        :return: None
+        """
+        return self.pprint(object=raw)
+
+
+class InitProcess(Credentials):
+    """should inherit an instance of Credential class using super().
+
+    Object values are entered directly when called because of the __call__
+    dunder method."""
+
+    def __init__(
+        self, user=None, password=None, url=None, oauth=None, session=None
+    ) -> None:
+        """
+        A Call to the Credential Class.
+
+        .. versionadded:: 0.6.2
+
+        oauth argument added to support OAuth 2.0
+
+        session argument added to create a session context
+
+        :param user: A username or email address
+
+        :param password: A password or user API token
+
+        :param url: A valid URL
+
+        :param oauth: An oAuth session
+
+        :param session: Creates a context session
+
+        :return: None
+        """
+        super().__init__(
+            user=user, password=password, url=url, oauth=oauth, session=session
+        )
+
+    def __call__(self, *args, **kwargs):
+        """Help to make our class callable."""
+        return self.__init__(*args, **kwargs)
+
+
+LOGIN = InitProcess()
+
+
+class AsyncCredentials:
+    """class.AsyncCredentials -> an ``asyncio`` counterpart of the
+    :class:`Credentials` class, used to send many requests concurrently
+    on a single event loop.
+
+    The ``endpoint`` URL builders read ``LOGIN.base_url`` and
+    ``LOGIN.api``, so both attributes are shared with ``LOGIN``.
+
+    .. versionadded:: 0.9.5
+
+    .. note::
+
+     The asynchronous client requires the ``aiohttp`` package,
+     which can be installed with ``pip install jiraone[async]``
+    """
+
+    auth_request = None
+    headers = None
+    max_concurrency = 100
+    limit_per_host = 0
+
+    def __init__(
+        self,
+        user: str = None,
+        password: str = None,
+        url: str = None,
+        oauth: dict = None,
+        session: Any = None,
+        max_concurrency: int = None,
+    ) -> None:
+        """
+        Instantiate the asynchronous login.
+
+        .. code-block:: python
+
+           import asyncio
+           from jiraone import ALOGIN, endpoint
+
+           ALOGIN(user="email", password="token",
+                  url="https://yourinstance.atlassian.net")
+
+           async def main():
+               async with ALOGIN:
+                   keys = ["IP-1", "IP-2", "IP-3"]
+                   responses = await ALOGIN.fetch_all(
+                       [endpoint.issues(key) for key in keys])
+                   print(responses)
+                   # [<Response [200]>, <Response [200]>, <Response [200]>]
+
+           asyncio.run(main())
+
+        :param user:  A username or email address
+
+        :param password:  A user password or API token
+
+        :param url: A server url or cloud instance url
+
+        :param oauth: An OAuth authentication request, the handshake is
+                      performed by ``LOGIN`` and its token is reused.
+
+        :param session: An ``aiohttp.ClientSession`` to use, if not
+                        supplied one is created on the first request.
+
+        :param max_concurrency: The maximum number of requests in flight
+                                at the same time. Defaults to 100
+
+        :return: None
+        """
+        self.__check_session__()
+        self.user = user
+        self.password = password
+        self.oauth = oauth
+        self.session = session
+        self._own_session = False
+        self._semaphore = None
+        if url is not None:
+            self.base_url = url
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+
+        if self.user is not None and self.password is not None:
+            self.token_session(self.user, self.password)
+        elif oauth is not None:
+            LOGIN.oauth_session(oauth)
+            self.from_login(LOGIN)
+
+    @property
+    def base_url(self) -> str:
+        """The base URL shared with ``LOGIN``."""
+        return LOGIN.base_url
+
+    @base_url.setter
+    def base_url(self, url: str) -> None:
+        """Sets the base URL of ``LOGIN``."""
+        LOGIN.base_url = url
+
+    @property
+    def api(self) -> bool:
+        """The API version switch shared with ``LOGIN``."""
+        return LOGIN.api
+
+    @api.setter
+    def api(self, value: bool) -> None:
+        """Sets the API version switch of ``LOGIN``."""
+        LOGIN.api = value
+
+    def token_session(
+        self,
+        email: str = None,
+        token: str = None,
+        sess: str = None,
+        _type: str = "Bearer",
+    ) -> None:
+        """
+        A session initializer to the asynchronous HTTP request.
+        Works the same way as ``LOGIN.token_session``.
+
+        :param email: An email address or username
+
+        :param token: An API token or user password
+
+        :param sess: Triggers an Authorization bearer session
+
+        :param _type: An acceptable Authorization type
+                     e.g. Bearer or JWT or ...
+
+        :return: None
+        """
+        self.__check_session__()
+        if sess is None:
+            self.auth_request = (email, token)
+            self.headers = {"Content-Type": "application/json"}
+        else:
+            if self.base_url is None:
+                raise JiraOneErrors(
+                    "value",
+                    "Please include a connecting "
+                    "base URL by declaring "
+                    " ALOGIN.base_url "
+                    '= "https://yourinstance.atlassian.net"',
+                )
+            self.auth_request = None
+            self.headers = {
+                "Content-Type": "application/json",
+                "Authorization": "{} {}".format(_type, sess),
+            }
+
+    def from_login(self, login: Any = None) -> None:
+        """Reuses the authentication of a synchronous login.
+
+        .. code-block:: python
+
+           from jiraone import LOGIN, ALOGIN
+
+           # previous login expression
+           ALOGIN.from_login(LOGIN)
+
+        :param login: A ``Credentials`` object, defaults to ``LOGIN``
+
+        :return: None
+        """
+        self.__check_session__()
+        login = LOGIN if login is None else login
+        auth = login.auth_request
+        self.auth_request = (
+            (auth.username, auth.password) if auth is not None else None
+        )
+        self.headers = (
+            dict(login.headers) if login.headers is not None else None
+        )
+
+    def __check_session__(self) -> None:
+        """Refuses to change the login while the ``aiohttp`` session
+        created for the previous one is open, as that session keeps the
+        previous authentication and would never be closed."""
+        session = getattr(self, "session", None)
+        if (
+            getattr(self, "_own_session", False)
+            and session is not None
+            and not session.closed
+        ):
+            raise JiraOneErrors(
+                "wrong",
+                "The asynchronous session of the previous login is still "
+                "open, close it with `await ALOGIN.close()` or leave the "
+                "`async with ALOGIN` block before logging in again.",
+            )
+
+    def __client__(self) -> Any:
+        """Returns the ``aiohttp`` session, created on first use within
+        the running event loop."""
+        try:
+            import aiohttp
+        except ImportError as err:
+            raise JiraOneErrors(
+                "wrong",
+                "The asynchronous client requires the `aiohttp` package. "
+                "Install it with `pip install jiraone[async]`.",
+            ) from err
+
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.limit_per_host,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                auth=aiohttp.BasicAuth(*self.auth_request)
+                if self.auth_request is not None
+                else None,
+            )
+            self._own_session = True
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.session
+
+    async def request(self, method: str, url: str, **kwargs) -> requests.Response:
         """
-        A get request to HTTP request.
+        Sends an asynchronous HTTP request, bounded by ``max_concurrency``.
+        The request goes through ``LOGIN.rate_limiter``, so the rate is
+        shared with the synchronous requests made by ``LOGIN``.
 
-        :param url: A valid URL
+        The body is read before the connection is released, and a
+        ``requests.Response`` object is returned, so the result can be
+        used the same way as one from ``LOGIN``.
 
-        :param args: Additional arguments if any
+        :param method: The HTTP method type e.g. GET, PUT, PATCH, DELETE etc
 
-        :param payload: A JSON data representation
+        :param url: A valid URL
 
-        :param kwargs: Additional keyword arguments to ``requests`` module
+        :param kwargs: Additional keyword arguments to ``aiohttp``
 
         :return: An HTTP response
         """
-        response = requests.get(
-            url,
-            *args,
-            auth=self.auth_request,
-            json=payload,
-            headers=self.headers,
-            **kwargs,
-        )
-        return response
+        from requests.structures import CaseInsensitiveDict
 
-    def post(
-        self, url: str, *args: Any, payload: dict = None, **kwargs
+        client = self.__client__()
+        headers = dict(self.headers or {})
+        headers.update(kwargs.pop("headers", None) or {})
+        if "verify" in kwargs:
+            kwargs["ssl"] = kwargs.pop("verify")
+        limiter = LOGIN.rate_limiter
+        attempt = 0
+        while True:
+            if limiter is not None:
+                wait = limiter.reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            async with self._semaphore:
+                async with client.request(
+                    method, url, headers=headers, **kwargs
+                ) as resp:
+                    body = await resp.read()
+            response = requests.Response()
+            response.status_code = resp.status
+            response.reason = resp.reason
+            response.headers = CaseInsensitiveDict(resp.headers)
+            response.url = str(resp.url)
+            response.encoding = resp.charset
+            response._content = body
+            if limiter is None:
+                return response
+            limiter.update(response)
+            if (
+                not LOGIN.__retry__(method, response)
+                or attempt >= LOGIN.max_retries
+            ):
+                return response
+            await asyncio.sleep(limiter.backoff(attempt, response))
+            attempt += 1
+
+    async def get(
+        self, url: str, *args, payload: dict = None, **kwargs
     ) -> requests.Response:
         """
-        A post  request to HTTP request.
+        An asynchronous get request to HTTP request.
 
         :param url: A valid URL
 
-        :param args: Additional arguments if any
+        :param args: Query parameters, if any
 
         :param payload: A JSON data representation
 
-        :param kwargs: Additional keyword arguments to ``requests`` module
-
+        :param kwargs: Additional keyword arguments to ``aiohttp``
 
         :return: An HTTP response
         """
-        response = requests.post(
-            url,
-            *args,
-            auth=self.auth_request,
-            json=payload,
-            headers=self.headers,
-            **kwargs,
-        )
-        return response
+        if args:
+            kwargs["params"] = args[0]
+        return await self.request("GET", url, json=payload, **kwargs)
 
-    def put(self, url: str, *args, payload: dict = None, **kwargs) -> requests.Response:
+    async def post(
+        self, url: str, *args: Any, payload: dict = None, **kwargs
+    ) -> requests.Response:
         """
-        A put request to HTTP request.
+        An asynchronous post request to HTTP request.
 
         :param url: A valid URL
 
-        :param args: Additional arguments if any
+        :param args: Form data, if any
 
         :param payload: A JSON data representation
 
-        :param kwargs: Additional keyword arguments to ``requests`` module
+        :param kwargs: Additional keyword arguments to ``aiohttp``
 
         :return: An HTTP response
         """
-        response = requests.put(
-            url,
-            *args,
-            auth=self.auth_request,
-            json=payload,
-            headers=self.headers,
-            **kwargs,
-        )
-        return response
+        if args:
+            kwargs["data"] = args[0]
+        return await self.request("POST", url, json=payload, **kwargs)
 
-    def delete(self, url: str, **kwargs) -> requests.Response:
+    async def put(
+        self, url: str, *args, payload: dict = None, **kwargs
+    ) -> requests.Response:
         """
-        A delete request to HTTP request.
+        An asynchronous put request to HTTP request.
 
         :param url: A valid URL
 
-        :param kwargs: Additional keyword arguments to ``requests`` module
+        :param args: Form data, if any
+
+        :param payload: A JSON data representation
+
+        :param kwargs: Additional keyword arguments to ``aiohttp``
 
         :return: An HTTP response
         """
-        response = requests.delete(
-            url, auth=self.auth_request, headers=self.headers, **kwargs
-        )
-        return response
+        if args:
+            kwargs["data"] = args[0]
+        return await self.request("PUT", url, json=payload, **kwargs)
 
-    def custom_method(self, *args, **kwargs) -> requests.Response:
+    async def delete(self, url: str, **kwargs) -> requests.Response:
         """
-        A custom request to HTTP request.
-
-        .. code-block:: python
-
-           import jiraone
-           # previous login expression
-           req = jiraone.LOGIN.custom_method('GET', 'https://nexusfive.atlassian.net')
-           print(req)
-           # <Response [200]>
-
-        :param args: The HTTP method type e.g. PUT, PATCH, DELETE etc
-
-                    Also, includes the URL that needs to be queried.
-
-        :param kwargs: Additional keyword arguments to ``requests`` module
+        An asynchronous delete request to HTTP request.
 
-                     For example::
+        :param url: A valid URL
 
-                       json={"file": content}
-                       data={"file": content}
+        :param kwargs: Additional keyword arguments to ``aiohttp``
 
         :return: An HTTP response
         """
-        response = requests.request(
-            *args, auth=self.auth_request, headers=self.headers, **kwargs
-        )
-        return response
-
-    @staticmethod
-    def from_jira(obj: Any) -> Any:
-        """Performs a login initialization from a ``JIRA`` object.
-        The authentication, looks into basic auth from
-        the ``jira`` python package. It returns the same JIRA object
-        after authentication happens, so you can easily access all
-        the authenticated instances of both ``jira`` and ``jiraone``
-        packages.
-
-        Example 1::
-
-         from jira import JIRA
-         from jiraone import LOGIN, endpoint
-
-         my_jira = JIRA(server="https://nexusfive.atlassian.net",
-                 basic_auth=("prince@example.com",
-                 "MXKSlsXXXXX"))
-         LOGIN.from_jira(my_jira)
-         print(LOGIN.get(endpoint.myself()))
-         # response
-         # <Response [200]>
-
-
-        You can assign a variable to the jiraone :meth:`LOGIN.from_jira`
-        and continue to use both ``jira`` and ``jiraone`` packages
-        simultaneously.
-
-        Example 2::
-
-         from jira import JIRA
-         from jiraone import LOGIN, PROJECT
-
-         jiras = JIRA(server="https://nexusfive.atlassian.net",
-                 basic_auth=("prince@example.com",
-                 "MXKSlsXXXXX"))
-         my_jira = LOGIN.from_jira(jiras)
-         # Making a request to JIRA's methods
-         print(my_jira.myself())
-         # response
-         # {'self': 'https://example.atlassian.net/rest/api/2/user?
-         #            accountId=557058:xxx',
-         #           'accountId': '557058:xxx'}
-         # Making a request to jiraone's methods
-         jql = "project = CT ORDER BY Created DESC"
-         print(PROJECT.issue_count(jql))
-         # response
-         # {'count': 18230, 'max_page': 18}
-
-        :param obj: A call to a ``JIRA`` Interface
+        return await self.request("DELETE", url, **kwargs)
 
-        :return: JIRA object
+    async def custom_method(self, *args, **kwargs) -> requests.Response:
         """
-        try:
-            if hasattr(obj, "_session"):
-                if obj._session.auth:
-                    auth = {
-                        "user": obj._session.auth[0],
-                        "password": obj._session.auth[1],
-                        "url": obj._options["server"],
-                    }
-                    LOGIN(**auth)
-                    return obj
-                else:
-                    sys.exit(
-                        "Unable to read other values within the ``JIRA``"
-                        " object. Authentication cannot proceed further."
-                    )
-            else:
-                sys.exit(
-                    "Could not detect a `JIRA` object from the command."
-                    " Please check that you have the `jira` python package "
-                    "installed."
-                )
-        except Exception as err:
-            raise JiraOneErrors(
-                "wrong",
-                "An unknown exception has occurred " "Other errors: " f" {err}.",
-            ) from err
+        An asynchronous custom request to HTTP request.
 
+        :param args: The HTTP method type e.g. PUT, PATCH, DELETE etc
+                     and the URL that needs to be queried.
 
-class Echo(PrettyPrinter):
-    """A Class used to inherit from PrettyPrinter."""
+        :param kwargs: Additional keyword arguments to ``aiohttp``
 
-    def __init__(self, *args, **kwargs) -> None:
+        :return: An HTTP response
         """
-        Inherit from the parent.
+        return await self.request(*args, **kwargs)
 
-        :param args: positional arguments
+    async def fetch_all(
+        self, urls: Iterable, method: str = "GET", **kwargs
+    ) -> List[requests.Response]:
+        """
+        Sends a request to every URL concurrently and returns the
+        responses in the same order as the URLs.
 
-        :param kwargs: additional arguments
+        :param urls: An iterable of valid URLs
 
-        :return: None
-        """
-        super().__init__(*args, **kwargs)
+        :param method: The HTTP method type, defaults to GET
 
-    def __call__(self, *args, **kwargs):
-        """Makes our class callable."""
-        return self.__init__(*args, **kwargs)
+        :param kwargs: Additional keyword arguments to ``aiohttp``
 
-    def echo(self, raw: Any):
+        :return: A list of HTTP responses
         """
-        Prints the formatted representation of object on stream,
-        followed by a newline.
+        return list(
+            await asyncio.gather(
+                *(self.request(method, url, **kwargs) for url in urls)
+            )
+        )
 
-        :param raw: Any object data
+    async def close(self) -> None:
+        """Closes the ``aiohttp`` session and its connections.
 
         :return: None
         """
-        return self.pprint(object=raw)
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self._semaphore = None
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
 
-class InitProcess(Credentials):
-    """should inherit an instance of Credential class using super().
+
+class AsyncInitProcess(AsyncCredentials):
+    """should inherit an instance of AsyncCredentials class using super().
 
     Object values are entered directly when called because of the __call__
     dunder method."""
 
     def __init__(
-        self, user=None, password=None, url=None, oauth=None, session=None
+        self,
+        user=None,
+        password=None,
+        url=None,
+        oauth=None,
+        session=None,
+        max_concurrency=None,
     ) -> None:
         """
-        A Call to the Credential Class.
-
-        .. versionadded:: 0.6.2
-
-        oauth argument added to support OAuth 2.0
-
-        session argument added to create a session context
+        A Call to the AsyncCredentials Class.
 
         :param user: A username or email address
 
@@ -643,12 +2608,19 @@ class InitProcess(Credentials):
 
         :param oauth: An oAuth session
 
-        :param session: Creates a context session
+        :param session: An ``aiohttp.ClientSession``
+
+        :param max_concurrency: The maximum number of requests in flight
 
         :return: None
         """
         super().__init__(
-            user=user, password=password, url=url, oauth=oauth, session=session
+            user=user,
+            password=password,
+            url=url,
+            oauth=oauth,
+            session=session,
+            max_concurrency=max_concurrency,
         )
 
     def __call__(self, *args, **kwargs):
@@ -656,7 +2628,7 @@ class InitProcess(Credentials):
         return self.__init__(*args, **kwargs)
 
 
-LOGIN = InitProcess()
+ALOGIN = AsyncInitProcess()
 
 
 class EndPoints:
@@ -1370,6 +3342,54 @@ class EndPoints:
         """
         return LOGIN.base_url + "/rest/api/3/search/approximate-count"
 
+    @classmethod
+    def bulk_changelog(cls) -> str:
+        """Returns a URL to fetch the changelogs of many issues at once.
+        This endpoint is only available on Jira Cloud.
+
+        :request POST: The endpoint requires that you send a POST request
+                      with a payload in the request body.
+
+                  :body param:
+
+                    * issueIdsOrKeys - A list of up to 1000 issue ids or keys
+
+                    * fieldIds - A list of up to 10 field ids, only the
+                      changes of these fields are returned
+
+                    * maxResults - The number of change histories per page
+
+                    * nextPageToken - The cursor of the next page
+
+        .. versionadded:: 0.9.5
+
+        :return: A string of the url
+        """
+        return LOGIN.base_url + "/rest/api/3/changelog/bulkfetch"
+
+    @classmethod
+    def bulk_fetch_issues(cls) -> str:
+        """Returns a URL to fetch many issues at once.
+        This endpoint is only available on Jira Cloud.
+
+        :request POST: The endpoint requires that you send a POST request
+                      with a payload in the request body.
+
+                  :body param:
+
+                    * issueIdsOrKeys - A list of up to 100 issue ids or keys
+
+                    * fields - A list of fields to return for each issue
+
+                    * expand - A comma separated string of the properties
+                      to expand e.g. "names,changelog"
+
+        .. versionadded:: 0.9.5
+
+        :return: A string of the url
+        """
+        return LOGIN.base_url + "/rest/api/3/issue/bulkfetch"
+
 
     @classmethod
     def search_for_filters(cls, query: Optional[str] = None, start_at: int = 0) -> str:
@@ -4121,6 +6141,11 @@ class Field:
          When using on Jira Server or DC, this method will return
          all fields.
 
+        .. versionchanged:: 0.9.5
+
+        The field is looked up in ``LOGIN.field_catalog`` instead of
+        paging through the fields on every call.
+
         :param find_field: A field name to search.
 
         :return: A dictionary if field is found else None
@@ -4130,41 +6155,28 @@ class Field:
             if find_field is not None
             else sys.exit("You must enter a field name")
         )
-        count_start_at = 0
-        while True:
-            load = (
-                LOGIN.get(
-                    endpoint.get_field(query="type=custom", start_at=count_start_at)
-                )
-                if LOGIN.api is True
-                else LOGIN.get(endpoint.get_field(system="all"))
-            )
-
-            if load.status_code < 300:
-                data = load.json().get("values") if LOGIN.api is True else load.json()
-                break_out = count_start_at > (
-                    load.json().get("total") if LOGIN.api is True else len(data)
-                )
-                for value in data:
-                    if value["name"] == fields:
-                        return {
-                            "id": value.get("id"),
-                            "name": value.get("name"),
-                            "customType": value.get("schema").get("custom"),
-                            "customId": value.get("schema").get("customId"),
-                            "type": value.get("schema").get("type"),
-                        }
-                count_start_at += 50
-                if break_out:
-                    break
-            else:
-                # if the request failed, quietly stop the loop
-                break
+        value = LOGIN.field_catalog.by_name(
+            fields, custom=True if LOGIN.api is True else None
+        )
+        if value is not None:
+            schema = value.get("schema") or {}
+            return {
+                "id": value.get("id"),
+                "name": value.get("name"),
+                "customType": schema.get("custom"),
+                "customId": schema.get("customId"),
+                "type": schema.get("type"),
+            }
 
     @staticmethod
     def get_field(find_field: str = None) -> Any:
         """Search for system fields or custom fields.
 
+        .. versionchanged:: 0.9.5
+
+        The field is looked up in ``LOGIN.field_catalog`` instead of
+        downloading every field on every call.
+
         :param find_field: A field name to search.
 
         :return: A dictionary if field is found else None
@@ -4174,41 +6186,37 @@ class Field:
             if find_field is not None
             else sys.exit("You must enter a field name")
         )
-        load = LOGIN.get(endpoint.get_field(system="type=system"))
-        if load.status_code < 300:
-            data = load.json()
-            for value in data:
-                if fields in value["name"]:
-                    if fields == value["name"]:
-                        if "schema" in value:
-                            if "customId" not in value["schema"]:
-                                return {
-                                    "name": value.get("name"),
-                                    "id": value.get("id"),
-                                    "custom": value.get("custom"),
-                                    "key": value.get("key"),
-                                    "searchable": value.get("searchable"),
-                                    "type": value.get("schema").get("type"),
-                                    "system": value.get("schema").get("system"),
-                                }
-                            return {
-                                "name": value.get("name"),
-                                "id": value.get("id"),
-                                "key": value.get("key"),
-                                "searchable": value.get("searchable"),
-                                "customType": value.get("schema").get("custom"),
-                                "customId": value.get("schema").get("customId"),
-                                "type": value.get("schema").get("type"),
-                                "custom": value.get("custom"),
-                            }
-                        if "schema" not in value["name"]:
-                            return {
-                                "name": value.get("name"),
-                                "id": value.get("id"),
-                                "key": value.get("key"),
-                                "searchable": value.get("searchable"),
-                                "custom": value.get("custom"),
-                            }
+        value = LOGIN.field_catalog.by_name(fields)
+        if value is None:
+            return None
+        if "schema" in value:
+            if "customId" not in value["schema"]:
+                return {
+                    "name": value.get("name"),
+                    "id": value.get("id"),
+                    "custom": value.get("custom"),
+                    "key": value.get("key"),
+                    "searchable": value.get("searchable"),
+                    "type": value.get("schema").get("type"),
+                    "system": value.get("schema").get("system"),
+                }
+            return {
+                "name": value.get("name"),
+                "id": value.get("id"),
+                "key": value.get("key"),
+                "searchable": value.get("searchable"),
+                "customType": value.get("schema").get("custom"),
+                "customId": value.get("schema").get("customId"),
+                "type": value.get("schema").get("type"),
+                "custom": value.get("custom"),
+            }
+        return {
+            "name": value.get("name"),
+            "id": value.get("id"),
+            "key": value.get("key"),
+            "searchable": value.get("searchable"),
+            "custom": value.get("custom"),
+        }
 
     def update_field_data(
         self,
@@ -4799,17 +6807,43 @@ class Field:
 
         return collect
 
-    def get_field_value(self, name: str, keys: Union[str, int]) -> Any:
+    def get_field_value(
+        self, name: str, keys: Union[str, int, List[Union[str, int]]]
+    ) -> Any:
         """Return the value of a field on an issue.
 
         :param name: The name of a field.
 
-        :param keys: The issue key or issue id of an issue.
+        :param keys: The issue key or issue id of an issue. A list of
+                     issue keys or ids fetches the issues in bulk and
+                     returns a dictionary of each issue key or id
+                     requested, as a string, to its value.
+
+        .. versionchanged:: 0.9.5
+
+        keys - accepts a list of issues, only the field is requested
 
         :return: Any datatype is returned
         """
         var = self.get_field(name)
-        get_value = LOGIN.get(endpoint.issues(keys)).json()
+        field_id = var.get("id") if isinstance(var, dict) else None
+        if isinstance(keys, (list, tuple)):
+            if field_id is None:
+                return (
+                    f"<Error: options: Most probably "
+                    f"the field '{name}' cannot be found >"
+                )
+            return {
+                key: issue["fields"].get(field_id)
+                for key, issue in LOGIN.iter_bulk_issues(
+                    keys, fields=[field_id], with_keys=True
+                )
+            }
+        get_value = LOGIN.get(
+            endpoint.issues(
+                keys, query=f"fields={field_id}" if field_id else None
+            )
+        ).json()
         try:
             if "errorMessages" in get_value:
                 return "It seems you don't have access to this issue {}".format(keys)
@@ -7,9 +7,9 @@ import os
 import re
 import json
 from typing import Union, Any, Optional, List, Callable, Dict
+from array import array
 from collections import namedtuple, deque
-from datetime import datetime as dt
-from itertools import zip_longest
+from datetime import datetime as dt, timedelta, timezone
 from copy import deepcopy
 from jiraone.exceptions import JiraOneErrors
 
@@ -98,6 +98,363 @@ def field_update(
     return output
 
 
+class StatusTransitions:
+    """A columnar store of status changes, used by ``time_in_status``.
+
+    Each change of a ``change_log`` file is kept in parallel columns, the
+    timestamps are parsed once into microseconds since the epoch and held
+    in ``array`` objects. The time spent in every status is then worked out
+    with one shifted difference over those columns, the rows of an issue
+    ending at the next change of the same issue or at ``now``. NumPy is used
+    for that difference when it is installed.
+
+    .. versionadded:: 0.9.5
+
+    .. code-block:: python
+
+      from jiraone import file_reader
+      from jiraone.module import StatusTransitions
+
+      frame = StatusTransitions.from_rows(
+          file_reader(folder="TimeStatus", file_name="time_status.csv",
+                      skip=True, stream=True), api=True)
+      durations = frame.durations()
+
+    """
+
+    epoch = dt(1970, 1, 1, tzinfo=timezone.utc)
+    microsecond = timedelta(microseconds=1)
+
+    def __init__(self) -> None:
+        self.keys = []
+        self.summaries = []
+        self.authors = []
+        self.from_strings = []
+        self.to_strings = []
+        self.field_types = []
+        self.issues = array("q")
+        self.starts = array("q")
+        self.start_offsets = array("l")
+        self.ends = array("q")
+        self.end_offsets = array("l")
+        self.zones = {}
+        self.now = None
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Any, api: bool = True, now: dt = None
+    ) -> "StatusTransitions":
+        """Load the rows of a ``change_log`` file.
+
+        :param rows: An iterable of rows, without the header
+
+        :param api: True if the file was written from Jira Cloud, which
+                    has three more columns than Server/DC
+
+        :param now: A datetime object where the current status of
+                    every issue ends. Defaults to the current time
+
+        :return: A ``StatusTransitions`` object
+        """
+        from jiraone.utils import DateFormat
+
+        frame = cls()
+        from_column, to_column = (8, 10) if api is True else (7, 9)
+        issue_codes = {}
+        keys, summaries, authors = frame.keys, frame.summaries, frame.authors
+        from_strings, to_strings = frame.from_strings, frame.to_strings
+        field_types, issues = frame.field_types, frame.issues
+        starts, start_offsets = frame.starts, frame.start_offsets
+        # the whole file is written in one format, so the parser is picked
+        # at the first row. ``fromisoformat`` reads ``+0000`` offsets from
+        # Python 3.11 only.
+        parse = None
+        epoch, microsecond, second = cls.epoch, cls.microsecond, timedelta(
+            seconds=1
+        )
+        offsets = {}
+        for row in rows:
+            if not row:
+                continue
+            if parse is None:
+                try:
+                    dt.fromisoformat(row[3])
+                    parse = dt.fromisoformat
+                except ValueError:
+
+                    def parse(value: str) -> dt:
+                        """Parse a ``+0000`` offset before Python 3.11"""
+                        return dt.strptime(
+                            value, DateFormat.YYYY_MM_dd_HH_MM_SS_MS_TZ
+                        )
+
+            created = parse(row[3])
+            utc_offset = created.utcoffset()
+            offset = offsets.get(utc_offset)
+            if offset is None:
+                offset = offsets[utc_offset] = utc_offset // second
+            keys.append(row[0])
+            summaries.append(row[1])
+            authors.append(row[2])
+            field_types.append(row[4])
+            from_strings.append(row[from_column])
+            to_strings.append(row[to_column])
+            issues.append(issue_codes.setdefault(row[0], len(issue_codes)))
+            starts.append((created - epoch) // microsecond)
+            start_offsets.append(offset)
+        frame.close(now)
+        return frame
+
+    def close(self, now: dt = None) -> None:
+        """Work out where every row ends, the next row of the same issue
+        or ``now`` for the last row of an issue.
+
+        :param now: A datetime object, defaults to the current time. A
+                    naive datetime is read as the local time
+
+        :return: None
+        """
+        now = dt.now() if now is None else now
+        if now.tzinfo is None:
+            now = now.astimezone()
+        self.now = now
+        current = (now - self.epoch) // self.microsecond
+        current_offset = now.utcoffset() // timedelta(seconds=1)
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if np is not None and len(self.starts) > 1:
+            issues = np.frombuffer(self.issues, dtype=np.int64)
+            same = issues[1:] == issues[:-1]
+            starts = np.frombuffer(self.starts, dtype=np.int64)
+            offsets = np.frombuffer(self.start_offsets, dtype=self.offset_type)
+            ends = np.full(len(starts), current, dtype=np.int64)
+            end_offsets = np.full(
+                len(starts), current_offset, dtype=self.offset_type
+            )
+            ends[:-1][same] = starts[1:][same]
+            end_offsets[:-1][same] = offsets[1:][same]
+            self.ends = array("q", ends.tobytes())
+            self.end_offsets = array("l", end_offsets.tobytes())
+        else:
+            issues, starts, offsets = (
+                self.issues,
+                self.starts,
+                self.start_offsets,
+            )
+            ends, end_offsets = array("q"), array("l")
+            for issue, next_issue, start, offset in zip(
+                issues, issues[1:], starts[1:], offsets[1:]
+            ):
+                same = issue == next_issue
+                ends.append(start if same else current)
+                end_offsets.append(offset if same else current_offset)
+            if len(starts) > 0:
+                ends.append(current)
+                end_offsets.append(current_offset)
+            self.ends, self.end_offsets = ends, end_offsets
+
+    @property
+    def offset_type(self) -> str:
+        """The NumPy type of the ``array("l")`` offset columns."""
+        return "int64" if array("l").itemsize == 8 else "int32"
+
+    def durations(self, calendar: Any = None) -> array:
+        """Return the time spent in every row, in microseconds.
+
+        :param calendar: A ``WorkCalendar``, only the working time of
+                         every row is counted when given
+
+        :return: An array of integers
+        """
+        if calendar is not None:
+            return calendar.durations(self.starts, self.ends)
+        try:
+            import numpy as np
+        except ImportError:
+            return array(
+                "q",
+                [end - start for start, end in zip(self.starts, self.ends)],
+            )
+        return array(
+            "q",
+            (
+                np.frombuffer(self.ends, dtype=np.int64)
+                - np.frombuffer(self.starts, dtype=np.int64)
+            ).tobytes(),
+        )
+
+    def statuses(self) -> List[str]:
+        """Return the status of every row, the status the issue was in
+        during the time of the row.
+
+        :return: A list of status names
+        """
+        return [
+            from_string if field_type == "" else to_string
+            for field_type, from_string, to_string in zip(
+                self.field_types, self.from_strings, self.to_strings
+            )
+        ]
+
+    def moment(self, value: int, offset: int) -> dt:
+        """Turn a stored timestamp back into an aware datetime object.
+
+        :param value: Microseconds since the epoch
+
+        :param offset: The UTC offset of the timestamp, in seconds
+
+        :return: A datetime object
+        """
+        zone = self.zones.get(offset)
+        if zone is None:
+            zone = self.zones[offset] = timezone(timedelta(seconds=offset))
+        return (self.epoch + timedelta(microseconds=value)).astimezone(zone)
+
+    def summary(
+        self,
+        intervals: dict = None,
+        percentiles: tuple = (50, 90, 99),
+        status: str = None,
+        calendar: Any = None,
+    ) -> dict:
+        """Aggregate the time in status of every issue in one pass.
+
+        The time spent in each status is added up per issue, and the time
+        between two sets of statuses is worked out for every interval.
+        The percentiles of both across issues are estimated with a
+        ``QuantileSketch`` each, so they take a constant amount of memory.
+        All the times are in seconds.
+
+        :param intervals: A dict of an interval name to a tuple of the
+                          statuses which start it and the statuses which
+                          end it. An interval starts when the issue first
+                          enters a start status, or when it is created if
+                          the start statuses are None, and ends when it
+                          next enters an end status.
+                          Defaults to ``cycleTime``, from "In Progress" to
+                          "Done" and ``leadTime``, from creation to "Done"
+
+        :param percentiles: The percentiles to estimate, between 0 and 100
+
+        :param status: Only aggregate the time spent in this status
+
+        :param calendar: A ``WorkCalendar``, only working time is counted
+                         when given
+
+        :return: A dict with the ``issues``, ``statuses`` and ``intervals``
+                 keys
+        """
+        from jiraone.utils import QuantileSketch
+
+        intervals = (
+            {
+                "cycleTime": (["In Progress"], ["Done"]),
+                "leadTime": (None, ["Done"]),
+            }
+            if intervals is None
+            else intervals
+        )
+        if not isinstance(intervals, dict) or not all(
+            isinstance(bounds, (tuple, list)) and len(bounds) == 2
+            for bounds in intervals.values()
+        ):
+            raise JiraOneErrors(
+                "value",
+                "The `intervals` argument expects a dict of names to a "
+                "tuple of start statuses and end statuses.",
+            )
+
+        def status_set(names: Any) -> Optional[set]:
+            """Return the lower case names of a status or statuses."""
+            if names is None:
+                return None
+            names = [names] if isinstance(names, str) else names
+            return {name.lower() for name in names}
+
+        bounds = [
+            (name, status_set(start), status_set(end))
+            for name, (start, end) in intervals.items()
+        ]
+        look_up = status.lower() if status is not None else None
+        status_sketches, issues = {}, []
+        interval_sketches = {name: QuantileSketch() for name in intervals}
+        durations, statuses = self.durations(calendar), self.statuses()
+        codes, starts = self.issues, self.starts
+        rows = len(self.starts)
+        row = 0
+        while row < rows:
+            # the rows of an issue are next to each other
+            first, code = row, codes[row]
+            totals, opened, closed = {}, {}, {}
+            while row < rows and codes[row] == code:
+                name = statuses[row]
+                lower = name.lower()
+                if look_up is None or lower == look_up:
+                    totals[name] = totals.get(name, 0) + durations[row]
+                for interval, start, end in bounds:
+                    if interval not in opened:
+                        if (start is None and row == first) or (
+                            start is not None and lower in start
+                        ):
+                            opened[interval] = starts[row]
+                    elif interval not in closed and lower in end:
+                        closed[interval] = starts[row]
+                row += 1
+
+            issue = {
+                "issueKey": self.keys[first],
+                "summary": self.summaries[first],
+                "timeInStatus": {
+                    name: total / 1000000 for name, total in totals.items()
+                },
+            }
+            for name, total in issue["timeInStatus"].items():
+                if name not in status_sketches:
+                    status_sketches[name] = QuantileSketch()
+                status_sketches[name].add(total)
+            for interval, _, _ in bounds:
+                issue[interval] = (
+                    (
+                        closed[interval] - opened[interval]
+                        if calendar is None
+                        else calendar.working(
+                            opened[interval], closed[interval]
+                        )
+                    )
+                    / 1000000
+                    if interval in closed
+                    else None
+                )
+                if issue[interval] is not None:
+                    interval_sketches[interval].add(issue[interval])
+            issues.append(issue)
+
+        def statistics(sketch: QuantileSketch) -> dict:
+            """Return the count, total and percentiles of a sketch."""
+            figures = {"issues": sketch.count, "total": sketch.total}
+            for percentile in percentiles:
+                figures[f"p{percentile:g}"] = sketch.quantile(percentile / 100)
+            return figures
+
+        return {
+            "issues": issues,
+            "statuses": {
+                name: statistics(sketch)
+                for name, sketch in status_sketches.items()
+            },
+            "intervals": {
+                name: statistics(sketch)
+                for name, sketch in interval_sketches.items()
+            },
+        }
+
+
 def time_in_status(
     # a variable to call the `PROJECT` alias of `jiraone.report.PROJECT`
     var: Any,
@@ -163,10 +520,45 @@ def time_in_status(
       echo(status)
 
 
+    .. versionchanged:: 0.9.5
+
+    The status changes are loaded into a ``StatusTransitions`` object, which
+    parses every timestamp once and works out the time in status of every
+    issue in one pass.
+
+    *Options added in 0.9.5*
+
+    * aggregate - Bool, writes one summary file with the total time per
+      issue and status, the ``intervals`` of every issue and the count,
+      total and ``percentiles`` of each status and interval across issues.
+      The times are in seconds unless ``pprint`` is a bool. ``status``
+      only limits the statuses added up. The summary is returned if
+      ``is_printable`` is true
+
+    * intervals - Dict, an interval name to a tuple of start statuses and
+      end statuses, see ``StatusTransitions.summary``. Defaults to
+      ``cycleTime`` from "In Progress" to "Done" and ``leadTime`` from
+      creation to "Done"
+
+    * percentiles - Tuple, the percentiles estimated in the summary.
+      Defaults to (50, 90, 99)
+
+    * calendar - A ``jiraone.utils.WorkCalendar``, measures the time in
+      status in working hours only, excluding weekends, holidays and the
+      hours outside the working periods of its timezone. A CSV output
+      needs ``pprint`` set to True or False, or ``aggregate``, as the
+      "timestamp" output only writes when the status ended. A JSON
+      output has the working time in ``diffTime``
+
+    .. code-block:: python
+
+      time_in_status(PROJECT, {"jql": "project = COM"}, file_reader,
+                     login=LOGIN, output_format="csv", aggregate=True,
+                     intervals={"review": (["In Review"], ["Done"])})
+
     :return: A Printable representation of the data or output files.
 
     """
-    from jiraone.utils import DateFormat
 
     login = kwargs["login"] if "login" in kwargs else False
     pprint = kwargs["pprint"] if "pprint" in kwargs else "timestamp"
@@ -187,6 +579,30 @@ def time_in_status(
             "You need to pass the `file_reader` function, "
             "so the data can be read.",
         )
+    from jiraone.utils import WorkCalendar
+
+    aggregate = kwargs.get("aggregate", False)
+    calendar = kwargs.get("calendar")
+    if calendar is not None and not isinstance(calendar, WorkCalendar):
+        raise JiraOneErrors(
+            "wrong",
+            "Expecting `calendar` argument to be a `WorkCalendar` "
+            "got {} instead".format(type(calendar)),
+        )
+    if (
+        calendar is not None
+        and aggregate is not True
+        and pprint == "timestamp"
+        and str(output_format).lower() == "csv"
+    ):
+        # the CSV output of a timestamp is the time the status ended,
+        # which the working hours do not change.
+        raise JiraOneErrors(
+            "wrong",
+            "The `calendar` argument needs `pprint` set to True or False "
+            "for a CSV output, the timestamp output has no duration.",
+        )
+
     determine = key_or_id
     form = "key {ins} {determine}"
     if "," in determine:
@@ -212,195 +628,173 @@ def time_in_status(
         fix=True,
         allow_cp=False,
     )
-    data_dog = (
-        namedtuple(
-            "data_dog",
-            [
-                "IssueKey",
-                "Summary",
-                "Author",
-                "created",
-                "FieldType",
-                "Field",
-                "From",
-                "fromString",
-                "To",
-                "toString",
-            ],
-        )
-        if login.api is False
-        else namedtuple(
-            "data_dog",
-            [
-                "IssueKey",
-                "Summary",
-                "Author",
-                "created",
-                "FieldType",
-                "Field",
-                "FieldId",
-                "From",
-                "fromString",
-                "To",
-                "toString",
-                "FromAccountId",
-                "ToAccountId",
-            ],
-        )
-    )
-
-    history = reader(folder=report_folder, file_name=report_file, skip=True)
-    log_data = deque()
-    collect_data = deque()
-    for histories in history:
-        items = data_dog._make(histories)
-        time_stat = {
-            "issue_key": items.IssueKey,
-            "created": items.created,
-            "from_string": items.fromString,
-            "summary": items.Summary,
-            "author": items.Author,
-            "to_string": items.toString,
-            "blank_data": items.FieldType,
-        }
-        log_data.append(time_stat)
-
-    # do the difference in time between two status
-    rows = 0
-    number_of_history_items = len(log_data)
-    history_copy = deepcopy(log_data)
-    if len(history_copy) > 0:
-        del history_copy[0]
-    else:
-        exit("No data to read.Quiting...")
-    for items, item in zip_longest(
-        log_data,
-        history_copy,
-        fillvalue={
-            "issue_key": 0,
-            "created": 0,
-            "author": 0,
-            "from_string": 0,
-            "to_string": 0,
-            "summary": 0,
-            "blank_data": 0,
-        },
-    ):
+    from jiraone.reporting import file_reader
+    from jiraone import file_writer, path_builder
 
-        def initialize(to_, from_) -> None:
-            """Rerun the data for time extraction.
+    intervals = kwargs.get("intervals")
+    percentiles = kwargs.get("percentiles", (50, 90, 99))
 
-            :param to_: A timedelta object showing the present or
-                       future datetime
+    def status_summary() -> Union[dict, str]:
+        """Write the aggregated time in status of the issues into one
+        summary file.
 
-            :param from_: A timedelta object showing the previous datetime
+        :return: The summary or the location of the summary file
+        """
+        if isinstance(pprint, str) and pprint != "timestamp":
+            raise JiraOneErrors(
+                "errors",
+                'Invalid option value specified '
+                'for "pprint" argument.',
+            )
+        summary = frame.summary(
+            intervals=intervals,
+            percentiles=percentiles,
+            status=status,
+            calendar=calendar,
+        )
+        names = list(summary["statuses"])
+        figures = ["issues", "total"] + [
+            f"p{percentile:g}" for percentile in percentiles
+        ]
 
-            :return: none
-            """
-            difference = to_ - from_
-            time_data = {"from": from_, "to": to_}
-            data_bundle = {
-                "time_status": pretty_format(
-                    difference,
-                    pprint,
-                    past_time=time_data,
-                    output_format=output_format,
-                ),
-                "issue_key": items["issue_key"],
-                "from_string": items["from_string"],
-                "to_string": items["to_string"],
-                "summary": items["summary"],
-                "author": items["author"],
-                "blank_data": items["blank_data"],
+        def show(seconds: Optional[float]) -> Any:
+            """Render a time in seconds with the ``pprint`` option, the
+            seconds are kept as a number unless ``pprint`` is a bool."""
+            if seconds is None:
+                return None
+            if isinstance(pprint, bool):
+                return pretty_format(timedelta(seconds=seconds), pprint)
+            return round(seconds, 3)
+
+        for issue in summary["issues"]:
+            issue["timeInStatus"] = {
+                name: show(total)
+                for name, total in issue["timeInStatus"].items()
             }
-            collect_data.append(data_bundle)
-
-        rows += 1
-        # for each row, check the next row if exist and if the key is the
-        # same as of the period the status changed
-        if items["issue_key"] == item["issue_key"]:
-            # parse the datetime string with a proper format
-            from_time = dt.strptime(
-                items["created"], DateFormat.YYYY_MM_dd_HH_MM_SS_MS_TZ)
-
-            to_time = dt.strptime(
-                item["created"], DateFormat.YYYY_MM_dd_HH_MM_SS_MS_TZ
+            for interval in summary["intervals"]:
+                issue[interval] = show(issue[interval])
+        for group in (summary["statuses"], summary["intervals"]):
+            for values in group.values():
+                for figure, value in values.items():
+                    values[figure] = value if figure == "issues" else show(
+                        value
+                    )
+
+        output_name = f"{output_filename}.{output_format.lower()}"
+        if output_format.lower() == "csv":
+            header = ["Issue Key", "Summary"] + names + list(
+                summary["intervals"]
             )
-            # get a timedelta of the datetime value
-            initialize(to_time, from_time)
-        else:
-            if items["from_string"] == items["to_string"]:
-                from_time = dt.strptime(
-                    items["created"], DateFormat.YYYY_MM_dd_HH_MM_SS_MS_TZ
-                )
-                # convert the current time to something we
-                # that we can use timedelta on
-                present = dt.strftime(
-                    dt.astimezone(
-                        dt.now()), DateFormat.YYYY_MM_dd_HH_MM_SS_MS_TZ
-                )
-                today = dt.strptime(
-                    present, DateFormat.YYYY_MM_dd_HH_MM_SS_MS_TZ)
-                initialize(today, from_time)
-            else:
-                # default here if this is the current status.
-                from_time = dt.strptime(
-                    items["created"], DateFormat.YYYY_MM_dd_HH_MM_SS_MS_TZ
-                )
-                present = dt.strftime(
-                    dt.astimezone(
-                        dt.now()), DateFormat.YYYY_MM_dd_HH_MM_SS_MS_TZ
+            blank = ""
+            rows = [
+                [issue["issueKey"], issue["summary"]]
+                + [issue["timeInStatus"].get(name, blank) for name in names]
+                + [
+                    blank if issue[interval] is None else issue[interval]
+                    for interval in summary["intervals"]
+                ]
+                for issue in summary["issues"]
+            ]
+            # the statistics of every column are added below the issues
+            for figure in figures:
+                rows.append(
+                    [figure.title() if figure in ("issues", "total")
+                     else figure, blank]
+                    + [
+                        blank
+                        if summary["statuses"][name][figure] is None
+                        else summary["statuses"][name][figure]
+                        for name in names
+                    ]
+                    + [
+                        blank
+                        if values[figure] is None
+                        else values[figure]
+                        for values in summary["intervals"].values()
+                    ]
                 )
-                today = dt.strptime(
-                    present, DateFormat.YYYY_MM_dd_HH_MM_SS_MS_TZ)
-                initialize(today, from_time)
-        if rows >= number_of_history_items:
-            break
-
-    data_collection = deque()
-
-    def matrix_loop(proxy, rev: bool = True) -> None:
-        """Repeat of ``if`` steps validating the status.
-
-        :param proxy: The name of the iterable data within the dict
-
-        :param rev: Changes context of dict value for proxy argument
-
-        :return: None
-        """
-        matrix = [
-            proxy["issue_key"],
-            proxy["summary"],
-            proxy["author"],
-            proxy["time_status"],
-            proxy["from_string" if proxy["blank_data"] == "" else "to_string"]
-            if rev is True
-            else proxy["to_string"],
-        ]
-        data_collection.append(matrix)
-
-    if status is not None:
-        if isinstance(status, str):
-            for name in collect_data:
-                if name["blank_data"] == "":
-                    if name["from_string"].lower() == status.lower():
-                        matrix_loop(name)
-                else:
-                    if name["to_string"].lower() == status.lower():
-                        matrix_loop(name)
-
+            file_writer(
+                folder=report_folder,
+                file_name=output_name,
+                mode="w+",
+                data=[header] + rows,
+                mark="many",
+            )
+        elif output_format.lower() == "json":
+            with open(
+                path_builder(report_folder, output_name),
+                mode="w+",
+                encoding="utf-8",
+            ) as summary_file:
+                json.dump(summary, summary_file, sort_keys=True, indent=4)
         else:
             raise JiraOneErrors(
-                "wrong",
-                "Expecting `status` argument to be a string value "
-                "got {} instead".format(type(status)),
+                "value",
+                f'Unexpected output "{output_format}" '
+                "received as value, "
+                "for output_format argument - unable to "
+                "understand option. Exiting",
             )
-    elif status is None:
-        for name in collect_data:
-            matrix_loop(name)
+        return (
+            f"Output file is located at: "
+            f"{path_builder(report_folder, output_name)}"
+            if is_printable is False
+            else summary
+        )
 
-    collect_data.clear()
-    from jiraone import file_writer, path_builder
+    if status is not None and not isinstance(status, str):
+        raise JiraOneErrors(
+            "wrong",
+            "Expecting `status` argument to be a string value "
+            "got {} instead".format(type(status)),
+        )
+    history = (
+        reader(
+            folder=report_folder, file_name=report_file, skip=True, stream=True
+        )
+        if reader is file_reader
+        else reader(folder=report_folder, file_name=report_file, skip=True)
+    )
+    frame = StatusTransitions.from_rows(history, api=login.api)
+    if len(frame) == 0:
+        exit("No data to read.Quiting...")
+    if aggregate is True:
+        return status_summary()
+
+    # the time in status of every row is the difference between the row and
+    # the next row of the same issue, or the current time for its last row
+    data_collection = deque()
+    look_up = status.lower() if status is not None else None
+    timestamp = pprint == "timestamp"
+    for row, (name, duration) in enumerate(
+        zip(frame.statuses(), frame.durations(calendar))
+    ):
+        if look_up is not None and name.lower() != look_up:
+            continue
+        time_data = (
+            {
+                "from": frame.moment(
+                    frame.starts[row], frame.start_offsets[row]
+                ),
+                "to": frame.moment(frame.ends[row], frame.end_offsets[row]),
+            }
+            if timestamp is True
+            else None
+        )
+        data_collection.append(
+            [
+                frame.keys[row],
+                frame.summaries[row],
+                frame.authors[row],
+                pretty_format(
+                    timedelta(microseconds=duration),
+                    pprint,
+                    past_time=time_data,
+                    output_format=output_format,
+                ),
+                name,
+            ]
+        )
 
     output_name = f"{output_filename}.{output_format.lower()}"
     if output_format is None:
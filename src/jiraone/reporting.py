@@ -14,6 +14,7 @@ from typing import (
     Any,
     List,
     Iterable,
+    Iterator,
     Tuple,
     Union,
     Dict,
@@ -89,11 +90,7 @@ class Projects:
         )
 
         def project():
-            file_writer(
-                project_folder,
-                project_file_name,
-                data=raw,
-            )
+            sink.writerow(raw)
             read_users = file_reader(
                 folder=project_folder,
                 file_name=file_name,
@@ -118,11 +115,7 @@ class Projects:
                         f"Project: {name}",
                         f"User Status: {active_status}",
                     ]
-                    file_writer(
-                        project_folder,
-                        project_file_name,
-                        data=raw_vision,
-                    )
+                    sink.writerow(raw_vision)
                 else:
                     for d in data:
                         d_name = d["displayName"]
@@ -133,12 +126,7 @@ class Projects:
                             f"Project: {name}",
                             f"User Status: {active_status}",
                         ]
-
-                        file_writer(
-                            project_folder,
-                            project_file_name,
-                            data=raw_vision,
-                        )
+                        sink.writerow(raw_vision)
 
         file_name = user_extraction_file
         USER.get_all_users(
@@ -151,77 +139,80 @@ class Projects:
             "Project User List Extracted",
             "info",
         )
-        while True:
-            load = LOGIN.get(
-                endpoint.get_projects(
-                    *args,
-                    start_at=count_start_at,
+        with CsvSink(project_folder, project_file_name) as sink:
+            while True:
+                load = LOGIN.get(
+                    endpoint.get_projects(
+                        *args,
+                        start_at=count_start_at,
+                    )
                 )
-            )
-            count_start_at += 50
-            if load.status_code == 200:
-                results = json.loads(load.content)
-                for key in results["values"]:
-                    keys = key["key"]
-                    name = key["name"]
-                    if "insight" in key:
-                        insight = key["insight"]
-                        if (
-                            "totalIssueCount"
-                            and "lastIssueUpdateTime" in insight
-                        ):
-                            raw = [
-                                keys,
-                                name,
-                                f"{insight['totalIssueCount']}",
-                                f"{insight['lastIssueUpdateTime']}",
-                            ]
-                            project()
-                        elif (
-                            "totalIssueCount" in insight
-                            and "lastIssueUpdateTime" not in insight
-                        ):
+                count_start_at += 50
+                if load.status_code == 200:
+                    results = json.loads(load.content)
+                    for key in results["values"]:
+                        keys = key["key"]
+                        name = key["name"]
+                        if "insight" in key:
+                            insight = key["insight"]
+                            if (
+                                "totalIssueCount"
+                                and "lastIssueUpdateTime" in insight
+                            ):
+                                raw = [
+                                    keys,
+                                    name,
+                                    f"{insight['totalIssueCount']}",
+                                    f"{insight['lastIssueUpdateTime']}",
+                                ]
+                                project()
+                            elif (
+                                "totalIssueCount" in insight
+                                and "lastIssueUpdateTime" not in insight
+                            ):
+                                raw = [
+                                    keys,
+                                    name,
+                                    f"{insight['totalIssueCount']}",
+                                    "No data available",
+                                ]
+                                project()
+                        else:
                             raw = [
                                 keys,
                                 name,
-                                f"{insight['totalIssueCount']}",
+                                "No data available",
                                 "No data available",
                             ]
                             project()
-                    else:
-                        raw = [
-                            keys,
-                            name,
-                            "No data available",
-                            "No data available",
-                        ]
-                        project()
 
-                if count_start_at > results["total"]:
-                    print("Project Reporting Completed")
-                    print(
-                        "File extraction completed. "
-                        "Your file is located at {}".format(
-                            path_builder(
-                                path=project_folder,
-                                file_name=project_file_name,
+                    if count_start_at > results["total"]:
+                        print("Project Reporting Completed")
+                        print(
+                            "File extraction completed. "
+                            "Your file is located at {}".format(
+                                path_builder(
+                                    path=project_folder,
+                                    file_name=project_file_name,
+                                )
                             )
                         )
+                        add_log(
+                            "Project Reporting Completed",
+                            "info",
+                        )
+                        break
+                else:
+                    sys.stderr.write(
+                        "Unable to fetch data status {} ".format(
+                            load.status_code
+                        )
                     )
                     add_log(
-                        "Project Reporting Completed",
-                        "info",
+                        f"Data retrieval failure " f"due to {load.reason}",
+                        "error",
                     )
-                    break
-            else:
-                sys.stderr.write(
-                    "Unable to fetch data status {} ".format(load.status_code)
-                )
-                add_log(
-                    f"Data retrieval failure " f"due to {load.reason}",
-                    "error",
-                )
-                sys.exit(1)
+                    sys.exit(1)
 
     @staticmethod
     def dashboards_shared_with(
@@ -542,9 +533,13 @@ class Projects:
             existing file.
 
         :param kwargs: Additional arguments to specify.
+
+        .. versionchanged:: 0.9.5
+
+        The attachments are read from the ``project`` and ``attachment``
+        fields of the search result, instead of a request per issue.
         """
         attach_list = deque()
-        count_start_at: Union[str, int] = 0 if LOGIN.api is False else None
         headers = [
             "Project id",
             "Project key",
@@ -564,69 +559,82 @@ class Projects:
             **kwargs,
         )
 
-        def pull_attachment_sequence() -> None:
+        def pull_attachments(
+            keys: str,
+            data: dict,
+        ) -> None:
             """
-            Pulls the data and transform into given results.
+            Arranges the attachments of an issue into rows.
+
+            :param keys: An issue key
+
+            :param data: The fields of the issue
 
             :return: None
             """
-            nonlocal attach_list # noqa: F824
-            for issues in result_data["issues"]:
-                keys = issues["key"]
-                get_issue_keys = LOGIN.get(
-                    endpoint.issues(issue_key_or_id=keys)
-                )
-                if get_issue_keys.status_code == 200:
-                    key_data = json.loads(get_issue_keys.content)
-                    data = key_data["fields"]
-                    if "project" or "attachment" in data:
-                        project_id = data["project"]["id"]
-                        project_name = data["project"]["name"]
-                        project_key = data["project"]["key"]
-                        attachment = data["attachment"]
-                        if attachment is not None:
-                            for attach in attachment:
-                                if "author" in attach:
-                                    display_name = attach["author"][
-                                        "displayName"
-                                    ]
+            project_id = data["project"]["id"]
+            project_name = data["project"]["name"]
+            project_key = data["project"]["key"]
+            for attach in data["attachment"] or []:
+                display_name = (
+                    attach["author"]["displayName"]
+                    if "author" in attach
+                    else ""
+                )
+                file_name = attach["filename"]  # name of the file
+                created = attach["created"]  # datetime need to convert it
+                # in bytes, need to convert to mb
+                attachment_size = attach["size"]
+                mime_type = attach.get("mimeType")
+                attachment_url = attach["content"]
+
+                calc_size = self.byte_converter(attachment_size)
+                calc_date = self.date_converter(created)
+
+                pull = [
+                    project_id,
+                    project_key,
+                    project_name,
+                    keys,
+                    calc_size,
+                    mime_type,
+                    file_name,
+                    f"{calc_date} by {display_name}",
+                    attachment_url,
+                ]
+                attach_list.append(pull)
 
-                                def pull_attachment() -> None:
-                                    """
-                                    Arranges extracts data
-                                    :return: None
-                                    """
-                                    file_name = attach[
-                                        "filename"
-                                    ]  # name of the file
-                                    created = attach[
-                                        "created"
-                                    ]  # datetime need to convert it
-                                    attachment_size = attach[
-                                        "size"
-                                    ]  # in bytes, need to convert to mb
-                                    mime_type = attach.get("mimeType")
-                                    attachment_url = attach["content"]
-
-                                    calc_size = self.byte_converter(
-                                        attachment_size
-                                    )
-                                    calc_date = self.date_converter(created)
+        def pull_attachment_sequence(
+            issues: list,
+        ) -> None:
+            """
+            Pulls the data of a search page and transform into given results.
 
-                                    pull = [
-                                        project_id,
-                                        project_key,
-                                        project_name,
-                                        keys,
-                                        calc_size,
-                                        mime_type,
-                                        file_name,
-                                        f"{calc_date} by {display_name}",
-                                        attachment_url,
-                                    ]
-                                    attach_list.append(pull)
+            :param issues: The issues of a search page
 
-                                pull_attachment()
+            :return: None
+            """
+            nonlocal attach_list # noqa: F824
+            missing = []
+            for issue in issues:
+                data = issue.get("fields") or {}
+                if "project" in data and "attachment" in data:
+                    pull_attachments(issue["key"], data)
+                else:
+                    missing.append(issue["key"])
+
+            # a search returns the whole ``attachment`` list of an issue, it
+            # is not paged like ``comment`` or ``worklog`` which come with
+            # a ``total``, so the list is never cut short. Only issues
+            # whose fields were left out of the search payload are fetched
+            # again in bulk.
+            for issue in LOGIN.iter_bulk_issues(
+                missing,
+                fields=["project", "attachment"],
+            ):
+                data = issue.get("fields") or {}
+                if "project" in data and "attachment" in data:
+                    pull_attachments(issue["key"], data)
 
             raw_data = [x for x in attach_list]
             file_writer(
@@ -637,47 +645,36 @@ class Projects:
             )
             attach_list.clear()
 
-        while True:
-            get_issue = LOGIN.get(
-                endpoint.search_issues_jql(
-                    start_at=count_start_at,
-                    **kwargs,
-                ) if LOGIN.api is False else
-                endpoint.search_cloud_issues(
-                    next_page=count_start_at,
-                    **kwargs,
-                )
+        # the other search arguments are still sent with every page, the
+        # fields needed for the rows are always requested.
+        search = {
+            key: value
+            for key, value in kwargs.items()
+            if key not in ("query", "method", "next_page", "start_at")
+        }
+        fields = search.pop("fields", None)
+        if isinstance(fields, str):
+            fields = fields.split(",")
+        if "max_results" in search:
+            search["page_size"] = search.pop("max_results")
+        for result_data in LOGIN.iter_shards(
+            kwargs.get("query"),
+            fields=list(
+                dict.fromkeys((fields or []) + ["project", "attachment"])
+            ),
+            **search,
+        ):
+            print("Attachment extraction processing")
+            add_log(
+                "Attachment extraction processing",
+                "info",
             )
-            if get_issue.status_code == 200:
-                result_data = json.loads(get_issue.content)
-                if LOGIN.api is False:
-                    if count_start_at > result_data["total"]:
-                        print("Attachment extraction completed")
-                        add_log(
-                            "Attachment extraction completed",
-                            "info",
-                        )
-                        break
-
-                print("Attachment extraction processing")
-                add_log(
-                    "Attachment extraction processing",
-                    "info",
-                )
-                pull_attachment_sequence()
-                if LOGIN.api is True:
-                    if "nextPageToken" not in result_data:
-                        print("Attachment extraction completed")
-                        add_log(
-                            "Attachment extraction completed",
-                            "info",
-                        )
-                        break
-
-            if LOGIN.api is False:
-                count_start_at += 50
-            elif LOGIN.api is True:
-                count_start_at = get_issue.json().get("nextPageToken", None)
+            pull_attachment_sequence(result_data["issues"])
+        print("Attachment extraction completed")
+        add_log(
+            "Attachment extraction completed",
+            "info",
+        )
 
         def re_write() -> None:
             """
@@ -697,50 +694,24 @@ class Projects:
                 key=lambda row: row[3],
                 reverse=False,
             )
-            for i in sorts:
-                _project_id = i[0]
-                _project_key = i[1]
-                _project_name = i[2]
-                _issue_key = i[3]
-                _attach_size = i[4]
-                _file_name = i[5]
-                _attach_type = i[6]
-                _created_by = i[7]
-                _attach_url = i[8]
-                raw_data_file = [
-                    _project_id,
-                    _project_key,
-                    _project_name,
-                    _issue_key,
-                    _attach_size,
-                    _file_name,
-                    _attach_type,
-                    _created_by,
-                    _attach_url,
-                ]
-                file_writer(
-                    attachment_folder,
-                    attachment_file_name,
-                    data=raw_data_file,
-                )
+            with CsvSink(attachment_folder, attachment_file_name) as sink:
+                for i in sorts:
+                    sink.writerow(i[:9])
 
-            # lastly we want to append the total sum of attachment size.
-            raw_data_file = [
-                "",
-                "",
-                "",
-                "",
-                "Total Size: {:.2f} MB".format(calc_made),
-                "",
-                "",
-                "",
-                "",
-            ]
-            file_writer(
-                attachment_folder,
-                attachment_file_name,
-                data=raw_data_file,
-            )
+                # lastly we want to append the total sum of attachment size.
+                sink.writerow(
+                    [
+                        "",
+                        "",
+                        "",
+                        "",
+                        "Total Size: {:.2f} MB".format(calc_made),
+                        "",
+                        "",
+                        "",
+                        "",
+                    ]
+                )
 
         read_file = file_reader(
             attachment_folder,
@@ -913,20 +884,25 @@ class Projects:
         """
         file: int = kwargs.get("file", 6)
         last_cell: bool = kwargs.get("last_cell", True)
-        read = file_reader(
-            folder=attach_folder,
-            file_name=attach_file,
-            skip=True,
-            **kwargs,
-        )
+
+        def read() -> Iterator[List[str]]:
+            """Stream the rows of the attachment file."""
+            return file_reader(
+                folder=attach_folder,
+                file_name=attach_file,
+                skip=True,
+                stream=True,
+                **kwargs,
+            )
+
         add_log(
             "Reading attachment {}".format(attach_file),
             "info",
         )
         count = 0
-        cols = read
-        length = len(cols)
-        for r in read:
+        # only count the rows when the last one has to be left out
+        length = sum(1 for _ in read()) if last_cell is True else 0
+        for r in read():
             count += 1
             keys = r[key]
             attachment = r[attach]
@@ -1057,21 +1033,26 @@ class Projects:
 """
 
         file: int = kwargs.get("file", 6)
-        read = file_reader(
-            folder=file_folder,
-            file_name=file_name,
-            skip=skip_csv_header,
-            **kwargs,
-        )
+
+        def read() -> Iterator[List[str]]:
+            """Stream the rows of the attachment list file."""
+            return file_reader(
+                folder=file_folder,
+                file_name=file_name,
+                skip=skip_csv_header,
+                stream=True,
+                **kwargs,
+            )
+
         add_log(
             "Reading attachment {}".format(file_name),
             "info",
         )
         count = 0
-        cols = read
-        length = len(cols)
         last_cell = kwargs["last_cell"] if "last_cell" in kwargs else False
-        for r in read:
+        # only count the rows when the last one has to be left out
+        length = sum(1 for _ in read()) if last_cell is True else 0
+        for r in read():
             count += 1
             attachment = r[attach]
             _file_name = r[file]
@@ -1185,6 +1166,7 @@ class Projects:
         read = file_reader(
             folder=folder,
             file_name=file,
+            stream=True,
         )
         for _ in read:
             f = CheckUser._make(_)
@@ -1216,7 +1198,35 @@ class Projects:
             "Searching with JQL:",
             search_issues,
         )
-        count_start_at: Union[str, int] = 0 if LOGIN.api is False else None
+
+        def read_comments(comments: dict) -> Optional[list]:
+            """Return the comments of an issue.
+
+            The comment field of the search holds the first comments of the
+            issue, the rest are paged from the comment endpoint.
+
+            :param comments: The comment field of an issue
+
+            :return: A list of comments or None if a page cannot be read
+            """
+            comment_data = list(comments.get("comments", []))
+            while comments["total"] > len(comment_data):
+                get_comment = LOGIN.get(
+                    "{}?startAt={}".format(comments["self"], len(comment_data))
+                )
+                if get_comment.status_code != 200:
+                    add_log(
+                        "Unable to read the comments at {} - {}".format(
+                            comments["self"], get_comment.reason
+                        ),
+                        "error",
+                    )
+                    return None
+                page = json.loads(get_comment.content)["comments"]
+                if not page:
+                    break
+                comment_data.extend(page)
+            return comment_data
 
         def extract_issue() -> None:
             """Find the comment in each issue and count it.
@@ -1224,63 +1234,59 @@ class Projects:
             """
             comment_by_users = 0
             comment_by_others = 0
-            for issues in result_data["issues"]:
-                keys = issues["key"]
-                get_issue_keys = LOGIN.get(
-                    endpoint.issues(issue_key_or_id=keys)
-                )
-                if get_issue_keys.status_code == 200:
-                    key_data = json.loads(get_issue_keys.content)
-                    data = key_data["fields"]
-                    if "project" or "comment" in data:
-                        project_id = data["project"]["id"]
-                        project_name = data["project"]["name"]
-                        project_key = data["project"]["key"]
-                        comments = data["comment"]
-                        if comments is not None:
-                            comment_total = comments["total"]
-                            comment_self = comments["self"]
-                            get_comment = LOGIN.get(comment_self)
-                            if get_comment.status_code == 200:
-                                comment_data = json.loads(get_comment.content)
-                                reporter_name = ""
-                                reporter_aid = ""
-                                for comment in comment_data["comments"]:
-                                    if "author" in comment:
-                                        display_name = comment["author"][
-                                            "displayName"
-                                        ]
-                                        account_id = comment["author"][
-                                            "accountId"
-                                        ]
-                                        if account_id == get_user:
-                                            reporter_name = display_name
-                                            reporter_aid = account_id
-                                            comment_by_users += 1
-                                        if account_id != get_user:
-                                            comment_by_others += 1
-
-                                def pull_comments() -> None:
-                                    """
-                                    Pulls and arranges data
-                                    :return: None
-                                    """
-                                    raw_dump = [
-                                        project_id,
-                                        project_key,
-                                        project_name,
-                                        keys,
-                                        comment_total,
-                                        reporter_aid,
-                                        reporter_name,
-                                        comment_by_users,
-                                        comment_by_others,
+            for key_data in LOGIN.iter_bulk_issues(
+                [issues["key"] for issues in result_data["issues"]],
+                fields=["project", "comment"],
+            ):
+                keys = key_data["key"]
+                data = key_data["fields"]
+                if "project" or "comment" in data:
+                    project_id = data["project"]["id"]
+                    project_name = data["project"]["name"]
+                    project_key = data["project"]["key"]
+                    comments = data["comment"]
+                    if comments is not None:
+                        comment_total = comments["total"]
+                        comment_data = read_comments(comments)
+                        if comment_data is not None:
+                            reporter_name = ""
+                            reporter_aid = ""
+                            for comment in comment_data:
+                                if "author" in comment:
+                                    display_name = comment["author"][
+                                        "displayName"
                                     ]
-                                    comment_list.append(raw_dump)
+                                    account_id = comment["author"][
+                                        "accountId"
+                                    ]
+                                    if account_id == get_user:
+                                        reporter_name = display_name
+                                        reporter_aid = account_id
+                                        comment_by_users += 1
+                                    if account_id != get_user:
+                                        comment_by_others += 1
+
+                            def pull_comments() -> None:
+                                """
+                                Pulls and arranges data
+                                :return: None
+                                """
+                                raw_dump = [
+                                    project_id,
+                                    project_key,
+                                    project_name,
+                                    keys,
+                                    comment_total,
+                                    reporter_aid,
+                                    reporter_name,
+                                    comment_by_users,
+                                    comment_by_others,
+                                ]
+                                comment_list.append(raw_dump)
 
-                                pull_comments()
-                                comment_by_users = 0
-                                comment_by_others = 0
+                            pull_comments()
+                            comment_by_users = 0
+                            comment_by_others = 0
 
             raw_data = [z for z in comment_list]
             file_writer(
@@ -1291,43 +1297,17 @@ class Projects:
             )
             comment_list.clear()
 
-        while True:
-            get_issues = LOGIN.get(
-                endpoint.search_issues_jql(
-                    query=search_issues,
-                    start_at=count_start_at,
-                ) if LOGIN.api is False else
-                endpoint.search_cloud_issues(
-                    query=search_issues,
-                    next_page=count_start_at,
-                )
-            )
-            if get_issues.status_code == 200:
-                result_data = json.loads(get_issues.content)
-                if LOGIN.api is False:
-                    if count_start_at > result_data["total"]:
-                        print("Issues extraction completed")
-                        add_log(
-                            "Issue extraction completed",
-                            "info",
-                        )
-                        break
-                elif LOGIN.api is True:
-                    if "nextPageToken" not in result_data:
-                        print("Issues extraction completed")
-                        add_log(
-                            "Issue extraction completed",
-                            "info",
-                        )
-                        break
-
-                print("Extracting Issues...")
-                extract_issue()
-
-            if LOGIN.api is False:
-                count_start_at += 50
-            elif LOGIN.api is True:
-                count_start_at = get_issues.json().get("nextPageToken", None)
+        for result_data in LOGIN.iter_shards(
+            search_issues,
+            fields=["key"],
+        ):
+            print("Extracting Issues...")
+            extract_issue()
+        print("Issues extraction completed")
+        add_log(
+            "Issue extraction completed",
+            "info",
+        )
 
         def count_and_total() -> (
             Tuple[
@@ -1482,6 +1462,17 @@ class Projects:
                * field_name: Target a field name to render.
                datatype -> string
 
+               * bulk: On Jira Cloud, fetch the histories of each page of
+               issues with one bulk changelog request instead of paging
+               every issue. Defaults to True, ignored on Server or DC.
+               datatype -> boolean
+
+        .. versionchanged:: 0.9.5
+
+        bulk - added keyword argument, the histories are read with
+        ``LOGIN.iter_changelogs`` on Jira Cloud. When ``field_name`` is
+        given, only the changes of that field are requested.
+
         :return: None
         """
         from jiraone.exceptions import (
@@ -1495,6 +1486,7 @@ class Projects:
             )
         changes = deque()
         item_list = deque()
+        issue_created = {}
         jql: str = (
             kwargs["jql"]
             if "jql" in kwargs
@@ -1507,6 +1499,19 @@ class Projects:
         )
         field_name = kwargs["field_name"] if "field_name" in kwargs else None
         show_output: bool = False if "show_output" in kwargs else True
+        bulk: bool = kwargs.get("bulk", True) is True and LOGIN.api is True
+        field_ids = None
+        if bulk is True and field_name is not None:
+            # the bulk endpoint filters by field id, e.g. "Status" is "status"
+            field_ids = [
+                jira_field["id"]
+                for jira_field in LOGIN.field_catalog
+                if field_name.lower()
+                in (
+                    str(jira_field.get("id")).lower(),
+                    str(jira_field.get("name")).lower(),
+                )
+            ][:10] or None
         print("Extracting issue histories...")
         add_log(
             "Extracting issue histories...",
@@ -1540,9 +1545,15 @@ class Projects:
             nonlocal attempt
 
             if _fix_status_ is True and attempt == 1:
-                create = LOGIN.get(endpoint.issues(key_val))
-                if create.status_code < 300:
-                    adjust = create.json().get("fields").get("created")
+                adjust = issue_created.get(key_val)
+                if adjust is None:
+                    # the issue is not on the current page of the search
+                    create = LOGIN.get(
+                        endpoint.issues(key_val, query="fields=created")
+                    )
+                    if create.status_code < 300:
+                        adjust = create.json().get("fields").get("created")
+                if adjust is not None:
                     raw_ = (
                         [
                             key_val,
@@ -1573,12 +1584,7 @@ class Projects:
                             item_val.tmpToAccountId,
                         ]
                     )
-                    file_writer(
-                        folder,
-                        file,
-                        data=raw_,
-                        mode="a+",
-                    )
+                    sink.writerow(raw_)
                     attempt += 2
 
         def changelog_search() -> None:
@@ -1587,6 +1593,21 @@ class Projects:
             """
             nonlocal loop, attempt
             infinity_counter = count if back_up is False else data_brick["iter"]
+            issue_created.clear()
+            issue_created.update(
+                {
+                    issue["key"]: (issue.get("fields") or {}).get("created")
+                    for issue in data["issues"]
+                }
+            )
+            bulk_histories = (
+                LOGIN.iter_changelogs(
+                    [issue["id"] for issue in data["issues"]],
+                    field_ids=field_ids,
+                )
+                if bulk is True
+                else None
+            )
             for issue in data["issues"]:
                 keys = issue["key"]
                 attempt = 1
@@ -1684,6 +1705,8 @@ class Projects:
                     }
                 )
                 project_key = keys.split("-")[0]
+                # the save point must never run ahead of the rows on disk
+                sink.flush() if allow_cp is True else None
                 json.dump(
                     data_brick,
                     open(
@@ -1697,7 +1720,24 @@ class Projects:
                     re_instantiate(set_up["key"])
 
                 loop = True
-                re_instantiate(keys)
+                if bulk_histories is None:
+                    re_instantiate(keys)
+                    continue
+                _, histories = next(bulk_histories)
+                print(f"Getting history from issue: {keys}")
+                add_log(
+                    "Getting history " f"from issue: {keys}",
+                    "info",
+                )
+                changelog_history(
+                    {"histories": histories},
+                    proj=(
+                        keys,
+                        project_key,
+                        (issue.get("fields") or {}).get("summary"),
+                    ),
+                )
+                print("*" * 100)
 
         def changelog_history(
             history: Any = Any,
@@ -1863,13 +1903,7 @@ class Projects:
                             changes.append(raw_vision)
                         item_list.clear()
 
-                for case in changes:
-                    file_writer(
-                        folder,
-                        file,
-                        data=case,
-                        mode="a+",
-                    )
+                sink.writerows(changes)
                 changes.clear()
                 add_log(
                     f"Clearing history from queue: {_keys}",
@@ -1917,7 +1951,6 @@ class Projects:
                 "To AccountId",
             ]
         )
-        cycle: int = 0
         # stores our iteration here
         data_brick = {}
         set_up = None
@@ -1976,79 +2009,25 @@ class Projects:
             data=headers,
             mode="w+",
         ) if set_up is None else None
-        depth = 1
-        while True:
-            load = (
-                LOGIN.get(
-                    endpoint.search_issues_jql(
-                        query=set_up["jql"],
-                        start_at=set_up["iter"],
-                        max_results=100,
-                    ) if LOGIN.api is False else
-                    endpoint.search_cloud_issues(
-                        query=set_up["jql"],
-                        next_page=set_up["iter"],
-                        fields=None,
-                        max_results=100,
-                    )
-                )
-                if back_up is True and depth == 1
-                else LOGIN.get(
-                    endpoint.search_issues_jql(
-                        query=jql,
-                        start_at=count,
-                        max_results=100,
-                    ) if LOGIN.api is False else
-                endpoint.search_cloud_issues(
-                query=jql,
-                next_page=count,
-                    fields=None,
-                max_results=100,
-                 )
-                )
-           )
-
-            if load.status_code < 300:
-                data = json.loads(load.content)
-                cycle = 0
+        pages = LOGIN.iter_pages(
+            set_up["jql"] if back_up is True else jql,
+            fields=(
+                ["summary", "created"] if _fix_status_ is True else ["summary"]
+            ),
+            page_size=100,
+            cursor=set_up["iter"] if back_up is True else None,
+        )
+        with CsvSink(folder, file) as sink:
+            for data in pages:
+                count = pages.cursor
                 data_brick.update(
                     {
-                        "jql": jql,
-                        "iter": set_up["iter"]
-                        if back_up is True and depth == 1
-                        else count,
-                        "save": set_up["save"]
-                        if back_up is True and depth == 1
-                        else attempt,
+                        "jql": pages.jql,
+                        "iter": count,
+                        "save": set_up["save"] if back_up is True else attempt,
                     }
                 )
-                if LOGIN.api is False:
-                    if count > data["total"]:
-                        break
-                    changelog_search()
-                    depth += 1
-                if LOGIN.api is True:
-                    changelog_search()
-                    if "nextPageToken" not in data:
-                        break
-                    depth += 1
-            if LOGIN.api is False:
-                count += 100
-            if LOGIN.api is True:
-                count = load.json().get("nextPageToken", None)
-            if depth == 2 and back_up is True:
-                count = data_brick["iter"]
-            if load.status_code > 300:
-                cycle += 1
-                if cycle > 99:
-                    raise JiraOneErrors(
-                        "value",
-                        'It seems that the search "{}" cannot be '
-                        "retrieved as we've attempted it {} times".format(
-                            jql,
-                            cycle,
-                        ),
-                    )
+                changelog_search()
 
         if show_output is True:
             print(
@@ -2111,16 +2090,31 @@ class Projects:
                * flush: Datatype(int) - Delay the time, so any running thread
                         can finish.
 
+               * retries: Datatype(int) - The number of times a changelog
+                          page which fails with a server or connection
+                          error is requested again. Defaults to 3.
+
+        .. versionchanged:: 0.9.5
+
+        The issue keys come from a JQL search instead of a full issue
+        export, and the histories are fetched on a bounded thread pool and
+        written straight into the file, without a temporary file per issue.
+        The rows of each issue are kept together and in order, the issues
+        follow the order in which their search windows complete, which is
+        not the order of the JQL. ``timeout`` and ``flush`` are kept for
+        backward compatibility and no longer delay the export.
+
 
         :return: None
         """
+        from jiraone.exceptions import (
+            JiraOneErrors,
+        )
         from jiraone.utils import (
-            DotNotation,
-            process_executor,
+            BoundedExecutor,
             validate_on_error,
             validate_argument_name,
         )
-        from time import sleep
 
         valid_kwargs = {
             "folder": "folder",
@@ -2129,9 +2123,12 @@ class Projects:
             "timeout": "timeout",
             "field_name": "field_name",
             "flush": "flush",
+            "retries": "retries",
         }
         for name_key in kwargs:
             validate_argument_name(name_key, valid_kwargs)
+        import time
+        import requests
 
         field_name: str = (
             kwargs.get("field_name") if "field_name" in kwargs else ""
@@ -2144,7 +2141,7 @@ class Projects:
             kwargs.get("timeout") if "timeout" in kwargs else 5
         )
         flush: int = kwargs.get("flush") if "flush" in kwargs else 10
-        config = {"history": []}
+        retries: int = kwargs.get("retries", 3)
         if not file.endswith(".csv"):
             file = file + ".csv"
 
@@ -2216,101 +2213,137 @@ class Projects:
             "a number to delay the time it takes "
             "for any running thread to finish",
         )
-        # extract the issues then separate by issue keys
-        PROJECT.export_issues(
-            folder=folder,
-            jql=jql,
-            final_file=file,
-            show_export_link=False,
-        )
-        file_path = path_builder(
-            folder,
-            file_name=file,
+        validate_on_error(
+            retries,
+            (
+                int,
+                "retries",
+                "an integer",
+            ),
+            "a number of times a failed changelog page is requested again",
         )
-        read_file = file_reader(
+        file_path = path_builder(
             folder,
             file_name=file,
         )
 
-        def async_history_data(
-            history_key: str = None,
-        ):
-            """Pass an issue key which can be processed asynchronously.
+        def history_rows(
+            issue_key: str,
+            summary: str,
+            histories: list,
+        ) -> list:
+            """Turn the change histories of an issue into rows.
 
-            :param history_key: A Jira issue key
+            :param issue_key: A Jira issue key
 
-            :return: None
+            :param summary: The summary of the issue
+
+            :param histories: A list of change histories
+
+            :return: A list of rows
             """
-            query = f"key = {history_key}"
-            history_folder = f"{folder}/history"
-            history_file = f"history_{history_key}.csv"
-            PROJECT.change_log(
-                folder=history_folder,
-                allow_cp=False,
-                file=history_file,
-                jql=query,
-                show_output=False,
-                field_name=field_name if field_name else None,
-            )
-            read_history = file_reader(
-                history_folder,
-                history_file,
-                skip=True,
-            )
-            history_data = []
-            for _history_ in read_history:
-                name_mapper = {
-                    "issueKey": _history_[0],
-                    "summary": _history_[1],
-                    "author": _history_[2],
-                    "created": _history_[3],
-                    "fieldType": _history_[4],
-                    "field": _history_[5],
-                    "fieldId": _history_[6],
-                    "from_": _history_[7],
-                    "fromString": _history_[8],
-                    "to_": _history_[9],
-                    "toString": _history_[10],
-                }
-                if LOGIN.api is True:
-                    name_mapper.update(
-                        {
-                            "fromAccountId": _history_[11],
-                            "toAccountId": _history_[12],
-                        }
-                    )
-                mapper = DotNotation(name_mapper)
-                historical_data = [
-                    mapper.issueKey,
-                    mapper.summary,
-                    mapper.author,
-                    mapper.created,
-                    mapper.fieldType,
-                    mapper.field,
-                    mapper.fieldId,
-                    mapper.from_,
-                    mapper.fromString,
-                    mapper.to_,
-                    mapper.toString,
-                ]
-                if LOGIN.api is True:
-                    historical_data.append(mapper.fromAccountId)
-                    historical_data.append(mapper.toAccountId)
+            rows = []
+            for past in histories:
+                author = past.get("author") or {}
+                name = author.get("name", author.get("displayName", ""))
+                for item in past.get("items") or []:
+                    if field_name and item.get("field") != field_name:
+                        continue
+                    row = [
+                        issue_key,
+                        summary,
+                        name,
+                        past.get("created", ""),
+                        item.get("fieldtype"),
+                        item.get("field"),
+                        item.get("fieldId"),
+                        item.get("from"),
+                        item.get("fromString"),
+                        item.get("to"),
+                        item.get("toString"),
+                    ]
+                    if LOGIN.api is True:
+                        row.append(item.get("tmpFromAccountId"))
+                        row.append(item.get("tmpToAccountId"))
+                    rows.append(row)
+            return rows
 
-                history_data.append(historical_data)
-            config["history"].append(
-                {
-                    "key": history_key,
-                    "value": history_data.copy(),
-                }
-            )
+        def async_history_data(
+            issue: dict,
+        ) -> list:
+            """Get the change history of an issue, can run concurrently.
 
-            os.remove(
-                path_builder(
-                    history_folder,
-                    history_file,
+            On Server or DC, the change history is expanded in the search
+            result. On Cloud, the changelog endpoint is paged until every
+            history of the issue is read. A page which fails with a server
+            or connection error is requested again, an issue whose history
+            cannot be read completely raises an error rather than being
+            written in part.
+
+            :param issue: An issue from the search result
+
+            :return: A list of rows in the order of the histories
+            """
+            history_key = issue["key"]
+            summary = (issue.get("fields") or {}).get("summary")
+            if LOGIN.api is False:
+                return history_rows(
+                    history_key,
+                    summary,
+                    (issue.get("changelog") or {}).get("histories") or [],
                 )
-            )
+            rows, start_at, attempt = [], 0, 0
+            while True:
+                try:
+                    load = LOGIN.get(
+                        endpoint.issues(
+                            issue_key_or_id=history_key,
+                            query=f"changelog?startAt={start_at}"
+                            "&maxResults=100",
+                            event=True,
+                        )
+                    )
+                    status_code, reason = load.status_code, load.reason
+                except requests.exceptions.RequestException as error:
+                    status_code, reason = None, error
+                if status_code != 200:
+                    attempt += 1
+                    if (
+                        status_code is None or status_code >= 500
+                    ) and attempt <= retries:
+                        time.sleep(
+                            LOGIN.rate_limiter.backoff(attempt)
+                            if LOGIN.rate_limiter is not None
+                            else attempt
+                        )
+                        continue
+                    if start_at == 0 and status_code in (403, 404):
+                        # the issue was deleted or hidden since the search
+                        add_log(
+                            f"Unable to get the history of {history_key} "
+                            f"due to {reason}, the issue is skipped",
+                            "error",
+                        )
+                        return []
+                    add_log(
+                        f"Unable to get the history of {history_key} "
+                        f"at {start_at} due to {reason}",
+                        "error",
+                    )
+                    raise JiraOneErrors(
+                        "value",
+                        f"The history of {history_key} cannot be read "
+                        f"completely, the changelog page at {start_at} "
+                        f"failed with {reason}",
+                    )
+                attempt = 0
+                loads = load.json()
+                values = loads.get("values") or []
+                rows.extend(history_rows(history_key, summary, values))
+                start_at += len(values)
+                if not values or start_at >= loads.get("total", 0):
+                    break
+            return rows
 
         print("Starting history extraction. Please wait...")
         header = [
@@ -2329,30 +2362,24 @@ class Projects:
         if LOGIN.api is True:
             header.append("From AccountId")
             header.append("To AccountId")
-        issue_key_column, count = None, 0
-        for column in read_file:
-            if count == 0:
-                issue_key_column = column.index("Issue key")
-                break
-            count += 1
-        del read_file[0]
-        for column in read_file:
-            process_executor(
-                async_history_data,
-                data=column[issue_key_column],
-                workers=workers,
-                timeout=timeout,
-            )
-
-        file_writer(folder, file_name=file, data=header, mode="w+")
-        sleep(flush)
-        for history_obj in config["history"]:
-            file_writer(
-                folder,
-                file_name=file,
-                data=history_obj.get("value"),
-                mark="many",
-            )
+        # the summary is written on every row of the history
+        pages = LOGIN.iter_shards(
+            jql,
+            fields=["summary"],
+            expand="changelog" if LOGIN.api is False else None,
+        )
+        issues = (issue for page in pages for issue in page["issues"])
+        with CsvSink(folder, file, mode="w+") as sink:
+            sink.writerow(header)
+            with BoundedExecutor(workers=workers) as pool:
+                # each issue is written as one batch, in the order the
+                # issues are yielded by the search
+                for rows in pool.map(async_history_data, issues):
+                    sink.writerows(rows)
+        add_log(
+            f"Extracted the history of {sink.rows - 1} change items",
+            "info",
+        )
         print(
             "Export completed, historical record located at {}".format(
                 file_path
@@ -2788,6 +2815,569 @@ class Projects:
                 )
             block.clear()
 
+    @staticmethod
+    def column_slots(
+        names: list,
+    ) -> list:
+        """Numbers each occurrence of a column name, so the repeated
+        columns of a Jira CSV export e.g. "Comment" are told apart.
+
+        :param names: The column names of a header
+
+        .. versionadded:: 0.9.5
+
+        :return: A list of (name, occurrence) tuples
+        """
+        seen = {}
+        numbered = []
+        for name in names:
+            seen[name] = seen.get(name, -1) + 1
+            numbered.append((name, seen[name]))
+        return numbered
+
+    @staticmethod
+    def merge_csv_files(
+        files: list,
+        folder: str = WORK_PATH,
+        file_name: str = None,
+        **kwargs,
+    ) -> None:
+        """Merges CSV files with different headers into one file.
+
+        The headers of every file are read first to lay out the final
+        columns. A column repeated within a file e.g. "Comment" gets as
+        many columns as the file which repeats it the most. The rows of
+        each file are then streamed once into ``file_name``, every
+        value under its column.
+
+        :param files: The names of the files to merge, in order
+
+        :param folder: A path to the name of the folder of the files
+
+        :param file_name: The name of the merged file
+
+        :param kwargs: Additional parameters
+
+              **options**
+
+              * encoding: Standard encoding strings. e.g “utf-8”.
+
+              * errors: defaults to replace
+
+        .. versionadded:: 0.9.5
+
+        :return: None
+        """
+        encoding = kwargs.get("encoding", "utf-8")
+        errors = kwargs.get("errors", "replace")
+
+        def read_header(files_: str) -> list:
+            """Reads only the header row of a file.
+
+            :param files_: The name of the file
+
+            :return: A list of (name, occurrence) tuples
+            """
+            rows = iter_rows(folder, files_, encoding=encoding, errors=errors)
+            header = next(rows, [])
+            rows.close()
+            return Projects.column_slots(header)
+
+        layout = []
+        for files_ in files:
+            previous = None
+            for slot in read_header(files_):
+                if slot not in layout:
+                    # a new column is placed after the column which
+                    # comes before it in its own file.
+                    layout.insert(
+                        layout.index(previous) + 1
+                        if previous is not None
+                        else 0,
+                        slot,
+                    )
+                previous = slot
+        position = {slot: index for index, slot in enumerate(layout)}
+
+        with CsvSink(
+            folder,
+            file_name,
+            mode="w+",
+            encoding=encoding,
+            errors=errors,
+        ) as sink:
+            sink.writerow([name for name, _ in layout])
+            for progress, files_ in enumerate(files, 1):
+                rows = iter_rows(
+                    folder, files_, encoding=encoding, errors=errors
+                )
+                columns = [
+                    position[slot]
+                    for slot in Projects.column_slots(next(rows, []))
+                ]
+                for row in rows:
+                    if not row:
+                        continue
+                    merged = [None] * len(layout)
+                    for index, value in zip(columns, row):
+                        merged[index] = value
+                    sink.writerow(merged)
+                current_progress = 100 * progress / len(files)
+                print(
+                    "Processing. "
+                    "Current progress: {}%".format(int(current_progress))
+                )
+
+    @staticmethod
+    def dump_json(
+        value: Any,
+        level: int = 0,
+    ) -> str:
+        """Serializes a value the same way as ``json.dump`` with an
+        indent of 4 and sorted keys, for a value nested ``level`` deep
+        in a document which is written piece by piece.
+
+        :param value: Any JSON serializable value
+
+        :param level: The depth of the value in the document
+
+        .. versionadded:: 0.9.5
+
+        :return: A JSON string
+        """
+        return json.dumps(
+            value,
+            indent=4,
+            sort_keys=True,
+        ).replace("\n", "\n" + " " * 4 * level)
+
+    @staticmethod
+    def read_json_export(
+        folder: str = WORK_PATH,
+        file_name: str = None,
+        **kwargs,
+    ) -> Iterator[tuple]:
+        """Reads a JSON export of ``export_issues`` one value at a time,
+        an issue is only decoded when it is reached.
+
+        Yields ("section", name, value) for the top level values other
+        than the projects, ("projects", None) and ("projects_end", None)
+        around the projects, ("project", index) and ("end", index) around
+        each project, ("field", index, name, value) for its values and
+        ("issues", index), ("issue", index, issue) and ("issues_end",
+        index) for its issues.
+
+        :param folder: A path to the name of the folder of the file
+
+        :param file_name: The name of the JSON file
+
+        :param kwargs: Additional parameters
+
+              **options**
+
+              * encoding: Standard encoding strings. e.g “utf-8”.
+
+        .. versionadded:: 0.9.5
+
+        :return: An iterator of tuples
+        """
+        from jiraone.exceptions import (
+            JiraOneErrors,
+        )
+
+        encoding = kwargs.get("encoding", "utf-8")
+        decoder = json.JSONDecoder()
+        with open(path_builder(folder, file_name), encoding=encoding) as f:
+            buffer, at = "", 0
+
+            def fill() -> bool:
+                """Reads more of the file into the buffer."""
+                nonlocal buffer, at
+                more = f.read(65536)
+                buffer, at = buffer[at:] + more, 0
+                return bool(more)
+
+            def char() -> str:
+                """Returns the next character which is not a whitespace,
+                without reading past it."""
+                nonlocal at
+                while True:
+                    while at < len(buffer) and buffer[at].isspace():
+                        at += 1
+                    if at < len(buffer):
+                        return buffer[at]
+                    if not fill():
+                        return ""
+
+            def take(expected: str) -> bool:
+                """Reads past the next character if it is ``expected``."""
+                nonlocal at
+                if char() != expected:
+                    return False
+                at += 1
+                return True
+
+            def value() -> Any:
+                """Decodes the next value, a value at the end of the
+                buffer may be cut short and is decoded again once the
+                buffer is filled."""
+                nonlocal at
+                char()
+                while True:
+                    try:
+                        result, end = decoder.raw_decode(buffer, at)
+                        if end < len(buffer):
+                            at = end
+                            return result
+                    except json.JSONDecodeError:
+                        pass
+                    if not fill():
+                        result, at = decoder.raw_decode(buffer, at)
+                        return result
+
+            def expect(expected: str) -> None:
+                """Reads past the expected character."""
+                if not take(expected):
+                    raise JiraOneErrors(
+                        "value",
+                        f"{file_name} is not a JSON export, expected "
+                        f"{expected!r} at {char()!r}",
+                    )
+
+            expect("{")
+            while not take("}"):
+                take(",")
+                section = value()
+                expect(":")
+                if section != "projects" or char() != "[":
+                    yield "section", section, value()
+                    continue
+                expect("[")
+                yield "projects", None
+                index = 0
+                while not take("]"):
+                    take(",")
+                    expect("{")
+                    yield "project", index
+                    while not take("}"):
+                        take(",")
+                        key = value()
+                        expect(":")
+                        if key != "issues" or char() != "[":
+                            yield "field", index, key, value()
+                            continue
+                        expect("[")
+                        yield "issues", index
+                        while not take("]"):
+                            take(",")
+                            yield "issue", index, value()
+                        yield "issues_end", index
+                    yield "end", index
+                    index += 1
+                yield "projects_end", None
+
+    @staticmethod
+    def compact_csv(
+        folder: str = WORK_PATH,
+        file_name: str = None,
+        delta: Optional[str] = None,
+        removed: Optional[Iterable] = None,
+        **kwargs,
+    ) -> None:
+        """Patches a CSV export of ``export_issues`` in place. The rows
+        of the issues in ``delta`` replace their previous rows, the
+        ``removed`` issues are dropped and the columns of both files are
+        aligned by their header.
+
+        Both files are streamed, the keys of the issues in ``delta`` are
+        read first.
+
+        :param folder: A path to the name of the folder of the files
+
+        :param file_name: The name of the CSV export to patch
+
+        :param delta: The name of a CSV export of the changed issues
+
+        :param removed: The keys of the issues to drop
+
+        :param kwargs: Additional parameters
+
+              **options**
+
+              * encoding: Standard encoding strings. e.g “utf-8”.
+
+              * delimit: The CSV separator. The default is a comma.
+
+        .. versionadded:: 0.9.5
+
+        :return: None
+        """
+        from jiraone.exceptions import (
+            JiraOneErrors,
+        )
+
+        encoding = kwargs.get("encoding", "utf-8")
+        delimiter = kwargs.get("delimit") or ","
+        removed = set(removed or [])
+
+        def read(name: str, **options: Any) -> Iterator[list]:
+            """Streams the rows of a file."""
+            return file_reader(
+                folder,
+                name,
+                stream=True,
+                delimiter=delimiter,
+                encoding=encoding,
+                **options,
+            )
+
+        rows = read(file_name)
+        delta_rows = iter([]) if delta is None else read(delta)
+        header = next(rows, [])
+        prev_names = Projects.column_slots(header)
+        delta_names = Projects.column_slots(next(delta_rows, None) or header)
+        key_slot = ("Issue key", 0)
+        for name, names in ((file_name, prev_names), (delta, delta_names)):
+            if name is not None and key_slot not in names:
+                raise JiraOneErrors(
+                    "value",
+                    f'{name} has no "Issue key" column, its rows cannot '
+                    "be matched to their issues.",
+                )
+        columns = list(prev_names)
+        for slot in delta_names:
+            if slot not in columns:
+                same = [
+                    index
+                    for index, column in enumerate(columns)
+                    if column[0] == slot[0]
+                ]
+                columns.insert(same[-1] + 1 if same else len(columns), slot)
+        position = {slot: index for index, slot in enumerate(columns)}
+
+        def realign(row: list, names: list) -> list:
+            """Moves the values of a row to the new columns."""
+            aligned = [""] * len(columns)
+            for slot, value in zip(names, row):
+                aligned[position[slot]] = value
+            return aligned
+
+        key_at = delta_names.index(key_slot)
+        changed = set() if delta is None else {
+            row[key_at] for row in read(delta, skip=True) if row
+        }
+        prev_key_at = prev_names.index(key_slot)
+        with CsvSink(
+            folder,
+            f"{file_name}.tmp",
+            mode="w+",
+            delimiter=delimiter,
+            encoding=encoding,
+        ) as sink:
+            sink.writerow([name for name, _ in columns])
+            dropped = changed | removed
+            for row in rows:
+                if row and row[prev_key_at] not in dropped:
+                    sink.writerow(realign(row, prev_names))
+            for row in delta_rows:
+                if row and row[key_at] not in removed:
+                    sink.writerow(realign(row, delta_names))
+        os.replace(
+            path_builder(folder, f"{file_name}.tmp"),
+            path_builder(folder, file_name),
+        )
+
+    @staticmethod
+    def compact_json(
+        folder: str = WORK_PATH,
+        file_name: str = None,
+        delta: Optional[str] = None,
+        removed: Optional[Iterable] = None,
+        **kwargs,
+    ) -> None:
+        """Patches a JSON export of ``export_issues`` in place. The issues
+        in ``delta`` replace their previous values, the ``removed`` issues
+        and their links are dropped and anything else that is new is
+        added. The output is laid out the same as a full export.
+
+        The export is streamed issue by issue, twice. Only ``delta`` is
+        read whole, it holds the changed issues.
+
+        :param folder: A path to the name of the folder of the files
+
+        :param file_name: The name of the JSON export to patch
+
+        :param delta: The name of a JSON export of the changed issues
+
+        :param removed: The keys of the issues to drop
+
+        :param kwargs: Additional parameters
+
+              **options**
+
+              * encoding: Standard encoding strings. e.g “utf-8”.
+
+        .. versionadded:: 0.9.5
+
+        :return: None
+        """
+        encoding = kwargs.get("encoding", "utf-8")
+        removed = set(removed or [])
+        dump = Projects.dump_json
+        changes = {}
+        if delta is not None:
+            with open(path_builder(folder, delta), encoding=encoding) as f:
+                changes = json.load(f)
+        changed = {
+            issue.get("key"): issue
+            for project in changes.get("projects", [])
+            for issue in project.get("issues", [])
+        }
+        # the key of a project comes after its issues, the project keys,
+        # the top level names and the changed issues already in the
+        # export are found first.
+        project_keys, present, names = {}, set(), {"projects"}
+        for event in Projects.read_json_export(
+            folder, file_name, encoding=encoding
+        ):
+            if event[0] == "section":
+                names.add(event[1])
+            elif event[0] == "field" and event[2] == "key":
+                project_keys[event[1]] = event[3]
+            elif event[0] == "issue" and event[2].get("key") in changed:
+                present.add(event[2].get("key"))
+        new_issues, new_projects = {}, []
+        for project in changes.get("projects", []):
+            issues = [
+                issue
+                for issue in project.get("issues", [])
+                if issue.get("key") not in present
+                and issue.get("key") not in removed
+            ]
+            if project.get("key") in project_keys.values():
+                new_issues[project.get("key")] = issues
+            else:
+                new_projects.append(dict(project, issues=issues))
+
+        def merge(name: str, values: Any) -> Any:
+            """Adds the new values of a top level list and drops the links
+            of the removed issues."""
+            if isinstance(changes.get(name), list) and isinstance(
+                values, list
+            ):
+                known = {json.dumps(value, sort_keys=True) for value in values}
+                values = values + [
+                    value
+                    for value in changes[name]
+                    if json.dumps(value, sort_keys=True) not in known
+                ]
+            if name == "links" and removed and isinstance(values, list):
+                values = [
+                    link
+                    for link in values
+                    if link.get("sourceId") not in removed
+                    and link.get("destinationId") not in removed
+                ]
+            return values
+
+        with open(
+            path_builder(folder, f"{file_name}.tmp"),
+            mode="w+",
+            encoding=encoding,
+        ) as file:
+            sections = []
+            # the top level values only found in ``delta`` are written in
+            # their sorted place.
+            pending = sorted(name for name in changes if name not in names)
+
+            def section(name: str) -> None:
+                """Writes the name of a top level value."""
+                file.write(
+                    ("," if sections else "")
+                    + "\n    "
+                    + json.dumps(name)
+                    + ": "
+                )
+                sections.append(name)
+
+            def write_pending(before: Optional[str]) -> None:
+                """Writes the top level values which are only in ``delta``
+                and sort before ``before``."""
+                while pending and (before is None or pending[0] < before):
+                    name = pending.pop(0)
+                    section(name)
+                    file.write(dump(changes[name], 1))
+
+            file.write("{")
+            projects = fields = issues = 0
+            for event in Projects.read_json_export(
+                folder, file_name, encoding=encoding
+            ):
+                kind, index = event[0], event[1]
+                if kind == "section":
+                    write_pending(index)
+                    section(index)
+                    file.write(dump(merge(index, event[2]), 1))
+                elif kind == "projects":
+                    write_pending("projects")
+                    section("projects")
+                    file.write("[")
+                elif kind == "project":
+                    file.write(
+                        ("," if projects else "") + "\n" + " " * 8 + "{"
+                    )
+                    fields = 0
+                elif kind in ("field", "issues"):
+                    file.write(
+                        ("," if fields else "")
+                        + "\n"
+                        + " " * 12
+                        + json.dumps(event[2] if kind == "field" else kind)
+                        + ": "
+                    )
+                    fields += 1
+                    if kind == "field":
+                        file.write(dump(event[3], 3))
+                    else:
+                        file.write("[")
+                        issues = 0
+                elif kind in ("issue", "issues_end"):
+                    for issue in (
+                        [event[2]]
+                        if kind == "issue"
+                        else new_issues.get(project_keys.get(index), [])
+                    ):
+                        if issue.get("key") in removed:
+                            continue
+                        file.write(
+                            ("," if issues else "")
+                            + "\n"
+                            + " " * 16
+                            + dump(changed.get(issue.get("key"), issue), 4)
+                        )
+                        issues += 1
+                    if kind == "issues_end":
+                        file.write("\n" + " " * 12 + "]" if issues else "]")
+                elif kind == "end":
+                    file.write("\n" + " " * 8 + "}")
+                    projects += 1
+                elif kind == "projects_end":
+                    for project in new_projects:
+                        file.write(
+                            ("," if projects else "")
+                            + "\n"
+                            + " " * 8
+                            + dump(project, 2)
+                        )
+                        projects += 1
+                    file.write("\n    ]" if projects else "]")
+            write_pending(None)
+            file.write("\n}")
+        os.replace(
+            path_builder(folder, f"{file_name}.tmp"),
+            path_builder(folder, file_name),
+        )
+
     @staticmethod
     def export_issues(
         *,
@@ -2917,6 +3507,13 @@ class Projects:
                      PROJECT.export_issues(jql=jql, extension="json",
                      workers=workers)
 
+                  The CSV pages of the export are also downloaded by
+                  ``workers`` threads at once.
+
+                  * retries: Datatype (int) The number of times a CSV page
+                  of the export is attempted again when its download fails
+                  with a server or connection error. Defaults to 3
+
                   * is_sd_internal: Datatype (bool) Ability to add additional
                   properties to a JSON comment export for JSM projects.
                   This argument expects that a comment field column must include
@@ -3086,6 +3683,50 @@ class Projects:
                   * show_export_link - Datatype(bool) Ability to print out
                   the export file link after it completes. Defaults to True
 
+                  * incremental - Datatype(bool) Ability to only export the
+                  issues updated since the last export of the same JQL to
+                  the same ``final_file`` on this instance. The first run
+                  exports every issue, later runs export the changed issues
+                  and patch them into the previous output. The watermark,
+                  the latest ``updated`` date and the exported issue keys,
+                  is kept in the ``watermark_file``. Only the issues of the
+                  JQL updated since the watermark are searched, an issue
+                  which no longer matches the JQL, e.g. a deleted issue,
+                  stays in the output until a run with ``prune``.
+
+                  Example::
+
+                     # previous statements
+                     PROJECT.export_issues(jql=jql, extension="csv",
+                     incremental=True)
+
+                  * watermark_file - Datatype(str) Name of the JSON file,
+                  in the ``folder``, which stores the watermarks of the
+                  incremental exports. Defaults to "export_watermark.json"
+
+                  * compact - Datatype(bool) Used with ``incremental``.
+                  When True (the default), the changed issues replace their
+                  previous rows in the ``final_file``, together with any
+                  delta file or removed issue left by earlier runs. A JSON
+                  ``final_file`` is read one issue at a time. When False,
+                  the changed issues are written to a separate delta file
+                  named after the ``final_file`` e.g.
+                  "final_file_delta_1.csv", to be compacted by a later run.
+
+                  * prune - Datatype(bool) Used with ``incremental``. When
+                  True, the key of every issue of the JQL is searched, and
+                  the issues which no longer match it are removed from the
+                  ``final_file``. This search pages through the whole JQL,
+                  about as many requests as the first export, while a run
+                  without it only searches the changed issues. Defaults to
+                  False, use it on an occasional run e.g. once a week.
+
+                  Example::
+
+                     # previous statements
+                     PROJECT.export_issues(jql=jql, extension="csv",
+                     incremental=True, prune=True)
+
 
         .. versionchanged:: 0.7.4
 
@@ -3161,6 +3802,24 @@ class Projects:
 
         show_export_link: Allows the ability to print out the exported file link
 
+        .. versionchanged:: 0.9.5
+
+        workers: Threads now run on a bounded pool which is joined once the
+        work is done. ``timeout`` and ``flush`` are kept for backward
+        compatibility and no longer delay the export. The CSV pages are
+        downloaded concurrently by ``workers`` threads.
+
+        retries: The number of attempts of a failed CSV page download.
+
+        incremental: Exports only the issues updated since the last export.
+
+        watermark_file: The file storing the incremental export watermarks.
+
+        compact: Patches the changed issues into the previous export.
+
+        prune: Removes the issues which no longer match the JQL from an
+        incremental export.
+
         :return: None
         :raises: IndexError, AttributeError, KeyError, TypeError, ValueError,
                  JiraOneErrors
@@ -3172,7 +3831,8 @@ class Projects:
         from jiraone.utils import (
             DotNotation,
             CUSTOM_FIELD_REGEX,
-            process_executor,
+            BoundedExecutor,
+            SubTaskIndex,
             DateFormat as Df,
             INWARD_ISSUE_LINK,
             OUTWARD_ISSUE_LINK,
@@ -3192,9 +3852,6 @@ class Projects:
         )
         import shutil
         import random
-        from time import (
-            sleep,
-        )
 
         valid_kwargs = {
             "folder": "folder",
@@ -3230,11 +3887,267 @@ class Projects:
             "show_export_link": "show_export_link",
             "date_format": "date_format",
             "check_auth": "check_auth",
+            "retries": "retries",
+            "incremental": "incremental",
+            "watermark_file": "watermark_file",
+            "compact": "compact",
+            "prune": "prune",
         }
         # validate the keyword arguments passed to the functions
         for name_keys in kwargs:
             validate_argument_name(name_keys, valid_kwargs)
 
+        if kwargs.pop("incremental", False) is True:
+
+            def export_delta() -> None:
+                """Exports the issues updated since the last watermark and
+                patches them into the previous export.
+
+                :return: None
+                """
+                import hashlib
+                import math
+                import re
+                from datetime import timezone
+
+                if page is not None or "merge_files" in kwargs or (
+                    "csv_to_json" in kwargs
+                ):
+                    raise JiraOneErrors(
+                        "wrong",
+                        "The `incremental` argument cannot be used with the "
+                        "`page`, `merge_files` or `csv_to_json` arguments.",
+                    )
+                validate_on_error(
+                    jql,
+                    (
+                        str,
+                        "jql",
+                        "a string",
+                    ),
+                    "a string of a valid JQL",
+                )
+                watermark_file = kwargs.pop(
+                    "watermark_file", "export_watermark.json"
+                )
+                compact: bool = kwargs.pop("compact", True)
+                prune: bool = kwargs.pop("prune", False)
+                ext = kwargs.get("extension", "csv").lower()
+                encoding = kwargs.get("encoding", "utf-8")
+                delimit = kwargs.get("delimit") or ","
+                if ext == "csv" and (
+                    "Issue key" in (kwargs.get("exclude_fields") or [])
+                    or (
+                        kwargs.get("include_fields")
+                        and "Issue key" not in kwargs["include_fields"]
+                    )
+                ):
+                    raise JiraOneErrors(
+                        "wrong",
+                        'The `incremental` argument needs the "Issue key" '
+                        "column to match the changed issues, add it to the "
+                        "`include_fields` or remove it from the "
+                        "`exclude_fields` argument.",
+                    )
+                output = kwargs.get("final_file", "final_file.csv")
+                stem = output[: -len(f".{ext}")] if output.endswith(
+                    f".{ext}"
+                ) else output
+                output = f"{stem}.{ext}"
+                watermark_path = path_builder(folder, watermark_file)
+                watermarks = {}
+                if os.path.isfile(watermark_path):
+                    with open(watermark_path, encoding="utf-8") as f:
+                        watermarks = json.load(f)
+                token = hashlib.sha1(
+                    f"{LOGIN.base_url}|{jql}|{output}".encode("utf-8")
+                ).hexdigest()
+                state = watermarks.get(token)
+                if state is not None and not os.path.isfile(
+                    path_builder(folder, output)
+                ):
+                    print("The previous export is missing, exporting again.")
+                    state = None
+
+                def parse_date(value: str) -> datetime:
+                    """Parses a Jira timestamp e.g.
+                    2024-01-31T10:15:00.000+0000"""
+                    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+                search_jql = jql
+                if state is not None:
+                    # a relative date does not depend on the timezone of
+                    # the user, a few minutes are added for clock skew.
+                    minutes = math.ceil(
+                        (
+                            datetime.now(timezone.utc)
+                            - parse_date(state["updated"])
+                        ).total_seconds()
+                        / 60
+                    ) + 5
+                    query, *order = re.split(
+                        r"\s*(?=\border\s+by\b)",
+                        jql,
+                        maxsplit=1,
+                        flags=re.IGNORECASE,
+                    )
+                    search_jql = " ".join(
+                        [
+                            f'({query}) AND updated >= "-{minutes}m"'
+                            if query.strip()
+                            else f'updated >= "-{minutes}m"'
+                        ]
+                        + order
+                    )
+                # the watermark is read before the export, so an issue
+                # updated while exporting is exported again next time. The
+                # first run exports everything, it starts from the time
+                # the export began instead of searching the dates first.
+                started = datetime.now(timezone.utc)
+                current, updated = None, {}
+                if state is not None and prune is True:
+                    # every key of the JQL is searched, an issue which
+                    # left the result set since the last export is removed
+                    # when the export is compacted.
+                    cutoff = started - timedelta(minutes=minutes)
+                    current = set()
+                    for issue in LOGIN.iter_shards(
+                        jql, fields=["updated"]
+                    ).issues():
+                        current.add(issue["key"])
+                        date = (issue.get("fields") or {}).get("updated")
+                        if date and parse_date(date) >= cutoff:
+                            updated[issue["key"]] = date
+                    state["removed"] = sorted(
+                        set(state.get("removed", []))
+                        .union(set(state.get("keys", [])) - current)
+                        .difference(current)
+                    )
+                elif state is not None:
+                    # only the issues updated since the watermark are
+                    # searched.
+                    for issue in LOGIN.iter_issues(
+                        search_jql, fields=["updated"]
+                    ):
+                        updated[issue["key"]] = (
+                            issue.get("fields") or {}
+                        ).get("updated")
+                if state is not None and not updated and not state["removed"]:
+                    print("No issue has been updated since the last export.")
+                    return
+                dates = [parse_date(date) for date in updated.values() if date]
+                target_file = None
+                if state is None:
+                    state = {
+                        "instance": LOGIN.base_url,
+                        "jql": jql,
+                        "file": output,
+                        "keys": [],
+                        "removed": [],
+                        "deltas": [],
+                    }
+                    target_file = output
+                elif updated:
+                    state["count"] = state.get("count", 0) + 1
+                    target_file = f"{stem}_delta_{state['count']}.{ext}"
+                    state["deltas"].append(target_file)
+                    print(
+                        "Exporting {} issue(s) updated since {}".format(
+                            len(updated), state["updated"]
+                        )
+                    )
+                if target_file is not None:
+                    export_kwargs = dict(kwargs, final_file=target_file)
+                    PROJECT.export_issues(
+                        folder=folder, jql=search_jql, **export_kwargs
+                    )
+                if dates:
+                    latest = max(dates)
+                    if "updated" not in state or latest > parse_date(
+                        state["updated"]
+                    ):
+                        state["updated"] = latest.strftime(
+                            "%Y-%m-%dT%H:%M:%S.000%z"
+                        )
+                state.setdefault(
+                    "updated", started.strftime("%Y-%m-%dT%H:%M:%S.000%z")
+                )
+
+                def exported_keys(name: str) -> set:
+                    """Reads the issue keys of an export."""
+                    if ext != "csv":
+                        return {
+                            event[2].get("key")
+                            for event in Projects.read_json_export(
+                                folder, name, encoding=encoding
+                            )
+                            if event[0] == "issue"
+                        }
+                    rows = file_reader(
+                        folder, name, stream=True,
+                        delimiter=delimit, encoding=encoding,
+                    )
+                    header = next(rows, [])
+                    if "Issue key" not in header:
+                        raise JiraOneErrors(
+                            "value",
+                            f'{name} has no "Issue key" column, the '
+                            "incremental export cannot match its issues.",
+                        )
+                    key_at = header.index("Issue key")
+                    return {row[key_at] for row in rows if row}
+
+                # the issue keys of the export are kept with the watermark,
+                # a pruning run compares them to the keys of the JQL.
+                keys = set(state["keys"]) if current is None else current
+                if target_file is not None:
+                    keys.update(exported_keys(target_file))
+                state["keys"] = sorted(keys)
+                state["removed"] = sorted(set(state.get("removed", [])) - keys)
+                if compact is True and (state["deltas"] or state["removed"]):
+                    removed = set(state["removed"])
+                    if removed:
+                        print(
+                            "Removing {} issue(s) which no longer match the "
+                            "JQL from {}".format(len(removed), output)
+                        )
+                    for delta in state["deltas"] or [None]:
+                        if delta is not None:
+                            print(f"Compacting {delta} into {output}")
+                        if ext == "csv":
+                            Projects.compact_csv(
+                                folder,
+                                output,
+                                delta,
+                                removed,
+                                encoding=encoding,
+                                delimit=delimit,
+                            )
+                        else:
+                            Projects.compact_json(
+                                folder,
+                                output,
+                                delta,
+                                removed,
+                                encoding=encoding,
+                            )
+                        if delta is not None:
+                            os.remove(path_builder(folder, delta))
+                    state["deltas"], state["removed"] = [], []
+                watermarks[token] = state
+                with open(watermark_path, mode="w+", encoding="utf-8") as f:
+                    json.dump(watermarks, f, indent=4)
+                add_log(
+                    "Incremental export of {} completed, the watermark "
+                    "is {}".format(
+                        f"{len(updated)} issue(s)" if updated else "every issue",
+                        state["updated"],
+                    ),
+                    "info",
+                )
+
+            return export_delta()
+
         check_auth: bool = (
             kwargs["check_auth"] if "check_auth" in kwargs else True
         )
@@ -3303,6 +4216,7 @@ class Projects:
         )
 
         workers: int = kwargs["workers"] if "workers" in kwargs else 4
+        retries: int = kwargs["retries"] if "retries" in kwargs else 3
         is_sd_internal: bool = (
             kwargs["is_sd_internal"] if "is_sd_internal" in kwargs else False
         )
@@ -3468,12 +4382,9 @@ class Projects:
                             _data = mapper.get("name")
                             config["map_list"].add(_data)
 
-                    for item_field in param_field:
-                        process_executor(
-                            map_field,
-                            data=item_field,
-                            workers=1,
-                        )
+                    with BoundedExecutor(workers=workers) as pool:
+                        for item_field in param_field:
+                            pool.submit(map_field, item_field)
 
                     for check_field in param_field:
                         if check_field not in config["map_list"]:
@@ -4113,69 +5024,119 @@ class Projects:
         file_deposit = []
 
         def download_csv() -> None:
-            """Generate a CSV file from JQL"""
-            nonlocal init
-            while True:
-                if init >= limiter:
-                    break
-                file_name = temp_file.split(".")[0] + f"_{init}.csv"
-                issues = (
-                    LOGIN.get(
-                        endpoint.issue_export(
-                            jql,
-                            init,
-                        )
+            """Generate a CSV file from JQL
+
+            .. versionchanged:: 0.9.5
+
+            The pages are downloaded concurrently by ``workers`` threads and
+            streamed to their temp file. A page which fails is attempted
+            again up to ``retries`` times.
+            """
+            import codecs
+            import time
+            import requests
+
+            last_page = int((limiter - 1) / 1000)
+
+            def download_page(offset: int) -> tuple:
+                """Streams a page of the CSV export to its temp file.
+
+                :param offset: The start counter of the page
+
+                :return: The name of the temp file and the response
+                """
+                file_name = temp_file.split(".")[0] + f"_{offset}.csv"
+                export_url = (
+                    endpoint.issue_export(
+                        jql,
+                        offset,
                     )
                     if field_type.lower() == "all"
-                    else LOGIN.get(
-                        endpoint.issue_export(
-                            jql,
-                            init,
-                            fields="current",
-                        )
+                    else endpoint.issue_export(
+                        jql,
+                        offset,
+                        fields="current",
                     )
                 )
-                print(
-                    issues,
-                    issues.reason,
-                    "::downloading issues at page: " f"{int(init / 1000)}",
-                    "of {}".format(int((limiter - 1) / 1000)),
-                ) if show_export_link is True else ""
-                file_writer(
-                    folder,
-                    file_name,
-                    content=issues.content.decode(
-                        encoding,
-                        errors=errors,
-                    ),
-                    mark="file",
-                    mode="w+",
-                )
-                # create a direct link to the new file
-                # ensure that there's a unique list as the names are different.
-                if file_name not in file_deposit:
-                    file_deposit.append(file_name)
-                config.update({"exports": file_deposit})
-                init += 1000
+                attempt = 0
+                while True:
+                    # a connection error raised while a page is streamed
+                    # is retried the same way as a server error
+                    retry = True
+                    try:
+                        with LOGIN.get(export_url, stream=True) as issues:
+                            if issues.status_code < 300:
+                                decoder = codecs.getincrementaldecoder(
+                                    encoding
+                                )(errors=errors)
+                                with open(
+                                    path_builder(folder, file_name),
+                                    "w+",
+                                    encoding=encoding,
+                                    errors=errors,
+                                ) as file:
+                                    for chunk in issues.iter_content(
+                                        chunk_size=65536
+                                    ):
+                                        file.write(decoder.decode(chunk))
+                                    file.write(decoder.decode(b"", True))
+                                add_log(f"Writing to file {file_name}", "info")
+                                return file_name, issues
+                            reason = "{} {}".format(
+                                issues.status_code, issues.reason
+                            )
+                            retry = issues.status_code >= 500
+                    except requests.exceptions.RequestException as error:
+                        reason = error
+                    # drop a page which was partly written
+                    if os.path.isfile(path_builder(folder, file_name)):
+                        os.remove(path_builder(folder, file_name))
+                    attempt += 1
+                    # the transport already retried rate limited responses,
+                    # so only server and connection errors are retried here.
+                    if retry is False or attempt > retries:
+                        add_log(
+                            "Downloading the export page {} failed with "
+                            '"{}".'.format(int(offset / 1000), reason),
+                            "error",
+                        )
+                        raise JiraOneErrors(
+                            "value",
+                            "The export page {} cannot be downloaded, "
+                            "we've attempted it {} times".format(
+                                int(offset / 1000), attempt
+                            ),
+                        )
+                    time.sleep(
+                        LOGIN.rate_limiter.backoff(attempt)
+                        if LOGIN.rate_limiter is not None
+                        else attempt
+                    )
+
+            # the results are yielded in page order, so the temp files are
+            # merged in the same order as a sequential download.
+            with BoundedExecutor(workers=workers) as pool:
+                for offset, (file_name, issues) in zip(
+                    range(init, limiter, 1000),
+                    pool.map(download_page, range(init, limiter, 1000)),
+                ):
+                    print(
+                        issues,
+                        issues.reason,
+                        "::downloading issues at page: "
+                        f"{int(offset / 1000)}",
+                        "of {}".format(last_page),
+                    ) if show_export_link is True else ""
+                    # ensure that there's a unique list as the names are
+                    # different.
+                    if file_name not in file_deposit:
+                        file_deposit.append(file_name)
+            config.update({"exports": file_deposit})
 
         download_csv() if not merge_files else config.update(
             {"exports": merge_files}
         )
 
-        (
-            config["prev_list"],
-            config["next_list"],
-            config["set_headers_main"],
-            config["make_file"],
-            config["set_file"],
-        ) = (
-            [],
-            [],
-            [],
-            [],
-            [],
-        )
-
         config["is_valid"] = False
         (
             sprint_custom_id,
@@ -4243,611 +5204,71 @@ class Projects:
             return config[key_search[0]][key_search[1]]
 
         # Get an index of all columns within the first file
-        # Then use it across other files in the list
-        def data_frame(
-            files_: str = None,
-            activate: bool = True,
-            poll: list = None,
-            **kwargs,
-        ) -> None:
-            """Check each column width of each CSV file,
-            get the name of the column and index number
-            which can be called with `config["headers"]`.
-
-            :param files_: A name to files
-
-            :param activate: A validator
-
-            :param poll: A poll data link, usually a list of items
-
-            :param kwargs: Additional arguments which can be supplied
-
-            :return: None
-            """
-            columns = (
-                file_reader(
-                    folder,
-                    files_,
-                    **kwargs,
-                )
-                if activate is True
-                else poll
-            )
-            (
-                column_count,
-                config["headers"],
-            ) = (
-                0,
-                [],
-            )
-            for column_ in columns:
-                each_col_count = 0
-                for each_col in column_:
-                    # define the name and index of each column
-                    value = {
-                        "column_name": each_col,
-                        "column_index": each_col_count,
-                    }
-                    config["headers"].append(value)
-                    each_col_count += 1
-                column_count += 1
-                if column_count == 1:
-                    break
-
-        file_path_directory = config["exports"]
-        # build headers
-        (
-            column_headers,
-            headers,
-            max_col_length,
-        ) = (
-            [],
-            {},
-            0,
-        )
-
-        def write_files(
-            files_: str,
-            push: list = None,
-        ) -> None:
-            """Creates the header file.
-
-            :param files_: The name to the file
-
-            :param push: Holds a list of iterable data
-
-            :return: None
-            """
-
-            # create a temp csv file with the header of the export
-
-            def create_file(
-                **kwargs,
-            ) -> None:
-                """
-                Create multiple files or data points.
-
-                :param kwargs: Additional supplied arguments
-                :return: None
-                """
-
-                nonlocal max_col_length, headers, column_headers
-                data_frame(**kwargs) if push is not None else data_frame(files_)
-                (
-                    column_headers,
-                    headers,
-                    max_col_length,
-                ) = (
-                    [],
-                    DotNotation(value=config["headers"]),
-                    0,
-                )
-                for header in headers.value:
-                    column_headers.append(header.column_name)
-                    max_col_length += 1
-
-            def make_file(
-                modes: str,
-                data: list,
-            ) -> None:
-                """Writes a list into a File<->like object.
-
-                :param modes: A writing mode indicator
-
-                :param data: A data of items, usually a List[list]
-
-                :return: None
-                """
-                file_writer(
-                    folder,
-                    temp_file,
-                    data=data,
-                    mark="many",
-                    mode=modes,
-                )
-
-            def make_headers_mark() -> None:
-                """Make and compare headers then recreate a new header.
-                Mostly mutates the config<>object
-
-                :return: None
-                """
-                # This should contain the data of the next column
-                config["next_list"] = column_headers
-                create_file(
-                    activate=False,
-                    poll=copy_temp_read,
-                )
-                # Because of the above, the column_headers should differ
-                # It should contain the previous data and header
-                config["prev_list"] = column_headers
-
-                def column_check(
-                    first_list: list,
-                    second_list: list,
-                    _count_: int = 0,
-                ) -> None:
-                    """Determine and defines the column headers.
-
-                    :param first_list: A list of the previous headers
-
-                    :param second_list: A list of the next headers
-
-                    :param _count_: An iteration counter
-
-                    :return: None
-                    """
-
-                    def column_populate(
-                        name_of_field: str = None,
-                        ticker: int = None,
-                    ) -> None:
-                        """Receives a column count list with index.
-                        which are inserted and arranged properly
-                        into a new headers list.
-
-                        :param name_of_field: The name of a column
-
-                        :param ticker: An iteration counter of each
-                        element in the headers
-
-                        :return: None
-                        """
-                        config["set_headers_main"].insert(
-                            ticker,
-                            name_of_field,
-                        )
-
-                    def determine_value(
-                        value: str,
-                    ) -> int:
-                        """Determines how the headers of two files
-                        are merged. By taking which ever file has
-                        more element in the headers.
-                        If the column name is on multiple columns, just
-                        suggest that name as a new column in the new
-                        header.
-
-                        :param value: A string value of a column name
-
-                        :return: None
-                        """
-                        next_occurrence = config["next_list"].count(value)
-                        prior_occurrence = config["prev_list"].count(value)
-                        _plus_value = None
-                        if next_occurrence > prior_occurrence:
-                            _plus_value = prior_occurrence
-                        elif prior_occurrence > next_occurrence:
-                            _plus_value = next_occurrence
-                        else:
-                            _plus_value = prior_occurrence
-                        _main_value = (
-                            int(abs(next_occurrence - prior_occurrence))
-                            + _plus_value
-                        )
-                        return _main_value
-
-                    def call_column(
-                        items: list,
-                    ) -> None:
-                        """Populate a new column to the list
-                        by determining how many exist from the
-                        previous and next headers.
-
-                        :param items: A list of elements, mostly
-                        header's item
-
-                        :return: None
-                        """
-                        nonlocal _count_
-
-                        check_value = config["set_headers_main"]
-                        for col_list in items:
-                            value_id = determine_value(col_list)
-                            check = config["set_headers_main"].count(col_list)
-
-                            if col_list not in check_value:
-                                column_populate(
-                                    col_list,
-                                    _count_,
-                                )
-                            elif col_list in check_value and check < value_id:
-                                column_populate(
-                                    col_list,
-                                    _count_,
-                                )
-                            _count_ += 1
-                        _count_ = 0
-
-                    # do a loop through the first columns
-                    call_column(first_list)
-                    # call the 2nd column after the first
-                    call_column(second_list)
-                    # Why call `call_column` twice instead of recursion?
-                    # - That would mean creating more variables with 2-3
-                    # - lines of additional codes. It's simpler this way.
-
-                column_check(
-                    config["prev_list"],
-                    config["next_list"],
-                )
-
-                def populate_column_data(
-                    column_data: list,
-                    attr: bool = False,
-                ) -> list:
-                    """Tries and populate each rows
-                    By first getting the headers and the rows beneath it
-                    then adding the value of the column by rows.
-                    The logic below is a complete accurate
-                    1:1 addition of column=>row mechanism of a flattened
-                    file structure into a dictionary structure.
-
-                    :param column_data: The header column data to be
-                    processed
-
-                    :param attr: A conditional attribute used to determine
-                    logic
-
-                    :return: List, usually a list of new elements with
-                    corresponding data.
-                    """
-
-                    header_choice = (
-                        config["prev_list"]
-                        if attr is False
-                        else config["next_list"]
-                    )
-
-                    def load_count(
-                        my_list: list,
-                        conf: list,
-                    ) -> list:
-                        """Loads a list into a dictionary of
-                        values arranged by their column name.
-
-                        :param my_list: A list of elements
-
-                        :param conf: A new list to return
-
-                        :return: List
-
-                        """
-                        nums = 0
-                        for main in my_list:
-                            props = {
-                                "column_index": nums,
-                                "column_name": main,
-                                "column_data": [],
-                            }
-                            conf.append(props)
-                            nums += 1
-                        return conf
-
-                    (
-                        pre_config,
-                        after_config,
-                    ) = (
-                        [],
-                        [],
-                    )
-                    my_value = load_count(
-                        config["set_headers_main"],
-                        pre_config,
-                    )
-                    other_value = load_count(
-                        header_choice,
-                        after_config,
-                    )
-                    # run a loop through the data and assign each value
-                    # to their appropriate header
-
-                    locking = deepcopy(header_choice)
-                    read_lock = len(locking)
-                    (
-                        box_item,
-                        box_count,
-                    ) = (
-                        0,
-                        deepcopy(column_data),
-                    )
-                    iter_count = len(box_count)
-                    for items in column_data:
-                        if box_item >= iter_count:
-                            break
-                        my_item = 0
-                        for (
-                            that_row,
-                            inner_item,
-                        ) in zip(
-                            other_value,
-                            items,
-                        ):
-                            if my_item >= read_lock:
-                                break
-                            # select everything from first row to last row
-                            if that_row["column_index"] == my_item:
-                                that_row["column_data"].append(inner_item)
-                            my_item += 1
-                        box_item += 1
-
-                    # Now we have a mapping of all data,the way they should be
-                    # But we need to transfer that data to `my_value` variable
-                    keep_track = set()  # used to keep track of multiple column
-
-                    def bind_us() -> list:
-                        """This helps to align the rows to columns
-
-                        :return: List
-                        """
-
-                        # where the values are
-                        for new_row in other_value:
-                            # where we need the values to be
-                            check_name = locking.count(new_row["column_name"])
-                            for this_row in my_value:
-                                if check_name == 1:
-                                    if (
-                                        this_row["column_name"]
-                                        == new_row["column_name"]
-                                    ):
-                                        this_row["column_data"] = new_row[
-                                            "column_data"
-                                        ]
-                                        break
-                                elif check_name > 1:
-                                    if (
-                                        this_row["column_name"]
-                                        == new_row["column_name"]
-                                    ):
-                                        if (
-                                            this_row["column_index"]
-                                            not in keep_track
-                                        ):
-                                            keep_track.add(
-                                                this_row["column_index"]
-                                            )
-                                            this_row["column_data"] = new_row[
-                                                "column_data"
-                                            ]
-                                            break
-                                        else:
-                                            continue
-
-                        return my_value
-
-                    bind_us()
-                    lock = deepcopy(my_value)
-                    (
-                        get_range,
-                        index,
-                    ) = (
-                        0,
-                        0,
-                    )
-                    for i in lock:
-                        # Use the first index field as a basis to determine
-                        # The length of the dataset.
-                        if i["column_index"] == index:
-                            get_range = len(i["column_data"])
-                    block = get_range
-                    # Adding a null value to each empty cell
-                    # This way, if we read it, we know we won't
-                    # Get an index error due to variable length
-                    for this_item in my_value:
-                        value_ = len(this_item["column_data"])
-                        if value_ == 0:
-                            runner = 0
-                            for i in range(block):
-                                if runner >= block:
-                                    break
-                                data = None
-                                this_item["column_data"].append(data)
-                                runner += 1
-
-                    return my_value
-
-                def data_provision(
-                    make_item: list,
-                    attr: bool = False,
-                ) -> None:
-                    """Add the column data into a list.
-                    Here we split the header and the data into
-                    columns for [headers] -> vertical view
-                    rows for [data] -> horizontal view
-
-                    HEADER + HEADER +   HEADER  +      HEADER +
-                     ------+--------+-----------+-------------+
-                       A   +   B    +      C    +       D     +
-                     ------+--------+-----------+-------------+
-                       E   +   F    +      G    +       H     +
-                     ------+--------+-----------+-------------+
-                       I   +   J    +      K    +       L     +
-                     ------+--------+-----------+-------------+
-
-                    Each element in a list of data is assumed a 1
-                    value in a row then each row is skipped for the
-                    next item in the iteration.
-                    While the next item is assumed as next column
-                    The same step is repeated in the loop until the
-                    steps, are exhausted.
-
-                    :param make_item: A list of element containing the
-                    CSV data items
-
-                    :param attr: A conditional logic flow
-
-                    :return: None
-                    """
-                    # checks the headers and maps the data
-                    # to the headers
-                    cook_item = populate_column_data(
-                        make_item,
-                        attr,
-                    )
-                    look_up = DotNotation(value=cook_item)
-                    stop_loop = 0
-                    _limit_copy = deepcopy(config["set_headers_main"])
-                    _limit = len(_limit_copy)
-                    (
-                        inner_stop,
-                        finish_loop,
-                    ) = {
-                        "num": 0
-                    }, len([row for row in make_item])
-                    # The below adds the values as they are gotten
-                    # from a dictionary object
-                    while True:
-                        if stop_loop >= finish_loop:
-                            break
-                        for _item in range(_limit):
-                            if inner_stop["num"] >= _limit:
-                                inner_stop.update({"num": 0})
-                                break
-                            for find_item in look_up.value:
-                                if inner_stop["num"] >= _limit:
-                                    break
-                                for _names in [
-                                    config["set_headers_main"][
-                                        inner_stop["num"]
-                                    ]
-                                ]:
-                                    if find_item.column_name == _names:
-                                        data_brick = find_item.column_data[
-                                            stop_loop
-                                        ]
-                                        config["set_file"].append(data_brick)
-                                        inner_stop["num"] += 1
-                                        break
-
-                        mutate = deepcopy(config["set_file"])
-                        config["make_file"].append(mutate)
-                        config["set_file"].clear()
-                        stop_loop += 1
-
-                    look_up.clear()  # clear all used list items from memory
+        # Then use it across other files in the list
+        def data_frame(
+            files_: str = None,
+            activate: bool = True,
+            poll: list = None,
+            **kwargs,
+        ) -> None:
+            """Check each column width of each CSV file,
+            get the name of the column and index number
+            which can be called with `config["headers"]`.
 
-                # populate the first list with prev data
-                del copy_temp_read[0]  # remove the headers
-                data_provision(
-                    copy_temp_read,
-                    attr=False,
-                )
-                # populate the second list with current data
-                del push[0]  # remove the headers
-                data_provision(
-                    push,
-                    attr=True,
-                )
-                # Why call `data_provision` twice instead of recursion?
-                # - That would mean creating more variables and 2-3 lines of
-                # - additional codes. It's simpler this way.
+            :param files_: A name to files
 
-            create_file(files_=files_)
-            if push is not None:
-                # This denotes the current temp_file
-                copy_temp_read = file_reader(
-                    folder,
-                    temp_file,
-                )
-                make_headers_mark()
-                # This should construct the next CSV file headers
-                make_file(
-                    "w+",
-                    [config["set_headers_main"]],
-                )
-                # `push` contains the next data_list to be written
-                make_file(
-                    "a+",
-                    config["make_file"],
-                )
-            # clear all the previous values stored in memory
-            column_headers.clear()
-            config["set_headers_main"].clear()
-            config["make_file"].clear()
+            :param activate: A validator
 
-        payload = []
-        length = max_col_length  # keep track of the column width
+            :param poll: A poll data link, usually a list of items
 
-        def merging_files() -> None:
-            """Merge each files and populate it into one file.
+            :param kwargs: Additional arguments which can be supplied
 
             :return: None
             """
+            # only the header row is read from a file
+            columns = (
+                file_reader(
+                    folder,
+                    files_,
+                    stream=True,
+                    **kwargs,
+                )
+                if activate is True
+                else poll
+            )
             (
-                iteration,
-                progress,
+                column_count,
+                config["headers"],
             ) = (
                 0,
-                0,
+                [],
             )
-            for files in file_path_directory:
-                current_value = len(file_path_directory)
-                (
-                    read_original,
-                    start_,
-                ) = (
-                    file_reader(
-                        folder,
-                        files,
-                    ),
-                    0,
-                )
-                copy_read = deepcopy(read_original)
-                table_length = len([row for row in copy_read])
-                for column in read_original:
-                    # break out of loop once we reach the end of the file
-                    if start_ == table_length:
-                        break
-                    payload.append(column)
-                    start_ += 1
-                if iteration == 0:
-                    # write the headers only
-                    write_files(files_=files)
-                    # add the content into the temp file and populate the rows
-                    file_writer(
-                        folder,
-                        temp_file,
-                        data=payload,
-                        mark="many",
-                        mode="a+",
-                    )
-                else:
-                    # process the next list of files here
-                    write_files(
-                        files_=files,
-                        push=payload,
-                    )
-                payload.clear()
-                iteration += 1
-                progress += 1
-                current_progress = 100 * progress / current_value
-                print(
-                    "Processing. "
-                    "Current progress: {}%".format(int(current_progress))
-                )
+            for column_ in columns:
+                each_col_count = 0
+                for each_col in column_:
+                    # define the name and index of each column
+                    value = {
+                        "column_name": each_col,
+                        "column_index": each_col_count,
+                    }
+                    config["headers"].append(value)
+                    each_col_count += 1
+                column_count += 1
+                if column_count == 1:
+                    break
+            if activate is True:
+                columns.close()
+
+        file_path_directory = config["exports"]
 
-        merging_files()  # loop through each file and attempt combination
+        # loop through each file and attempt combination
+        Projects.merge_csv_files(
+            file_path_directory,
+            folder,
+            temp_file,
+            encoding=encoding,
+            errors=errors,
+        )
 
         if active is True:
             # TODO: Remove this block of code in future or refactor it
@@ -4915,6 +5336,7 @@ class Projects:
             for header in headers.value:
                 column_headers.append(header.column_name)
                 max_col_length += 1
+            length = max_col_length  # keep track of the column width
 
             def populate(
                 name: str,
@@ -5383,14 +5805,13 @@ class Projects:
             :return: None
             """
 
-            for our_field_name in header_names:
-                process_executor(
-                    float_fields,
-                    data=our_field_name,
-                    workers=workers,
-                    timeout=timeout,
-                    regex_pattern=CUSTOM_FIELD_REGEX,
-                )
+            with BoundedExecutor(workers=workers) as pool:
+                for our_field_name in header_names:
+                    pool.submit(
+                        float_fields,
+                        our_field_name,
+                        regex_pattern=CUSTOM_FIELD_REGEX,
+                    )
 
             if is_cache is True:
                 caching(
@@ -5416,6 +5837,7 @@ class Projects:
                 folder,
                 temp_file,
                 skip=True,
+                stream=True,
             )
             file_headers = []
             print(
@@ -5541,47 +5963,44 @@ class Projects:
             )
             if _search_.status_code < 300:
                 _search_results_ = _search_.json()["issues"]
-                for keys in _search_results_:
-                    if "key" in keys:
-                        key_ = keys["key"]
-                        _search_issue = LOGIN.get(endpoint.issues(key_))
-                        if _search_issue.status_code < 300:
-                            _issue_results_ = _search_issue.json()["fields"]
-                            sprint_field = _issue_results_[
-                                sprint_custom_id["id"]
-                            ]
-                            if isinstance(sprint_field, list):
-                                for sprint_item_ in sprint_field:
-                                    if (
+                for _search_issue in LOGIN.iter_bulk_issues(
+                    [keys.get("key") or keys["id"] for keys in _search_results_],
+                    fields=[sprint_custom_id["id"]],
+                ):
+                    _issue_results_ = _search_issue["fields"]
+                    sprint_field = _issue_results_.get(sprint_custom_id["id"])
+                    if isinstance(sprint_field, list):
+                        for sprint_item_ in sprint_field:
+                            if (
+                                sprint_item_.get("name")
+                                in config["sprint_object_container"]
+                            ):
+                                sprint_data = {
+                                    "name": sprint_item_.get("name"),
+                                    "state": sprint_item_.get("state"),
+                                    "startDate": sprint_item_.get(
+                                        "startDate"
+                                    ),
+                                    "endDate": sprint_item_.get(
+                                        "endDate"
+                                    ),
+                                    "completeDate": sprint_item_.get(
+                                        "completeDate"
+                                    ),
+                                    "rapidViewId": sprint_item_.get(
+                                        "boardId"
+                                    ),
+                                }
+                                if (
+                                    sprint_item_.get("name")
+                                    not in config[
+                                        "sprint_object_container"
+                                    ][sprint_item_.get("name")]
+                                ):
+                                    config["sprint_object_container"][
                                         sprint_item_.get("name")
-                                        in config["sprint_object_container"]
-                                    ):
-                                        sprint_data = {
-                                            "name": sprint_item_.get("name"),
-                                            "state": sprint_item_.get("state"),
-                                            "startDate": sprint_item_.get(
-                                                "startDate"
-                                            ),
-                                            "endDate": sprint_item_.get(
-                                                "endDate"
-                                            ),
-                                            "completeDate": sprint_item_.get(
-                                                "completeDate"
-                                            ),
-                                            "rapidViewId": sprint_item_.get(
-                                                "boardId"
-                                            ),
-                                        }
-                                        if (
-                                            sprint_item_.get("name")
-                                            not in config[
-                                                "sprint_object_container"
-                                            ][sprint_item_.get("name")]
-                                        ):
-                                            config["sprint_object_container"][
-                                                sprint_item_.get("name")
-                                            ].append(sprint_data)
-                                        break
+                                    ].append(sprint_data)
+                                break
 
         def extend_format(
             ext: str = None,
@@ -5617,18 +6036,16 @@ class Projects:
                 elif ext.lower() == "json":
                     if not final_file.endswith(".json"):
                         final_file = final_file + ".json"
-                    json.dump(
-                        config["json_build"],
-                        open(
-                            path_builder(
-                                folder,
-                                final_file,
-                            ),
-                            mode="w+",
-                            encoding=encoding,
+                    # the JSON export is streamed to a temp file
+                    os.replace(
+                        path_builder(
+                            folder,
+                            f"{temp_file}.json",
+                        ),
+                        path_builder(
+                            folder,
+                            final_file,
                         ),
-                        indent=4,
-                        sort_keys=True,
                     )
                 os.remove(
                     path_builder(
@@ -5686,13 +6103,9 @@ class Projects:
                         _user_data_ = user_export.json()
                         if not _user_data_:
                             break
-                        for _user_item_ in _user_data_:
-                            process_executor(
-                                export_users,
-                                data=_user_item_,
-                                workers=workers,
-                                timeout=timeout,
-                            )
+                        with BoundedExecutor(workers=workers) as pool:
+                            for _user_item_ in _user_data_:
+                                pool.submit(export_users, _user_item_)
                     else:
                         break
                     _start += _max_result_
@@ -5932,11 +6345,6 @@ class Projects:
                         "col_name_index",
                     ],
                 )
-                read_csv_file = file_reader(
-                    folder,
-                    temp_file,
-                    skip=True,
-                )
                 # generate a user list
                 print(
                     "Verifying users membership"
@@ -5951,6 +6359,31 @@ class Projects:
                 else:
                     user_extraction()
 
+                # index the users once, by display name, which can be
+                # shared by several users, and by account id. An unknown
+                # display name is not looked up by account id.
+                (
+                    config["user_name_index"],
+                    config["user_id_index"],
+                ) = (
+                    {},
+                    {},
+                )
+                for _user_names_ in config["json_userlist"]:
+                    _profile_data_ = {
+                        "account_id": _user_names_["account_id"],
+                        "display_name": _user_names_["display_name"],
+                        "active": _user_names_["active"],
+                        "groups": _user_names_["groups"],
+                        "email": _user_names_.get("email"),
+                    }
+                    config["user_name_index"].setdefault(
+                        _user_names_["display_name"], []
+                    ).append(_profile_data_)
+                    config["user_id_index"].setdefault(
+                        _user_names_["account_id"], _profile_data_
+                    )
+
                 if "links" in config["json_props_options"]:
                     print("Verifying linked issues from issuelink types")
                     for links in config["headers"]:
@@ -5961,9 +6394,24 @@ class Projects:
                         )
 
                 print("Verifying Sprint values.")
-                get_sprint_obj = deepcopy(read_csv_file)
-
-                for sprint_item in get_sprint_obj:
+                # the project keys are collected in the same pass
+                (
+                    project_keys,
+                    issue_count,
+                ) = (
+                    {},
+                    0,
+                )
+                for sprint_item in file_reader(
+                    folder,
+                    temp_file,
+                    skip=True,
+                    stream=True,
+                ):
+                    issue_count += 1
+                    project_keys.setdefault(
+                        sprint_item[config["save_point"]["col_name_index"]]
+                    )
                     for sub_sprint in config["sprint_data"]["col_name_index"]:
                         if sprint_item[sub_sprint]:
                             config["sprint_object_container"].update(
@@ -5981,35 +6429,25 @@ class Projects:
                     """
                     Returns an account_id or userid of a User object
 
+                    .. versionchanged:: 0.9.5
+
+                    The user is looked up in an index instead of the user
+                    list.
+
                     :param user_value: Convert a display name to acceptable
                                         username or accountId
 
                     :return: dict
                     """
 
-                    (
-                        _user_value_list,
-                        _profile_data_,
-                    ) = (
-                        [],
-                        None,
+                    _user_value_list = config["user_name_index"].get(
+                        user_value
                     )
-                    for _user_names_ in config["json_userlist"]:
-                        if user_value == _user_names_["display_name"]:
-                            _profile_data_ = {
-                                "account_id": _user_names_["account_id"],
-                                "display_name": _user_names_["display_name"],
-                                "active": _user_names_["active"],
-                                "groups": _user_names_["groups"],
-                                "email": _user_names_.get("email"),
-                            }
-                            _user_value_list.append(_profile_data_)
-
                     if not _user_value_list:
                         return {"account_id": None}
                     elif len(_user_value_list) == 1:
-                        return _profile_data_
-                    elif len(_user_value_list) > 1:
+                        return _user_value_list[0]
+                    else:
                         # Since we're finding these users by display name
                         # if multiple users with the same name exist, we want to
                         # take a calculated guess but this is not accurate
@@ -6017,28 +6455,107 @@ class Projects:
                         guess = random.choices(
                             _user_value_list,
                             [
-                                float(_user_value_list.index(each_user) + 0.5)
-                                for each_user in _user_value_list
+                                float(each_user + 0.5)
+                                for each_user in range(len(_user_value_list))
                             ],
                         )
                         return guess[0]
 
                 print("Extracting Sprint Ids from values.")
                 print("Searching for Sprint data")
-                for (
-                    sprint_key,
-                    sprint_val,
-                ) in config["sprint_object_container"].items():
-                    process_executor(
-                        search_sprints,
-                        data=sprint_key,
-                        workers=2,
-                        timeout=timeout,
-                    )
+                with BoundedExecutor(workers=2) as pool:
+                    for (
+                        sprint_key,
+                        sprint_val,
+                    ) in config["sprint_object_container"].items():
+                        pool.submit(search_sprints, sprint_key)
 
                 project_settings = {}
                 project_config = {}
 
+                def project_catalog(
+                    _project_keys_: str,
+                ) -> tuple:
+                    """
+                    Fetches the versions and components of a project
+
+                    :param _project_keys_: A project key
+                    :return: A tuple of the versions and components
+                    """
+                    (
+                        cf_versions,
+                        cf_components,
+                    ) = {
+                        "versions": []
+                    }, {"components": []}
+                    get_versions = LOGIN.get(
+                        endpoint.get_project_versions(id_or_key=_project_keys_)
+                    )
+                    get_components = LOGIN.get(
+                        endpoint.get_project_component(id_or_key=_project_keys_)
+                    )
+                    if get_versions.status_code < 300:
+                        for version in get_versions.json():
+                            _data = {
+                                "name": version.get(
+                                    "name",
+                                    "",
+                                ),
+                                "released": version.get(
+                                    "released",
+                                    "",
+                                ),
+                                "releaseDate": version.get(
+                                    "releaseDate",
+                                    "",
+                                ),
+                            }
+                            cf_versions["versions"].append(_data)
+                    if get_components.status_code < 300:
+                        for component in get_components.json():
+                            _data = {
+                                "name": component.get(
+                                    "name",
+                                    "",
+                                ),
+                                "description": component.get(
+                                    "description",
+                                    "",
+                                ),
+                            }
+                            if "lead" in component:
+                                lead = component.get("lead").get("accountId")
+                                if lead is not None:
+                                    _data["lead"] = lead
+                            cf_components["components"].append(_data)
+                    return cf_versions, cf_components
+
+                # The versions and components of every project in the export
+                # are fetched once and at the same time, before the issues
+                # are converted. The cache only lives for this export.
+                print("Fetching project versions and components")
+                with BoundedExecutor(workers=workers) as pool:
+                    project_cache = dict(
+                        zip(
+                            project_keys,
+                            pool.map(project_catalog, project_keys),
+                        )
+                    )
+                # each project was already fetched once, at its first row,
+                # so the requests run at the same time but none is saved.
+                add_log(
+                    "Fetched the versions and components of {} project(s) "
+                    "for {} issue(s) with {} concurrent requests. Fetching "
+                    "them at the first row of each project takes {} "
+                    "requests as well, so none are saved".format(
+                        len(project_keys),
+                        issue_count,
+                        2 * len(project_keys),
+                        2 * len(project_keys),
+                    ),
+                    "info",
+                )
+
                 def field_builder(
                     bundle: list = None,
                     col_name: list = None,
@@ -6527,76 +7044,13 @@ class Projects:
                                 )
                                 project_settings.update(my_bundle)
                                 project_config.update(my_bundle_index)
-                                (
-                                    cf_versions,
-                                    cf_components,
-                                ) = {
-                                    "versions": []
-                                }, {"components": []}
                                 _project_keys_ = bundle[
                                     config["save_point"]["col_name_index"]
                                 ]
-                                get_versions = LOGIN.get(
-                                    endpoint.get_project_versions(
-                                        id_or_key=_project_keys_
-                                    )
-                                )
-                                get_components = LOGIN.get(
-                                    endpoint.get_project_component(
-                                        id_or_key=_project_keys_
-                                    )
-                                )
-                                if get_versions.status_code < 300:
-                                    for version in get_versions.json():
-                                        _data = {
-                                            "name": version.get(
-                                                "name",
-                                                "",
-                                            ),
-                                            "released": version.get(
-                                                "released",
-                                                "",
-                                            ),
-                                            "releaseDate": version.get(
-                                                "releaseDate",
-                                                "",
-                                            ),
-                                        }
-                                        cf_versions["versions"].append(_data)
-                                if get_components.status_code < 300:
-                                    for component in get_components.json():
-                                        lead = None
-                                        if "lead" in component:
-                                            lead = component.get("lead").get(
-                                                "accountId"
-                                            )
-                                        _data = (
-                                            {
-                                                "name": component.get(
-                                                    "name",
-                                                    "",
-                                                ),
-                                                "description": component.get(
-                                                    "description",
-                                                    "",
-                                                ),
-                                            }
-                                            if lead is None
-                                            else {
-                                                "name": component.get(
-                                                    "name",
-                                                    "",
-                                                ),
-                                                "description": component.get(
-                                                    "description",
-                                                    "",
-                                                ),
-                                                "lead": lead,
-                                            }
-                                        )
-                                        cf_components["components"].append(
-                                            _data
-                                        )
+                                (
+                                    cf_versions,
+                                    cf_components,
+                                ) = project_cache[_project_keys_]
 
                                 issue_temp.update(
                                     {
@@ -7075,222 +7529,341 @@ class Projects:
                         project_index = project_config[
                             bundle[config["save_point"]["col_name_index"]]
                         ]
-                        json_project_template["projects"][project_index][
-                            "issues"
-                        ].append(issue_data)
+                        # only the offset of the issue in the sidecar file
+                        # is kept, the issue is read back when the export
+                        # is written.
+                        issue_offsets.setdefault(project_index, []).append(
+                            issue_store.tell()
+                        )
+                        issue_store.write(
+                            json.dumps(issue_data).encode("utf-8") + b"\n"
+                        )
+                        sub_task_index.add(project_index, issue_data)
 
                     start_process()
 
                 my_index = -1
-                # Begin the JSON conversion process
-                print("JSON conversion started.")
+                # The converted issues are written to a sidecar file one at
+                # a time, so the memory used does not grow with the export.
+                issue_offsets, sub_task_index = {}, SubTaskIndex(sub_tasks)
+                sidecar = path_builder(
+                    folder,
+                    f"{temp_file}.issues",
+                )
                 try:
-                    for name_of_fields in read_csv_file:
-                        field_builder(
-                            name_of_fields,
-                            config["headers"],
-                        )
-                except (
-                    IndexError,
-                    KeyError,
-                    TypeError,
-                    AttributeError,
-                    ValueError,
-                    JiraOneErrors,
-                ) as err:
-                    os.remove(
-                        path_builder(
-                            folder,
-                            temp_file,
-                        )
-                    )
-                    add_log(
-                        f"{err} on line {err.__traceback__.tb_lineno}"
-                        f" with {err.__traceback__} "
-                        f"{sys.__excepthook__(Exception, err, err.__traceback__)}",
-                        "error",
-                    )
-                    exit(f"An error has occurred: {err}")
+                    with open(sidecar, mode="w+b") as issue_store:
+                        # Begin the JSON conversion process
+                        print("JSON conversion started.")
+                        try:
+                            for name_of_fields in file_reader(
+                                folder,
+                                temp_file,
+                                skip=True,
+                                stream=True,
+                            ):
+                                field_builder(
+                                    name_of_fields,
+                                    config["headers"],
+                                )
+                        except (
+                            IndexError,
+                            KeyError,
+                            TypeError,
+                            AttributeError,
+                            ValueError,
+                            JiraOneErrors,
+                        ) as err:
+                            os.remove(
+                                path_builder(
+                                    folder,
+                                    temp_file,
+                                )
+                            )
+                            add_log(
+                                f"{err} on line {err.__traceback__.tb_lineno}"
+                                f" with {err.__traceback__} "
+                                f"{sys.__excepthook__(Exception, err, err.__traceback__)}",
+                                "error",
+                            )
+                            exit(f"An error has occurred: {err}")
 
-                config["json_build"].update(json_project_template)
+                        config["json_build"].update(json_project_template)
 
-                def parse_history_data(
-                    history_key: str,
-                ) -> None:
-                    """
-                    Parse some history payload and process
-                    some object with list of items about the
-                    history
+                        def parse_history_data(
+                            history_key: str,
+                        ) -> None:
+                            """
+                            Parse some history payload and process
+                            some object with list of items about the
+                            history
 
-                    :param history_key: A Jira issue key
-                    :return: None
-                    """
-                    query = f"key = {history_key}"
-                    history_folder = f"{folder}/history"
-                    history_file = f"history_{history_key}.csv"
-                    PROJECT.change_log(
-                        folder=history_folder,
-                        allow_cp=False,
-                        file=history_file,
-                        jql=query,
-                        show_output=False,
-                    )
-                    read_history = file_reader(
-                        history_folder,
-                        history_file,
-                        skip=True,
-                    )
-                    history_data = []
-                    for _history_ in read_history:
-                        name_mapper = {
-                            "issueKey": _history_[0],
-                            "summary": _history_[1],
-                            "author": _history_[2],
-                            "created": _history_[3],
-                            "fieldType": _history_[4],
-                            "field": _history_[5],
-                            "fieldId": _history_[6],
-                            "from_": _history_[7],
-                            "fromString": _history_[8],
-                            "to_": _history_[9],
-                            "toString": _history_[10],
-                        }
-                        mapped = DotNotation(name_mapper)
-                        _history_data_ = {
-                            "author": name_to_user_id(mapped.author).get(
-                                "account_id"
-                            ),
-                            "created": mapped.created,
-                            "items": [
+                            :param history_key: A Jira issue key
+                            :return: None
+                            """
+                            query = f"key = {history_key}"
+                            history_folder = f"{folder}/history"
+                            history_file = f"history_{history_key}.csv"
+                            PROJECT.change_log(
+                                folder=history_folder,
+                                allow_cp=False,
+                                file=history_file,
+                                jql=query,
+                                show_output=False,
+                            )
+                            read_history = file_reader(
+                                history_folder,
+                                history_file,
+                                skip=True,
+                                stream=True,
+                            )
+                            history_data = []
+                            for _history_ in read_history:
+                                name_mapper = {
+                                    "issueKey": _history_[0],
+                                    "summary": _history_[1],
+                                    "author": _history_[2],
+                                    "created": _history_[3],
+                                    "fieldType": _history_[4],
+                                    "field": _history_[5],
+                                    "fieldId": _history_[6],
+                                    "from_": _history_[7],
+                                    "fromString": _history_[8],
+                                    "to_": _history_[9],
+                                    "toString": _history_[10],
+                                }
+                                mapped = DotNotation(name_mapper)
+                                _history_data_ = {
+                                    "author": name_to_user_id(mapped.author).get(
+                                        "account_id"
+                                    ),
+                                    "created": mapped.created,
+                                    "items": [
+                                        {
+                                            "fieldType": mapped.fieldType,
+                                            "field": mapped.field,
+                                            "from": mapped.from_ or None,
+                                            "fromString": mapped.fromString or None,
+                                            "to": mapped.to_ or None,
+                                            "toString": mapped.toString or None,
+                                        }
+                                    ],
+                                }
+                                history_data.append(_history_data_)
+
+                            json_history_template["history"].append(
                                 {
-                                    "fieldType": mapped.fieldType,
-                                    "field": mapped.field,
-                                    "from": mapped.from_ or None,
-                                    "fromString": mapped.fromString or None,
-                                    "to": mapped.to_ or None,
-                                    "toString": mapped.toString or None,
+                                    "key": history_key,
+                                    "value": history_data,
                                 }
-                            ],
-                        }
-                        history_data.append(_history_data_)
+                            )
 
-                    json_history_template["history"].append(
-                        {
-                            "key": history_key,
-                            "value": history_data,
-                        }
-                    )
+                            os.remove(
+                                path_builder(
+                                    history_folder,
+                                    history_file,
+                                )
+                            )
 
-                    os.remove(
-                        path_builder(
-                            history_folder,
-                            history_file,
+                        # adjust sub-task link, the parent id is resolved through
+                        # the index filled while the issues were converted.
+                        json_linked_issues_template["links"].extend(
+                            sub_task_index.links()
                         )
-                    )
 
-                # adjust sub-task link
-                def run_multi_check(
-                    parent_key: str,
-                ) -> str:
-                    """
-                    Run a search on the json build object until
-                    you can find a parent issue, if not return
-                    empty string
+                        if json_properties:
+                            if "links" in config["json_props_options"]:
+                                print("Adding linked issues to the export")
+
+                                config["json_build"].update(json_linked_issues_template)
+
+                            if "users" in config["json_props_options"]:
+                                print("Updating users and group to the export")
+
+                                def get_groups(
+                                    user_data: dict,
+                                ) -> None:
+                                    """Process the group extraction"""
+                                    usernames = {
+                                        "name": user_data.get("account_id"),
+                                        "fullname": user_data.get("display_name"),
+                                        "active": user_data.get("active"),
+                                        "groups": export_groups(
+                                            user_data.get("account_id")
+                                        ),
+                                        "email": user_data.get("email"),
+                                    }
+                                    json_user_template["users"].append(usernames)
+
+                                with BoundedExecutor(workers=workers) as pool:
+                                    for names_of_users in config["json_userlist"]:
+                                        pool.submit(get_groups, names_of_users)
+
+                                config["user_data_group"].update(
+                                    {"users": json_user_template["users"]}
+                                )
+                                config["json_build"].update(config["user_data_group"])
 
-                    :param parent_key: An issue number
-                    :return: str
-                    """
-                    for some_issue in config["json_build"]["projects"]:
-                        another_issue = some_issue["issues"]
-                        for now_issue in another_issue:
-                            now_id = now_issue.get("id")
-                            now_issue_key = now_issue.get("key")
-                            if parent_key == now_id:
-                                return now_issue_key
-                    return ""
-
-                for sub_task_check in config["json_build"]["projects"]:
-                    issues = sub_task_check["issues"]
-                    for issue in issues:
-                        if issue.get("issueType") in sub_tasks:
-                            get_parent = issue.get("parent")
-                            get_sub_task_key = issue.get("key")
-                            linked_parent = run_multi_check(get_parent)
-                            json_linked_issues_template["links"].append(
-                                {
-                                    "name": "jira_subtask_link",
-                                    "destinationId": get_sub_task_key,
-                                    "sourceId": linked_parent,
+                        def add_history(
+                            all_issues: list,
+                        ) -> None:
+                            """
+                            Adds the change history to a batch of issues
+
+                            :param all_issues: A list of issues
+                            :return: None
+                            """
+                            if LOGIN.api is True and all(
+                                history.get("id") for history in all_issues
+                            ):
+                                # one bulk request per 1000 issues on Jira Cloud
+                                for history, (_, histories) in zip(
+                                    all_issues,
+                                    LOGIN.iter_changelogs(
+                                        [history.get("id") for history in all_issues]
+                                    ),
+                                ):
+                                    history["history"] = [
+                                        {
+                                            "author": name_to_user_id(
+                                                (past.get("author") or {}).get(
+                                                    "displayName"
+                                                )
+                                            ).get("account_id"),
+                                            "created": past.get("created"),
+                                            "items": [
+                                                {
+                                                    "fieldType": item.get("fieldtype"),
+                                                    "field": item.get("field"),
+                                                    "from": item.get("from") or None,
+                                                    "fromString": item.get(
+                                                        "fromString"
+                                                    )
+                                                    or None,
+                                                    "to": item.get("to") or None,
+                                                    "toString": item.get("toString")
+                                                    or None,
+                                                }
+                                            ],
+                                        }
+                                        for past in histories
+                                        for item in past.get("items") or []
+                                    ]
+                            else:
+                                with BoundedExecutor(workers=workers) as pool:
+                                    for history in all_issues:
+                                        pool.submit(
+                                            parse_history_data, history.get("key")
+                                        )
+                                sub_histories = {
+                                    sub_history.get("key"): sub_history.get("value")
+                                    for sub_history in json_history_template["history"]
                                 }
-                            )
+                                json_history_template["history"].clear()
+                                for history in all_issues:
+                                    if history.get("key") in sub_histories:
+                                        history["history"] = sub_histories[
+                                            history.get("key")
+                                        ]
 
-                if json_properties:
-                    if "links" in config["json_props_options"]:
-                        print("Adding linked issues to the export")
+                        def write_export() -> None:
+                            """
+                            Writes the JSON export into a temp file, the issues
+                            are read back from the sidecar file in batches. The
+                            output is the same as ``json.dump`` with an indent of
+                            4 and sorted keys.
 
-                        config["json_build"].update(json_linked_issues_template)
+                            :return: None
+                            """
+                            allow_history = bool(json_properties) and (
+                                "history" in config["json_props_options"]
+                            )
+                            if allow_history:
+                                print("Extracting change history from issues")
 
-                    if "users" in config["json_props_options"]:
-                        print("Updating users and group to the export")
+                            dump = Projects.dump_json
 
-                        def get_groups(
-                            user_data: dict,
-                        ) -> None:
-                            """Process the group extraction"""
-                            usernames = {
-                                "name": user_data.get("account_id"),
-                                "fullname": user_data.get("display_name"),
-                                "active": user_data.get("active"),
-                                "groups": export_groups(
-                                    user_data.get("account_id")
-                                ),
-                                "email": user_data.get("email"),
-                            }
-                            json_user_template["users"].append(usernames)
-
-                        for names_of_users in config["json_userlist"]:
-                            process_executor(
-                                get_groups,
-                                data=names_of_users,
-                                workers=workers,
-                                timeout=timeout,
-                            )
+                            def write_issues(
+                                file: Any,
+                                offsets: list,
+                            ) -> None:
+                                """Writes the issues of a project."""
+                                if not offsets:
+                                    file.write("[]")
+                                    return
+                                file.write("[")
+                                for step in range(0, len(offsets), 1000):
+                                    batch = []
+                                    for offset in offsets[step : step + 1000]:
+                                        issue_store.seek(offset)
+                                        batch.append(
+                                            json.loads(issue_store.readline())
+                                        )
+                                    if allow_history:
+                                        add_history(batch)
+                                    for position, issue in enumerate(batch):
+                                        file.write(
+                                            ("," if step or position else "")
+                                            + "\n"
+                                            + " " * 16
+                                            + dump(issue, 4)
+                                        )
+                                file.write("\n" + " " * 12 + "]")
 
-                        config["user_data_group"].update(
-                            {"users": json_user_template["users"]}
-                        )
-                        config["json_build"].update(config["user_data_group"])
-
-                    if "history" in config["json_props_options"]:
-                        print("Extracting change history from issues")
-
-                        for search_history in config["json_build"]["projects"]:
-                            issue_history = search_history["issues"]
-                            for history in issue_history:
-                                key = history.get("key")
-                                process_executor(
-                                    parse_history_data,
-                                    data=key,
-                                    workers=workers,
-                                    timeout=timeout,
-                                )
+                            with open(
+                                path_builder(
+                                    folder,
+                                    f"{temp_file}.json",
+                                ),
+                                mode="w+",
+                                encoding=encoding,
+                            ) as file:
+                                file.write("{")
+                                for count, name in enumerate(
+                                    sorted(config["json_build"])
+                                ):
+                                    file.write(
+                                        ("," if count else "")
+                                        + "\n    "
+                                        + json.dumps(name)
+                                        + ": "
+                                    )
+                                    projects = config["json_build"][name]
+                                    if name != "projects" or not projects:
+                                        file.write(dump(projects, 1))
+                                        continue
+                                    file.write("[")
+                                    for project_index, project in enumerate(projects):
+                                        file.write(
+                                            ("," if project_index else "")
+                                            + "\n"
+                                            + " " * 8
+                                            + "{"
+                                        )
+                                        for number, key in enumerate(sorted(project)):
+                                            file.write(
+                                                ("," if number else "")
+                                                + "\n"
+                                                + " " * 12
+                                                + json.dumps(key)
+                                                + ": "
+                                            )
+                                            if key == "issues":
+                                                write_issues(
+                                                    file,
+                                                    issue_offsets.get(
+                                                        project_index, []
+                                                    ),
+                                                )
+                                            else:
+                                                file.write(dump(project[key], 3))
+                                        file.write("\n" + " " * 8 + "}")
+                                    file.write("\n    ]")
+                                file.write("\n}")
 
-                        print("Appending historic data into JSON structure")
-                        # If there are any running threads, let's wait for
-                        # their shutdown
-                        sleep(flush)
-
-                        for search_history in config["json_build"]["projects"]:
-                            issue_history = search_history["issues"]
-                            for history in issue_history:
-                                key = history.get("key")
-                                for sub_history in json_history_template[
-                                    "history"
-                                ]:
-                                    sub_key = sub_history.get("key")
-                                    sub_value = sub_history.get("value")
-                                    if key == sub_key:
-                                        history["history"] = sub_value
+                        write_export()
+                finally:
+                    if os.path.isfile(sidecar):
+                        os.remove(sidecar)
 
                 print("Clearing temporary configuration data")
                 project_settings.clear()
@@ -7447,40 +8020,33 @@ class Projects:
                     "wrong",
                     "Invalid data structure " "received. " "Expected a string.",
                 )
-        (
-            total,
-            validate_query,
-        ) = (
-            0,
-            LOGIN.get(endpoint.search_issues_jql(jql)
-                      if LOGIN.api is False else
-                      endpoint.search_cloud_issues(jql)
-                      ),
+        # a single issue is enough to validate the query
+        validate_query = LOGIN.iter_pages(
+            jql,
+            fields=["key"],
+            page_size=1,
+            prefetch=False,
         )
-        if validate_query.status_code < 300:
-            if LOGIN.api is False:
-                total = validate_query.json()["total"]
-            elif LOGIN.api is True:
-                total = LOGIN.post(
-                endpoint.search_issue_count(), payload={
-                    "jql": jql
-                }
-            ).json()["count"]
-        else:
-            add_log(
-                "Invalid JQL query received. Reason {} with status code: "
-                "{} and addition info: {}".format(
-                    validate_query.reason,
-                    validate_query.status_code,
-                    validate_query.json(),
-                ),
-                "debug",
-            )
+        try:
+            next(iter(validate_query))
+        except JiraOneErrors:
+            # only a rejected query is reported as invalid, server and
+            # connection errors are raised as they are.
+            if validate_query.status_code != 400:
+                raise
             raise JiraOneErrors(
                 "value",
                 "Your JQL query seems to be invalid"
                 " as no issues were returned.",
             )
+        if LOGIN.api is False:
+            total = validate_query.total
+        else:
+            total = LOGIN.post(
+                endpoint.search_issue_count(), payload={
+                    "jql": jql
+                }
+            ).json()["count"]
 
         calc = int(total / 1000)
         value = {
@@ -7687,26 +8253,24 @@ class Users:
         reader = file_reader(
             file_name=file_name,
             folder=group_folder,
+            stream=True,
             **kwargs,
         )
-        for user in reader:
-            account_id = user[0]
-            display_name = user[2]
-            active_status = user[3]
-            load = LOGIN.get(endpoint.get_user_group(account_id))
-            results = json.loads(load.content)
-            get_all = [d["name"] for d in results]
-            raw = [
-                display_name,
-                account_id,
-                get_all,
-                active_status,
-            ]
-            file_writer(
-                folder=group_folder,
-                file_name=group_file_name,
-                data=raw,
-            )
+        with CsvSink(group_folder, group_file_name) as sink:
+            for user in reader:
+                account_id = user[0]
+                display_name = user[2]
+                active_status = user[3]
+                load = LOGIN.get(endpoint.get_user_group(account_id))
+                results = json.loads(load.content)
+                get_all = [d["name"] for d in results]
+                raw = [
+                    display_name,
+                    account_id,
+                    get_all,
+                    active_status,
+                ]
+                sink.writerow(raw)
 
         print(
             "File extraction completed. Your file is located at {}".format(
@@ -7813,6 +8377,7 @@ class Users:
         list_user = file_reader(
             file_name=file,
             folder=folder,
+            stream=True,
             **kwargs,
         )
         checker = []
@@ -7894,7 +8459,8 @@ def path_builder(
         path,
     )
     if not os.path.exists(base_dir):
-        os.makedirs(base_dir)
+        # another thread may create the folder at the same time
+        os.makedirs(base_dir, exist_ok=True)
         add_log(
             f"Building Path {path}",
             "info",
@@ -7906,6 +8472,143 @@ def path_builder(
     return base_file
 
 
+class CsvSink:
+    """A buffered CSV writer which keeps a single file handle open,
+    instead of opening, writing and closing the file on every row like
+    ``file_writer`` does. Rows are written with the same dialect as
+    ``file_writer``, so both can be used on the same file.
+
+    .. code-block:: python
+
+       from jiraone.reporting import CsvSink
+
+       with CsvSink("Report", "report.csv", mode="w+") as sink:
+           sink.writerow(["Issue key", "Summary"])
+           sink.writerows(rows)
+
+    .. versionadded:: 0.9.5
+    """
+
+    def __init__(
+        self,
+        folder: str = WORK_PATH,
+        file_name: str = None,
+        mode: str = "a+",
+        **kwargs: Any,
+    ) -> None:
+        """
+        Opens the file.
+
+        :param folder: A path to the name of the folder
+
+        :param file_name: The name of the file being created.
+
+        :param mode: File mode, available options [“a”, “w”, “a+”, “w+”],
+                     by default the mode is set to “a+”.
+
+        :param kwargs: Additional parameters
+
+               **options**
+
+               * delimiter: defaults to comma - datatype (strings)
+
+               * encoding: defaults to utf-8 - datatype (strings)
+
+               * errors: defaults to replace - datatype (strings)
+
+               * buffer_size: The size of the write buffer in bytes,
+                 defaults to 1 MiB - datatype (int)
+
+               * flush_every: Flush the buffer to disk once this number of
+                 rows are written, defaults to 10000 - datatype (int)
+
+        :return: None
+        """
+        from platform import (
+            system,
+        )
+        import threading
+
+        self.file_name = file_name
+        self.path = path_builder(
+            path=folder,
+            file_name=file_name,
+        )
+        self.flush_every: int = kwargs.get("flush_every", 10000)
+        self.rows = 0
+        # Bug:fix:JIR-8 on https://github.com/princenyeche/jiraone/issues/89
+        self._file = open(
+            self.path,
+            mode,
+            buffering=kwargs.get("buffer_size", 1024 * 1024),
+            encoding=kwargs.get("encoding", "utf-8"),
+            errors=kwargs.get("errors", "replace"),
+            newline="" if system() == "Windows" else None,
+        )
+        self._writer = csv.writer(
+            self._file,
+            delimiter=kwargs.get("delimiter", ","),
+        )
+        self._lock = threading.Lock()
+
+    def writerow(self, row: Iterable) -> None:
+        """Writes a single row.
+
+        :param row: An iterable data, usually in form of a list.
+
+        :return: None
+        """
+        with self._lock:
+            self._writer.writerow(row)
+            self.rows += 1
+            if self.flush_every and self.rows % self.flush_every == 0:
+                self._file.flush()
+
+    def writerows(self, rows: Iterable[Iterable]) -> None:
+        """Writes multiple rows.
+
+        :param rows: An iterable of rows
+
+        :return: None
+        """
+        rows = list(rows)
+        with self._lock:
+            self._writer.writerows(rows)
+            before, self.rows = self.rows, self.rows + len(rows)
+            if (
+                self.flush_every
+                and self.rows // self.flush_every > before // self.flush_every
+            ):
+                self._file.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered rows to disk.
+
+        :return: None
+        """
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the file.
+
+        :return: None
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+                add_log(
+                    f"Writing {self.rows} rows to file {self.file_name}",
+                    "info",
+                )
+
+    def __enter__(self) -> "CsvSink":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
 def file_writer(
     folder: str = WORK_PATH,
     file_name: str = None,
@@ -8016,6 +8719,105 @@ def file_writer(
             )
 
 
+def iter_rows(
+    folder: str = WORK_PATH,
+    file_name: str = None,
+    skip: bool = False,
+    row_type: str = "list",
+    **kwargs,
+) -> Iterator[Union[List[str], Dict[str, str], Tuple]]:
+    """Reads a CSV file lazily and yields one row at a time.
+
+    Only the row being read is kept in memory, so it can be used on
+    files of any size. The file stays open until the generator is
+    exhausted or closed.
+
+    .. code-block:: python
+
+       from jiraone.reporting import iter_rows
+
+       for row in iter_rows("Report", "history.csv", row_type="dict"):
+           print(row["Issue Key"])
+
+    :param folder: A path to the name of the folder
+
+    :param file_name: The name of the file being read
+
+    :param skip: True allows you to skip the header if the file has any.
+                 Otherwise, defaults to False
+
+    :param row_type: The type of row to yield, available options
+                     ["list", "dict", "namedtuple"]. With "dict" and
+                     "namedtuple" the first row of the file is used as
+                     the header, duplicated or invalid names of a named
+                     tuple are renamed to their position e.g. ``_3``
+
+    :param kwargs: Additional parameters
+
+              **options**
+
+              * encoding: Standard encoding strings. e.g “utf-8”.
+
+              * delimiter: defaults to comma.
+
+              * errors: defaults to replace
+
+    .. versionadded:: 0.9.5
+
+    :return: A generator of rows
+    """
+    from jiraone.exceptions import (
+        JiraOneErrors,
+    )
+
+    if row_type not in ("list", "dict", "namedtuple"):
+        raise JiraOneErrors(
+            "value",
+            f"Expected a row_type of list, dict or namedtuple got {row_type}",
+        )
+    file = path_builder(
+        path=folder,
+        file_name=file_name,
+    )
+    with open(
+        file,
+        "r",
+        encoding=kwargs.get("encoding", "utf-8"),
+        errors=kwargs.get("errors", "replace"),
+        newline="",
+    ) as f:
+        read = csv.reader(
+            f,
+            delimiter=kwargs.get("delimiter", ","),
+        )
+        if row_type == "list":
+            if skip is True:
+                next(read, None)
+            yield from read
+        else:
+            header = next(read, None)
+            if header is not None:
+                width = len(header)
+                row_tuple = namedtuple("Row", header, rename=True)
+                for row in read:
+                    if len(row) > width:
+                        raise JiraOneErrors(
+                            "value",
+                            f"Row {read.line_num} of {file_name} has "
+                            f"{len(row)} columns, the header has {width}",
+                        )
+                    row = row + [None] * (width - len(row))
+                    yield (
+                        dict(zip(header, row))
+                        if row_type == "dict"
+                        else row_tuple._make(row)
+                    )
+    add_log(
+        f"Read file {file_name}",
+        "info",
+    )
+
+
 def file_reader(
     folder: str = WORK_PATH,
     file_name: str = None,
@@ -8047,20 +8849,42 @@ def file_reader(
 
               * errors: defaults to replace
 
+              * stream: True returns a generator of the rows instead of
+                a list, see ``iter_rows``. By default, it is set to False
+
+              * row_type: When streaming, yield each row as a "list",
+                "dict" or "namedtuple". Defaults to "list"
+
 
     .. versionchanged:: 0.7.3
 
     errors - added keyword argument which helps determine how
     encoding and decoding errors are handled
 
+    .. versionchanged:: 0.9.5
+
+    stream - added keyword argument which reads the file lazily
 
-    :return: A list comprehension data or binary data
-    """
-    from platform import (
-        system,
-    )
 
+    :return: A list comprehension data, binary data or a generator of rows
+    """
     content: bool = kwargs.get("content", False)
+    if kwargs.pop("stream", False) is True:
+        from jiraone.exceptions import (
+            JiraOneErrors,
+        )
+
+        if content is True or "b" in mode:
+            raise JiraOneErrors(
+                "value",
+                "A byte file cannot be streamed, use stream=False instead.",
+            )
+        return iter_rows(
+            folder,
+            file_name,
+            skip=skip,
+            **kwargs,
+        )
 
     file = path_builder(
         path=folder,
@@ -8069,6 +8893,8 @@ def file_reader(
     encoding = kwargs["encoding"] if "encoding" in kwargs else "utf-8"
     errors = kwargs["errors"] if "errors" in kwargs else "replace"
     delimiter = kwargs["delimiter"] if "delimiter" in kwargs else ","
+    # the rows are read with the same encoding and newline handling as
+    # ``iter_rows``, so both return the same rows on every platform.
     windows = (
         open(
             file,
@@ -8077,7 +8903,7 @@ def file_reader(
             newline="",
             errors=errors,
         )
-        if system() == "Windows" and content is False
+        if content is False and "b" not in mode
         else open(
             file,
             mode,
@@ -8618,16 +9444,11 @@ def delete_attachments(
 
         :return: None
         """
-        nonlocal attach_load, count, depth, next_count # noqa: F824
+        nonlocal attach_load # noqa: F824
         infinity_point = data_brick["point"]
         issues = items["issues"][data_brick["point"]:]
         attach_load = (
-            data_brick["data_block"] if back_up is True else attach_load
-        )
-        count = (
-            set_up["iter"]
-            if back_up is True and depth == 1
-            else data_brick["iter"]
+            data_brick["data_block"] if resume is True else attach_load
         )
 
         def inf_block(
@@ -8656,11 +9477,18 @@ def delete_attachments(
                 }
             )
 
+        fetched = dict(
+            LOGIN.iter_bulk_issues(
+                [each_issue["key"] for each_issue in issues],
+                fields=["attachment"],
+                with_keys=True,
+            )
+        )
         for each_issue in issues:
             keys = each_issue["key"]
-            _data = LOGIN.get(endpoint.issues(keys))
-            if _data.status_code < 300:
-                attachments = _data.json()["fields"]["attachment"]
+            _data = fetched.get(keys)
+            if _data is not None:
+                attachments = _data["fields"].get("attachment") or []
                 if len(attachments) > 0:
                     for attach in attachments:
                         attach_item = {
@@ -8800,11 +9628,9 @@ def delete_attachments(
     os.close(descriptor) if allow_cp is True else None
     (
         count,
-        cycle,
         step,
         next_count # used for new search API for Jira cloud,
     ) = (
-        0,
         0,
         0,
         None,
@@ -8826,6 +9652,7 @@ def delete_attachments(
         attach_index = []
         temp_reader = file_reader(
             file_name=file,
+            stream=True,
             **kwargs,
         )
         loop = 1
@@ -8841,10 +9668,12 @@ def delete_attachments(
                     attach_index.append(img_index)
             if loop > 1:
                 break
+        temp_reader.close()
 
         reader = file_reader(
             file_name=file,
             skip=True,
+            stream=True,
             **kwargs,
         )
         new_data_form = deque()
@@ -9029,148 +9858,70 @@ def delete_attachments(
             if "status" in set_up and back_up is True
             else "in_progress"
         )
-        depth: int = 1
-        while True:
-            load = (
-                LOGIN.get(
-                    endpoint.search_issues_jql(
-                        query=set_up["query"],
-                        start_at=set_up["iter"],
-                        max_results=100,
-                    ) if LOGIN.api is False else
-                    endpoint.search_cloud_issues(
-                        query=set_up["query"],
-                        next_page=set_up["iters"],
-                        fields=None,
-                        max_results=100,
-                    )
-                )
-                if back_up is True and depth == 1
-                else LOGIN.get(
-                    endpoint.search_issues_jql(
-                        query=query,
-                        start_at=count,
-                        max_results=100,
-                    ) if LOGIN.api is False else
-                    endpoint.search_cloud_issues(
-                        query=query,
-                        next_page=next_count,
-                        fields=None,
-                        max_results=100,
-                    )
-                )
+        if data_brick["status"] == "complete":
+            open_ = json.load(open(data_file)) if allow_cp is True else {}
+            attach_load = (
+                open_["data_block"] if "data_block" in open_ else []
             )
-            if data_brick["status"] == "complete":
-                open_ = json.load(open(data_file)) if allow_cp is True else {}
-                attach_load = (
-                    open_["data_block"] if "data_block" in open_ else []
-                )
-                break
-            if load.status_code < 300:
-                data_ = load.json()
-                cycle = 0
+        else:
+            # only the first page of a search is resumed from a save point
+            resume: bool = back_up
+            pages = LOGIN.iter_pages(
+                set_up["query"] if resume is True else query,
+                fields=["key"],
+                page_size=100,
+                cursor=(
+                    set_up["iter"] if LOGIN.api is False else set_up["iters"]
+                )
+                if resume is True
+                else None,
+            )
+            for data_ in pages:
+                if LOGIN.api is False:
+                    count = pages.cursor
+                else:
+                    next_count = pages.cursor
                 print(
                     "Extracting attachment details on row {}".format(
-                        (set_up["iter"] if LOGIN.api is False else set_up["iters"])
-                        if back_up is True and depth == 1
-                        else (count if LOGIN.api is False else next_count)
+                        pages.cursor
                     )
                 )
                 print("*" * 100)
                 add_log(
                     "Extracting attachment details on row {}".format(
-                        (set_up["iter"] if LOGIN.api is False else set_up["iters"])
-                        if back_up is True and depth == 1
-                        else (count if LOGIN.api is False else next_count)
+                        pages.cursor
                     ),
                     "info",
                 )
                 data_brick.update(
                     {
-                        "iter": set_up["iter"]
-                        if back_up is True and depth == 1
-                        else count,
-                        "iters": set_up["iters"]
-                        if back_up is True and depth == 1
-                        else next_count,
-                        "query": set_up["query"]
-                        if back_up is True and depth == 1
-                        else query,
+                        "iter": count,
+                        "iters": next_count,
+                        "query": pages.jql,
                         "data_block": set_up["data_block"]
-                        if back_up is True and depth == 1
+                        if resume is True
                         else attach_load,
-                        "point": set_up["point"] + 1
-                        if back_up is True and depth == 1
-                        else 0,
+                        "point": set_up["point"] + 1 if resume is True else 0,
                     }
                 )
-                if LOGIN.api is False:
-                    if count > data_["total"]:
-                        data_brick.update({"status": "complete"})
-                        json.dump(
-                            data_brick,
-                            open( # noqa
-                                data_file,
-                                mode="w+",
-                                encoding="utf-8",
-                            ),
-                            indent=4,
-                        ) if allow_cp is True else None
-                        add_log(
-                            "Extraction is completed, "
-                            "deletion of attachments on the next step",
-                            "info",
-                        )
-                        break
-
                 get_attachments(data_)
-                if LOGIN.api is True:
-                    if "nextPageToken" not in data_:
-                        data_brick.update({"status": "complete"})
-                        json.dump(
-                            data_brick,
-                            open( # noqa
-                                data_file,
-                                mode="w+",
-                                encoding="utf-8",
-                            ),
-                            indent=4,
-                        ) if allow_cp is True else None
-                        add_log(
-                            "Extraction is completed, "
-                            "deletion of attachments on the next step",
-                            "info",
-                        )
-                        break
-                next_count = data_.get("nextPageToken", None)
-            count += 100 # if api is False use a different search API
-
-            if back_up is True and depth == 1:
-                data_brick["iter"] = count
-                data_brick["iters"] = next_count
-                back_up = False
-            depth += 2
-            if load.status_code > 300:
-                cycle += 1
-                if cycle > 99:
-                    add_log(
-                        "Trying to search for the issues with "
-                        'query "{}" returned a "{}" '
-                        'error with reason "{}".'.format(
-                            query,
-                            load.status_code,
-                            load.reason,
-                        ),
-                        "error",
-                    )
-                    raise JiraOneErrors(
-                        "value",
-                        'It seems that the search "{}" cannot be '
-                        "retrieved as we've attempted it {} times".format(
-                            query,
-                            cycle,
-                        ),
-                    )
+                resume = False
+
+            data_brick.update({"status": "complete"})
+            json.dump(
+                data_brick,
+                open( # noqa
+                    data_file,
+                    mode="w+",
+                    encoding="utf-8",
+                ),
+                indent=4,
+            ) if allow_cp is True else None
+            add_log(
+                "Extraction is completed, "
+                "deletion of attachments on the next step",
+                "info",
+            )
 
         length = len(attach_load)
         if length > 0:
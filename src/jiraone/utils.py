@@ -5,9 +5,18 @@ This module provides any utility classes or functions that helps to
 provide additional ability to jiraone.
 """
 import typing as t
+import math
 import threading
 import re
-from datetime import datetime as dt, timedelta, timezone
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    FIRST_COMPLETED,
+    wait,
+)
+from array import array
+from datetime import datetime as dt, time as datetime_time, timedelta, timezone
 from jiraone import add_log
 from jiraone.exceptions import JiraOneErrors
 
@@ -120,6 +129,11 @@ def process_executor(
                    the keyword arguments from the function
 
     :return: None
+
+    .. deprecated:: 0.9.5
+
+    The thread started here is never joined deterministically, use
+    :class:`BoundedExecutor` instead.
     """
     process = threading.Thread(target=func, args=(data,), kwargs=kwargs)
     process.start()
@@ -127,6 +141,409 @@ def process_executor(
         process.join(timeout=timeout)
 
 
+class BoundedExecutor:
+    """
+    A bounded thread pool built on ``concurrent.futures.ThreadPoolExecutor``.
+
+    Unlike ``process_executor``, the number of queued tasks is bounded.
+    Once ``queue_size`` tasks are waiting or running, ``submit`` blocks
+    until a worker frees a slot. Results and exceptions of every task
+    are collected, and ``join`` returns only when all the submitted work
+    is done.
+
+    Example 1::
+
+      from jiraone.utils import BoundedExecutor
+
+      with BoundedExecutor(workers=8) as pool:
+          for key in issue_keys:
+              pool.submit(get_issue, key)
+      # the pool is joined here, every task has finished
+      print(pool.results, pool.errors)
+
+    Example 2::
+
+      # yield results as they come, in input order or as completed
+      with BoundedExecutor(workers=8) as pool:
+          for result in pool.map(get_issue, issue_keys, ordered=False):
+              print(result)
+
+    .. versionadded:: 0.9.5
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        *,
+        queue_size: int = None,
+        raise_on_error: bool = False,
+        name: str = "jiraone",
+    ) -> None:
+        """
+        Initializes the thread pool.
+
+        :param workers: Number of worker threads
+
+        :param queue_size: Maximum number of tasks pending or running at
+                           the same time. Defaults to twice the number
+                           of workers.
+
+        :param raise_on_error: If True, ``join`` raises the first exception
+                               raised by a task. Otherwise, exceptions are
+                               logged and kept in ``errors``.
+
+        :param name: A prefix for the worker thread names
+
+        :return: None
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise JiraOneErrors(
+                "value", "The `workers` argument expects an integer above 0."
+            )
+        self.workers = workers
+        self.queue_size = queue_size or workers * 2
+        self.raise_on_error = raise_on_error
+        self.results: list = []
+        self.errors: list = []
+        self._slots = threading.BoundedSemaphore(self.queue_size)
+        self._futures: list = []
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=name
+        )
+
+    def __release__(self, future: Future) -> None:
+        """Frees a queue slot once a task completes or is cancelled."""
+        self._slots.release()
+
+    def __track__(self, func: t.Callable, *args, **kwargs) -> Future:
+        """Submits a task without keeping it for ``join``."""
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(func, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(self.__release__)
+        return future
+
+    def submit(self, func: t.Callable, *args, **kwargs) -> Future:
+        """
+        Schedules ``func(*args, **kwargs)``, blocking while the queue is full.
+
+        :param func: A callable to run in a worker thread
+
+        :param args: Positional arguments for the callable
+
+        :param kwargs: Keyword arguments for the callable
+
+        :return: A Future object
+        """
+        future = self.__track__(func, *args, **kwargs)
+        with self._lock:
+            self._futures.append(future)
+        return future
+
+    def map(
+        self,
+        func: t.Callable,
+        iterable: t.Iterable,
+        *,
+        ordered: bool = True,
+        **kwargs,
+    ) -> t.Iterator:
+        """
+        Runs ``func`` on every item of ``iterable`` and yields the results.
+
+        The iterable is consumed lazily, so at most ``queue_size`` items
+        are in flight. Exceptions raised by a task are re-raised when its
+        result is yielded.
+
+        :param func: A callable that receives each item
+
+        :param iterable: The items to process
+
+        :param ordered: If True, results are yielded in input order.
+                        Otherwise, results are yielded as they complete.
+
+        :param kwargs: Additional keyword arguments passed to ``func``
+
+        :return: An iterator of results
+        """
+        if ordered:
+            pending = deque()
+            for item in iterable:
+                pending.append(self.__track__(func, item, **kwargs))
+                while pending and pending[0].done():
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        else:
+            pending = set()
+            for item in iterable:
+                pending.add(self.__track__(func, item, **kwargs))
+                done = {future for future in pending if future.done()}
+                pending -= done
+                for future in done:
+                    yield future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+    def cancel(self) -> int:
+        """
+        Cancels every submitted task that has not started yet.
+
+        :return: The number of cancelled tasks
+        """
+        with self._lock:
+            futures = list(self._futures)
+        return sum(1 for future in futures if future.cancel())
+
+    def join(self, timeout: t.Union[float, int] = None) -> list:
+        """
+        Waits until every submitted task is done and collects the results.
+
+        :param timeout: The maximum number of seconds to wait. None waits
+                        until all the work is done.
+
+        :return: A list of results in submission order
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+        done, not_done = wait(futures, timeout=timeout)
+        if not_done:
+            with self._lock:
+                self._futures = list(not_done) + self._futures
+            raise JiraOneErrors(
+                "errors",
+                f"{len(not_done)} task(s) are still running after "
+                f"{timeout} seconds.",
+            )
+        results = []
+        for future in futures:
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                self.errors.append(error)
+                add_log(
+                    f"A task in the thread pool failed with {error!r}",
+                    "error",
+                )
+                if self.raise_on_error:
+                    raise error
+                continue
+            results.append(future.result())
+        self.results.extend(results)
+        return results
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """
+        Stops the worker threads.
+
+        :param cancel: If True, pending tasks are cancelled first
+
+        :return: None
+        """
+        if cancel:
+            self.cancel()
+        self._pool.shutdown(wait=True, cancel_futures=cancel)
+
+    def __enter__(self) -> "BoundedExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is not None:
+            self.shutdown(cancel=True)
+            return
+        try:
+            self.join()
+        finally:
+            self.shutdown()
+
+
+class QuantileSketch:
+    """
+    A streaming quantile estimate with a bounded relative error.
+
+    Values are counted in buckets whose bounds grow geometrically by
+    ``(1 + accuracy) / (1 - accuracy)``, so any quantile is returned
+    within ``accuracy`` of its true value. The number of buckets only
+    depends on the range of the values, not on how many are added,
+    which keeps the memory use constant.
+
+    Example::
+
+      from jiraone.utils import QuantileSketch
+
+      sketch = QuantileSketch()
+      for seconds in durations:
+          sketch.add(seconds)
+      print(sketch.quantile(0.5), sketch.quantile(0.99))
+
+    .. versionadded:: 0.9.5
+    """
+
+    def __init__(self, accuracy: float = 0.01) -> None:
+        """
+        Initializes the sketch.
+
+        :param accuracy: The relative error of a quantile, between 0 and 1
+
+        :return: None
+        """
+        if not 0 < accuracy < 1:
+            raise JiraOneErrors(
+                "value",
+                "The `accuracy` argument expects a number between 0 and 1.",
+            )
+        self.accuracy = accuracy
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets: dict = {}
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float) -> None:
+        """Adds a value which is zero or above.
+
+        :param value: A number
+
+        :return: None
+        """
+        if value <= 0:
+            self.zeros += 1
+        else:
+            index = math.ceil(math.log(value) / self.log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Adds the values of a sketch of the same accuracy.
+
+        :param other: A ``QuantileSketch``
+
+        :return: None
+        """
+        if other.gamma != self.gamma:
+            raise JiraOneErrors(
+                "value", "Only sketches of the same accuracy can be merged."
+            )
+        for index, number in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + number
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+        for value in (other.minimum, other.maximum):
+            if value is not None:
+                if self.minimum is None or value < self.minimum:
+                    self.minimum = value
+                if self.maximum is None or value > self.maximum:
+                    self.maximum = value
+
+    def quantile(self, q: float) -> t.Optional[float]:
+        """Returns the estimated value at a quantile.
+
+        :param q: The quantile, between 0 and 1. e.g. 0.9
+
+        :return: A number or None if no value was added
+        """
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if seen > rank:
+            return 0.0
+        value = self.maximum
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                value = 2 * self.gamma ** index / (self.gamma + 1)
+                break
+        return min(max(value, self.minimum), self.maximum)
+
+
+class SubTaskIndex:
+    """
+    Links sub-tasks to their parent issue through an index of issue ids.
+
+    Issues are added one at a time, only the key of each issue id and
+    the (sub-task key, parent id) pairs are kept. The links are then
+    resolved in a single pass, instead of searching every issue for the
+    parent of each sub-task.
+
+    Example::
+
+      from jiraone.utils import SubTaskIndex
+
+      index = SubTaskIndex(["Sub-task"])
+      for project_index, issue in converted_issues:
+          index.add(project_index, issue)
+      links = index.links()
+
+    .. versionadded:: 0.9.5
+    """
+
+    def __init__(self, sub_tasks: list) -> None:
+        """
+        Initializes the index.
+
+        :param sub_tasks: The names of the sub-task issue types
+
+        :return: None
+        """
+        self.sub_tasks = sub_tasks
+        self.keys: dict = {}
+        self.parents: dict = {}
+
+    def add(self, project_index: int, issue: dict) -> None:
+        """Adds an issue of the JSON export, the first issue with an id
+        is the one a sub-task links to.
+
+        :param project_index: The position of the issue's project
+
+        :param issue: An issue with its "id", "key", "issueType" and
+                      "parent"
+
+        :return: None
+        """
+        self.keys.setdefault(issue.get("id"), issue.get("key"))
+        if issue.get("issueType") in self.sub_tasks:
+            self.parents.setdefault(project_index, []).append(
+                (issue.get("key"), issue.get("parent"))
+            )
+
+    def links(self) -> list:
+        """Returns a "jira_subtask_link" link for each sub-task, in the
+        order of the projects. A parent which was not added gives an
+        empty "sourceId".
+
+        :return: A list of links
+        """
+        return [
+            {
+                "name": "jira_subtask_link",
+                "destinationId": sub_task_key,
+                "sourceId": self.keys.get(parent, ""),
+            }
+            for project_index in sorted(self.parents)
+            for sub_task_key, parent in self.parents[project_index]
+        ]
+
+
 # Regular expressions
 CUSTOM_FIELD_REGEX = r"(Custom field).+([\(]{1}.+?[\)]{1})$"
 ISSUE_KEY_REGEX = r"(?:\s|^)([A-Za-z0-9]+-[0-9]+)(?=\s|$)"
@@ -154,6 +571,7 @@ class DateFormat:
     YYYY_MM_dd_HH_MM_SS_MS = "%Y-%m-%d %H:%M:%S.%f"  # YYYY-MM-ddTHH:mm:ss.s
     dd_MM_yy_hh_MM_AM_PM = "%d/%m/%y %I:%M %p"  # dd/MM/yy h:mm AM
     YYYY_MM_dd_T_HH_MM_SS_MS = "%Y-%m-%dT%H:%M:%S.%f"  # YYYY-MM-ddTHH:MM:SS.s
+    YYYY_MM_dd = "%Y-%m-%d"  # YYYY-MM-dd
     MM_dd_yy_space_hh_MM_AM_PM = "%m/%d/%y %I:%M %p"  # MM/dd/yy h:mm AM
     dd_MM_YYYY_space_hh_MM_AM_PM = "%d/%m/%Y %I:%M %p"  # dd/MM/YYYY h:mm AM
     # MMM dd, YYYY h:mm:ss AM
@@ -170,6 +588,248 @@ class DateFormat:
     WD_MMM_dd_YYYY_HH_MM_SS_GMT_TZU = "%a %b %d %Y %H:%M:%S GMT{z} (TIME)"
 
 
+class WorkCalendar:
+    """
+    A working calendar which measures time in working hours only.
+
+    The working hours of every day in a range are worked out once, as
+    instants in UTC, together with a running total of the working time
+    before each day. The working time between two instants is then the
+    difference of two running totals, each found from the day of the
+    instant and its few working periods, so every interval costs the
+    same however long it spans and no datetime object is made for it.
+
+    Example::
+
+      from jiraone.utils import WorkCalendar
+
+      calendar = WorkCalendar(
+          "Europe/Berlin",
+          hours=["09:00-12:00", "13:00-17:00"],
+          holidays=["2024-12-25", "2024-12-26"],
+      )
+      time_in_status(PROJECT, key, file_reader, login=LOGIN,
+                     output_format="csv", calendar=calendar)
+
+    .. versionadded:: 0.9.5
+    """
+
+    day = 86400000000  # a day in microseconds
+    epoch = dt(1970, 1, 1, tzinfo=timezone.utc)
+    microsecond = timedelta(microseconds=1)
+
+    def __init__(
+        self,
+        zone: t.Union[str, t.Any] = None,
+        hours: t.Union[list, dict] = None,
+        workdays: t.Iterable[int] = (0, 1, 2, 3, 4),
+        holidays: t.Iterable[t.Any] = (),
+    ) -> None:
+        """
+        Initializes the calendar.
+
+        :param zone: A timezone name, e.g. "America/New_York", or a tzinfo
+                     object. Defaults to UTC
+
+        :param hours: A list of working periods in the "HH:MM-HH:MM"
+                      format, or a dict of a weekday (0 is Monday) to
+                      its list of working periods.
+                      Defaults to ["09:00-17:00"]
+
+        :param workdays: The weekdays worked when ``hours`` is a list,
+                         0 is Monday. Defaults to Monday to Friday
+
+        :param holidays: Days not worked, either date objects or strings
+                         in the ``DateFormat.YYYY_MM_dd`` format
+
+        :return: None
+        """
+        from datetime import date
+
+        if zone is None or isinstance(zone, str):
+            try:
+                from zoneinfo import ZoneInfo
+
+                zone = timezone.utc if zone is None else ZoneInfo(zone)
+            except (KeyError, ValueError) as err:
+                raise JiraOneErrors(
+                    "value", f"Unknown timezone {zone!r} for the calendar."
+                ) from err
+        self.zone = zone
+        hours = ["09:00-17:00"] if hours is None else hours
+        if not isinstance(hours, dict):
+            hours = {weekday: hours for weekday in workdays}
+        self.hours = {
+            weekday: self.periods(periods)
+            for weekday, periods in hours.items()
+        }
+        self.holidays = {
+            holiday
+            if isinstance(holiday, date)
+            else dt.strptime(holiday, DateFormat.YYYY_MM_dd).date()
+            for holiday in holidays
+        }
+        self.first = None
+        self.day_starts: list = []
+        self.segments: list = []
+        self.totals: list = []
+
+    @staticmethod
+    def periods(periods: t.Iterable[str]) -> t.List[tuple]:
+        """Parse working periods into minutes since midnight.
+
+        :param periods: A list of "HH:MM-HH:MM" strings
+
+        :return: A list of tuples of the start and end minutes
+        """
+        parsed = []
+        for period in periods:
+            try:
+                start, end = [
+                    int(hour) * 60 + int(minute)
+                    for hour, minute in (
+                        value.strip().split(":") for value in period.split("-")
+                    )
+                ]
+            except ValueError as err:
+                raise JiraOneErrors(
+                    "value",
+                    f"Unable to read the working period {period!r}, "
+                    "expecting the HH:MM-HH:MM format.",
+                ) from err
+            if not 0 <= start < end <= 1440:
+                raise JiraOneErrors(
+                    "value", f"The working period {period!r} is not valid."
+                )
+            parsed.append((start, end))
+        parsed.sort()
+        for (_, finish), (begin, _) in zip(parsed, parsed[1:]):
+            if begin < finish:
+                raise JiraOneErrors(
+                    "value", "The working periods of a day must not overlap."
+                )
+        return parsed
+
+    def instant(self, day: t.Any, minutes: int) -> int:
+        """Return the UTC microseconds of a local time of a day.
+
+        :param day: A date object
+
+        :param minutes: Minutes since the local midnight
+
+        :return: An integer
+        """
+        local = dt.combine(day, datetime_time(), tzinfo=self.zone) + timedelta(
+            minutes=minutes
+        )
+        return (local - self.epoch) // self.microsecond
+
+    def prepare(self, start: int, end: int) -> None:
+        """Work out the working periods and running totals of every day
+        between two instants, if they are not already known.
+
+        :param start: UTC microseconds since the epoch
+
+        :param end: UTC microseconds since the epoch
+
+        :return: None
+        """
+        first = (
+            self.epoch + timedelta(microseconds=start - self.day)
+        ).astimezone(self.zone).date()
+        last = (
+            self.epoch + timedelta(microseconds=end + self.day)
+        ).astimezone(self.zone).date()
+        if (
+            self.first is not None
+            and first >= self.first
+            and (last - self.first).days < len(self.day_starts) - 1
+        ):
+            return
+        if self.first is not None:
+            first = min(first, self.first)
+            last = max(
+                last, self.first + timedelta(days=len(self.day_starts) - 1)
+            )
+        day_starts, segments, totals = [], [], [0]
+        for number in range((last - first).days + 2):
+            day = first + timedelta(days=number)
+            day_starts.append(self.instant(day, 0))
+            periods = (
+                []
+                if day in self.holidays
+                else [
+                    (self.instant(day, begin), self.instant(day, finish))
+                    for begin, finish in self.hours.get(day.weekday(), [])
+                ]
+            )
+            segments.append(periods)
+            totals.append(
+                totals[-1] + sum(finish - begin for begin, finish in periods)
+            )
+        self.first = first
+        self.day_starts, self.segments, self.totals = (
+            day_starts,
+            segments,
+            totals,
+        )
+
+    def worked(self, value: int) -> int:
+        """Return the working time from the first prepared day up to an
+        instant, in microseconds.
+
+        :param value: UTC microseconds since the epoch
+
+        :return: An integer
+        """
+        day_starts = self.day_starts
+        index = (value - day_starts[0]) // self.day
+        index = min(max(index, 0), len(day_starts) - 2)
+        # a day is 23 or 25 hours long across a DST change
+        while index > 0 and day_starts[index] > value:
+            index -= 1
+        while index < len(day_starts) - 2 and day_starts[index + 1] <= value:
+            index += 1
+        total = self.totals[index]
+        for begin, finish in self.segments[index]:
+            if value <= begin:
+                break
+            total += (value if value < finish else finish) - begin
+        return total
+
+    def working(self, start: int, end: int) -> int:
+        """Return the working time between two instants, in microseconds.
+
+        :param start: UTC microseconds since the epoch
+
+        :param end: UTC microseconds since the epoch
+
+        :return: An integer
+        """
+        self.prepare(min(start, end), max(start, end))
+        return self.worked(end) - self.worked(start)
+
+    def durations(
+        self, starts: t.Sequence[int], ends: t.Sequence[int]
+    ) -> array:
+        """Return the working time of every interval, in microseconds.
+
+        :param starts: UTC microseconds of the start of each interval
+
+        :param ends: UTC microseconds of the end of each interval
+
+        :return: An array of integers
+        """
+        if len(starts) == 0:
+            return array("q")
+        self.prepare(min(starts), max(ends))
+        worked = self.worked
+        return array(
+            "q",
+            [worked(end) - worked(start) for start, end in zip(starts, ends)],
+        )
+
+
 def convert_to_local_time(
     tzinfo: str = None, ahead: int = 0, use_format: str = None,
         sep: str = "T", curr_time: bool = True
@@ -510,6 +1170,7 @@ def enhance_search(
         defined_url: str,
         method: str = "GET",
         limit: int = None,
+        count: bool = True,
 ) -> dict:
     """Performs a search of issues keeping the payload mechanism looking like
     the old API for search, while retaining the new features of search in Cloud.
@@ -583,21 +1244,22 @@ def enhance_search(
       # output 110 items returned instead of total 123
       # {"total": 123, "issues": [...], "limit": 110 }
 
+    :param count: If False, the approximate count request is not sent
+                  and the ``total`` key is left out of the result
+
+    .. versionchanged:: 0.9.5
+
+    count - Makes the approximate count of issues optional.
+
+    The pages are collected in linear time and no further page is
+    requested once ``limit`` issues are found. Use :func:`iter_search`
+    to process the issues without holding the whole result.
 
     :return: A dictionary with the results of the search
     """
     from jiraone import endpoint, LOGIN
 
-    if not isinstance(defined_url, str):
-        raise JiraOneErrors(
-            "error", "The `defined_url` argument must "
-                     "be a string that is a valid URL."
-        )
-    if defined_url == "":
-        raise JiraOneErrors(
-            "error", "The `defined_url` argument "
-                     "must not be an empty string."
-        )
+    __validate_search__(defined_url, method)
     if limit is not None:
         if not isinstance(limit, int):
             raise JiraOneErrors(
@@ -610,81 +1272,131 @@ def enhance_search(
                 "The `limit` argument must be an integer greater than 100"
             )
     data_obj: dict = {}
-    # switch between GET or POST method automatically based on the provided
-    # arguments.
-    if "?" in defined_url:
-        get_param_list: list = defined_url.split("?")[1].split("&")
-        jql: str = [
-            item.split("jql=")[1] for item in get_param_list if "jql=" in item
-        ][0]
-    else:
-        jql: dict = endpoint.get_issue_search_payload.get("jql")
-
-    total: int = LOGIN.post(endpoint.search_issue_count(),
-                            payload={"jql": jql},
-                            )
-    data_obj["total"] = total.json().get("count", 0)
-
-    if defined_url is not None:
-        resp = LOGIN.get(
-           defined_url,
-        ) if method.upper() == "GET" else LOGIN.post(
-            defined_url, payload=endpoint.get_issue_search_payload
+    if count is True:
+        # the JQL is read from the URL or the payload of a POST search
+        if "?" in defined_url:
+            get_param_list: list = defined_url.split("?")[1].split("&")
+            jql: str = [
+                item.split("jql=")[1] for item in get_param_list
+                if "jql=" in item
+            ][0]
+        else:
+            jql: dict = endpoint.get_issue_search_payload.get("jql")
+
+        total: int = LOGIN.post(endpoint.search_issue_count(),
+                                payload={"jql": jql},
+                                )
+        data_obj["total"] = total.json().get("count", 0)
+
+    # one more issue than ``limit`` is read, so ``limit`` is only set on a
+    # result which was truncated.
+    data_obj["issues"] = list(
+        iter_search(
+            defined_url,
+            method=method,
+            limit=limit + 1 if limit is not None else None,
         )
-        if resp.status_code < 300:
-            resp_obj = resp.json()
-            def get_issues() -> None:
-                """
-                process the issue response
-                """
-                if "issues" in resp_obj:
-                    issues = resp_obj["issues"]
-                    if "issues" not in data_obj:
-                        data_obj["issues"] = issues
-                    elif "issues" in data_obj:
-                        data_obj["issues"] = data_obj["issues"] + issues
-
-            get_issues()
-            while "nextPageToken" in resp_obj:
-                next_token, token = resp_obj["nextPageToken"], None
-                if "nextPageToken=" in defined_url:
-                    get_token_list = defined_url.split("?")[1].split("&")
-                    token = \
-                    [item.split("nextPageToken=")[1] for item in get_token_list
-                     if "nextPageToken=" in item
-                     ][0]
-                else:
-                    token = next_token
-
-                if method.upper() == "POST":
-                    modify_payload: dict = endpoint.get_issue_search_payload
-                    if next_token is not None:
-                        modify_payload.update({"nextPageToken": next_token})
-                        endpoint.get_issue_search_payload = modify_payload
-                is_token_on = (defined_url.replace(
-                        f"nextPageToken={token}",
-                        f"nextPageToken={next_token}",
-                    1) if "nextPageToken=" in defined_url else
-                 defined_url + f"&nextPageToken={token}")
-
-                resp = (
-                    LOGIN.get(is_token_on)
-                    if method.upper() == "GET" else LOGIN.post(
-                    defined_url, payload=endpoint.get_issue_search_payload
-                    )
-                        )
-                if resp.status_code < 300:
-                    resp_obj = resp.json()
-                    get_issues()
+    )
+    if limit is not None and len(data_obj["issues"]) > limit:
+        data_obj["issues"] = data_obj["issues"][:limit]
+        data_obj["limit"] = limit
+    return data_obj
+
+
+def __validate_search__(defined_url: str, method: str) -> None:
+    """Checks the arguments of a search URL."""
+    if not isinstance(defined_url, str):
+        raise JiraOneErrors(
+            "error", "The `defined_url` argument must "
+                     "be a string that is a valid URL."
+        )
+    if defined_url == "":
+        raise JiraOneErrors(
+            "error", "The `defined_url` argument "
+                     "must not be an empty string."
+        )
+    if not isinstance(method, str):
+        raise JiraOneErrors(
+            "error", "The `method` argument must be a string."
+        )
+
+
+def iter_search(
+        defined_url: str,
+        method: str = "GET",
+        limit: int = None,
+) -> t.Iterator[dict]:
+    """Yields the issues of a search one after another, requesting the
+    next page only when the issues of the current page are consumed. It
+    accepts the same URL and method as ``enhance_search``, so callers
+    never hold the whole result set.
+
+    Example 1::
+
+      from jiraone.utils import iter_search
+      from jiraone import endpoint, LOGIN
+
+      # auth process here
+      jql = "project = IT AND order by createdDate DESC"
+      for issue in iter_search(endpoint.search_cloud_issues(
+          jql, fields="summary"), limit=500):
+          print(issue["key"])
+
+    :param defined_url: The URL pattern to issue search
+
+    :param method: values are "GET" or "POST" and case-insensitive
+                   defaults to "GET" method
+
+    :param limit: The maximum number of issues to yield
+
+    .. versionadded:: 0.9.5
+
+    :return: An iterator of issues
+    """
+    from urllib.parse import quote
+    from jiraone import endpoint, LOGIN
+
+    __validate_search__(defined_url, method)
+    if limit is not None and (not isinstance(limit, int) or limit < 1):
+        raise JiraOneErrors(
+            "error",
+            "The `limit` argument must be an integer greater than 0."
+        )
+    is_post = method.upper() == "POST"
+    # a copy of the payload, so the endpoint payload is left untouched
+    payload: dict = (
+        dict(endpoint.get_issue_search_payload or {}) if is_post else {}
+    )
+    next_token, found = None, 0
+    while True:
+        if is_post:
+            if next_token is not None:
+                payload["nextPageToken"] = next_token
+            resp = LOGIN.post(defined_url, payload=payload)
         else:
+            page_url = defined_url
+            if next_token is not None:
+                token = f"nextPageToken={quote(next_token, safe='')}"
+                page_url = (
+                    re.sub(r"nextPageToken=[^&]*", token, defined_url)
+                    if "nextPageToken=" in defined_url
+                    else defined_url
+                    + ("&" if "?" in defined_url else "?")
+                    + token
+                )
+            resp = LOGIN.get(page_url)
+        if resp.status_code >= 300:
             raise JiraOneErrors(
-                "error","Failed to get issue data - {}".format(
+                "error", "Failed to get issue data - {}".format(
                     resp.text
                 )
             )
-
-    if limit is not None:
-        if len(data_obj["issues"]) > limit:
-            data_obj["issues"] = data_obj["issues"][:limit]
-            data_obj["limit"] = limit
-    return data_obj
+        resp_obj = resp.json()
+        for issue in resp_obj.get("issues") or []:
+            if limit is not None and found >= limit:
+                return
+            found += 1
+            yield issue
+        next_token = resp_obj.get("nextPageToken")
+        if not next_token or (limit is not None and found >= limit):
+            return
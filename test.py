@@ -8,15 +8,18 @@ import unittest
 from collections import deque
 from jiraone import (
     LOGIN,
+    ALOGIN,
     endpoint,
     issue_export,
     path_builder,
     PROJECT,
     file_reader,
+    iter_rows,
     manage,
     delete_attachments,
     USER,
     file_writer,
+    CsvSink,
     field,
     __version__,
 )
@@ -65,6 +68,209 @@ class JiraOne(unittest.TestCase):
         session = LOGIN.session.get(endpoint.myself())
         self.assertTrue(session.status_code < 300, "Session context failed")
 
+    def test_connection_pool(self):
+        """Test that the LOGIN methods reuse pooled connections"""
+        LOGIN.get(endpoint.myself())
+        LOGIN.get(endpoint.myself())
+        stats = LOGIN.pool_stats
+        self.assertTrue(stats["requests"] >= 2, "Pool statistics not recorded")
+        self.assertTrue(stats["reuse_ratio"] > 0, "Connections are not reused")
+
+    def test_async_login(self):
+        """Test concurrent requests using the asynchronous ALOGIN client"""
+        import asyncio
+
+        ALOGIN.from_login(LOGIN)
+
+        async def fetch():
+            async with ALOGIN:
+                return await ALOGIN.fetch_all(
+                    [endpoint.myself(), endpoint.get_all_priorities()]
+                )
+
+        responses = asyncio.run(fetch())
+        self.assertTrue(
+            all(r.status_code < 300 for r in responses),
+            "Asynchronous requests failed",
+        )
+
+    def test_rate_limiter(self):
+        """Test the rate limiter backoff on rate limited responses"""
+        import requests
+        from jiraone.access import RateLimiter
+
+        limiter = RateLimiter(rate=10, burst=10)
+        response = requests.Response()
+        response.status_code = 429
+        response.headers["Retry-After"] = "5"
+        limiter.update(response)
+        self.assertTrue(limiter.rate == 5, "Rate not reduced on 429 response")
+        self.assertTrue(
+            limiter.backoff(0, response) >= 5, "Retry-After header not honoured"
+        )
+        self.assertIsNotNone(LOGIN.rate_limiter, "LOGIN has no rate limiter")
+        response.status_code = 503
+        del response.headers["Retry-After"]
+        self.assertTrue(LOGIN.__retry__("GET", response), "GET not retried")
+        self.assertFalse(LOGIN.__retry__("POST", response), "POST retried")
+
+    def test_bounded_executor(self):
+        """Test the bounded thread pool joins and collects every task"""
+        from jiraone.utils import BoundedExecutor
+
+        with BoundedExecutor(workers=4, queue_size=2) as pool:
+            for number in range(10):
+                pool.submit(pow, number, 2)
+        self.assertEqual(len(pool.results), 10, "Not every task completed")
+        with BoundedExecutor(workers=4) as pool:
+            squares = list(pool.map(abs, range(-5, 0)))
+        self.assertEqual(squares, [5, 4, 3, 2, 1], "Results are out of order")
+
+    def test_csv_sink(self):
+        """Test the buffered CSV sink writes what file_reader reads"""
+        with CsvSink("TEST", "sink.csv", mode="w+", flush_every=2) as sink:
+            sink.writerow(["key", "summary"])
+            sink.writerows([["A-1", "One"], ["A-2", "Two"], ["A-3", "Three"]])
+        self.assertEqual(sink.rows, 4, "Rows were not counted")
+        rows = file_reader(folder="TEST", file_name="sink.csv", skip=True)
+        self.assertEqual(rows[-1], ["A-3", "Three"], "Rows were not written")
+
+    def test_iter_rows(self):
+        """Test the lazy CSV reader"""
+        file_writer(
+            folder="TEST",
+            file_name="rows.csv",
+            data=[["key", "summary"], ["A-1", "One"], ["A-2", "Two"]],
+            mark="many",
+            mode="w+",
+        )
+        rows = file_reader(folder="TEST", file_name="rows.csv", stream=True)
+        self.assertNotIsInstance(rows, list, "Rows are not streamed")
+        self.assertEqual(len(list(rows)), 3, "Not every row was read")
+        rows = list(iter_rows("TEST", "rows.csv", row_type="dict"))
+        self.assertEqual(rows[1]["summary"], "Two", "Rows not keyed by header")
+        rows = list(iter_rows("TEST", "rows.csv", row_type="namedtuple"))
+        self.assertEqual(rows[0].key, "A-1", "Rows are not named tuples")
+
+    def test_field_catalog(self):
+        """Test the field catalog loads the fields once"""
+        catalog = LOGIN.field_catalog
+        summary = catalog.get("Summary")
+        self.assertIsNotNone(summary, "Summary field not found")
+        self.assertEqual(catalog.get(summary["id"]), summary)
+        loads = catalog.loads
+        field.get_field("Summary")
+        field.search_field("Sprint")
+        self.assertEqual(catalog.loads, loads, "The fields were loaded again")
+
+    def test_iter_issues(self):
+        """Test the lazy JQL search iterator"""
+        pages = LOGIN.iter_pages(self.jql, fields=["summary"], page_size=10)
+        keys = [issue["key"] for page in pages for issue in page["issues"]]
+        self.assertEqual(len(keys), len(set(keys)), "Duplicate issues returned")
+        self.assertEqual(len(keys), pages.count, "Issue count mismatch")
+        issue = next(LOGIN.iter_issues(self.jql, fields=["summary"]), None)
+        if issue is not None:
+            self.assertIn("summary", issue["fields"], "Fields not returned")
+        parallel = LOGIN.iter_pages(
+            self.jql, fields=["summary"], page_size=10, workers=4
+        )
+        parallel_keys = [
+            issue["key"] for page in parallel for issue in page["issues"]
+        ]
+        self.assertEqual(keys, parallel_keys, "Parallel pages out of order")
+        sharded = LOGIN.iter_shards(
+            self.jql, fields=["summary"], shard_size=10, workers=4
+        )
+        sharded_keys = [issue["key"] for issue in sharded.issues()]
+        self.assertEqual(
+            sorted(keys), sorted(sharded_keys), "Sharded search mismatch"
+        )
+
+    def test_shard_plan(self):
+        """Test a window counted empty is still searched"""
+        import re
+        from datetime import datetime
+        from unittest import mock
+        from jiraone.access import ShardedSearch
+
+        def count(jql):
+            start, end = re.findall(r'"([^"]+)"', jql)
+            if end <= "2024/01/03 00:00":
+                return 0
+            return 20 if start < "2024/01/03 00:00" else 8
+
+        search = ShardedSearch(LOGIN, "project = A", shard_size=10)
+        edges = {
+            "ASC": datetime(2024, 1, 1),
+            "DESC": datetime(2024, 1, 5),
+        }
+        with mock.patch.object(
+            search, "__edge__", side_effect=edges.get
+        ), mock.patch.object(search, "approximate_count", side_effect=count):
+            shards = search.plan()
+        windows = [re.findall(r'"([^"]+)"', shard) for shard in shards]
+        self.assertEqual(windows[0][0], "2023/12/31 00:00", "A window is lost")
+        self.assertEqual(windows[-1][1], "2024/01/07 00:00")
+        self.assertTrue(
+            all(
+                before[1] == after[0]
+                for before, after in zip(windows, windows[1:])
+            ),
+            "The windows are not contiguous",
+        )
+        self.assertEqual(count(shards[0]), 0, "Empty windows are dropped")
+
+    def test_iter_bulk_issues(self):
+        """Test the bulk issue fetch keeps the order of the keys"""
+        keys = [
+            issue["key"]
+            for issue in LOGIN.iter_issues(self.jql, fields=["key"])
+        ][:30]
+        issues = list(
+            LOGIN.iter_bulk_issues(keys, fields=["summary"], batch_size=7)
+        )
+        self.assertEqual([issue["key"] for issue in issues], keys)
+        self.assertTrue(
+            all("summary" in issue["fields"] for issue in issues),
+            "Fields not returned",
+        )
+
+    def test_iter_changelogs(self):
+        """Test the bulk changelog reader on Jira Cloud"""
+        LOGIN.api = True
+        issues = list(LOGIN.iter_issues(self.jql, fields=["key"]))[:20]
+        ids = [issue["id"] for issue in issues]
+        changelogs = list(LOGIN.iter_changelogs(ids, batch_size=7))
+        self.assertEqual(
+            [issue_id for issue_id, _ in changelogs], ids, "Issues out of order"
+        )
+        for _, histories in LOGIN.iter_changelogs(ids, field_ids=["status"]):
+            for past in histories:
+                for item in past["items"]:
+                    self.assertEqual(item["fieldId"], "status", "Not filtered")
+
+    def test_enhance_search(self):
+        """Test the search helpers stop at the given limit"""
+        from jiraone.utils import enhance_search, iter_search
+
+        search = enhance_search(
+            endpoint.search_cloud_issues(self.jql, fields="summary"),
+            limit=101,
+            count=False,
+        )
+        self.assertNotIn("total", search, "Approximate count was requested")
+        self.assertTrue(len(search["issues"]) <= 101, "Limit not applied")
+        if len(search["issues"]) < 101:
+            self.assertNotIn("limit", search, "Result was not truncated")
+        issues = list(
+            iter_search(
+                endpoint.search_cloud_issues(self.jql, fields="summary"),
+                limit=5,
+            )
+        )
+        self.assertTrue(len(issues) <= 5, "Limit not applied to iterator")
+
     def test_endpoints(self):
         """Test endpoint constant extraction"""
         load = LOGIN.get(endpoint.myself())
@@ -93,6 +299,71 @@ class JiraOne(unittest.TestCase):
                 os.path.isfile(path), "Unable to detect CSV file for issue export"
             )
 
+    def test_merge_csv_files(self):
+        """Test pages with repeated columns merge under the same header"""
+        from jiraone.reporting import Projects
+
+        file_writer(
+            folder="TEST",
+            file_name="page_1.csv",
+            data=[
+                ["Issue key", "Comment", "Summary"],
+                ["A-1", "first", "One"],
+            ],
+            mark="many",
+            mode="w+",
+        )
+        file_writer(
+            folder="TEST",
+            file_name="page_2.csv",
+            data=[
+                ["Issue key", "Comment", "Comment", "Comment", "Summary"],
+                ["A-2", "a", "b", "c", "Two"],
+            ],
+            mark="many",
+            mode="w+",
+        )
+        Projects.merge_csv_files(
+            ["page_1.csv", "page_2.csv"], "TEST", "merged.csv"
+        )
+        rows = file_reader(folder="TEST", file_name="merged.csv")
+        self.assertEqual(
+            rows[0],
+            ["Issue key", "Comment", "Comment", "Comment", "Summary"],
+            "The header does not repeat the most comments",
+        )
+        self.assertEqual(rows[1], ["A-1", "first", "", "", "One"])
+        self.assertEqual(rows[2], ["A-2", "a", "b", "c", "Two"])
+
+    def test_export_page_retry(self):
+        """Test a CSV export page which breaks while streamed is retried"""
+        import requests
+        from unittest import mock
+
+        broken = mock.MagicMock(status_code=200, reason="OK")
+        broken.__enter__.return_value = broken
+        broken.iter_content.side_effect = (
+            requests.exceptions.ChunkedEncodingError("Connection broken")
+        )
+        get, calls = LOGIN.get, []
+
+        def flaky_get(url, *args, **kwargs):
+            if "searchrequest-csv" in url and not calls:
+                calls.append(url)
+                return broken
+            return get(url, *args, **kwargs)
+
+        path = path_builder("TEST", "test_export_page_retry.csv")
+        with mock.patch.object(LOGIN, "get", side_effect=flaky_get):
+            issue_export(
+                jql=self.jql,
+                extension="csv",
+                folder="TEST",
+                final_file="test_export_page_retry.csv",
+            )
+        self.assertEqual(len(calls), 1, "The broken page was not served")
+        self.assertTrue(os.path.isfile(path), "The page was not retried")
+
     def test_issue_export_json(self):
         """Test JSON issue export"""
         jql = self.jql
@@ -109,6 +380,216 @@ class JiraOne(unittest.TestCase):
                 os.path.isfile(path), "Unable to detect JSON file for issue export"
             )
 
+    def test_incremental_export(self):
+        """Test an incremental CSV issue export"""
+        jql = self.jql
+        path = path_builder("TEST", "test_incremental_export.csv")
+        for _ in range(2):
+            issue_export(
+                jql=jql,
+                extension="csv",
+                folder="TEST",
+                final_file="test_incremental_export.csv",
+                incremental=True,
+            )
+        with open(path_builder("TEST", "export_watermark.json")) as watermark:
+            state = list(json.load(watermark).values())[0]
+        self.assertTrue(os.path.isfile(path), "Unable to detect CSV file")
+        self.assertEqual(state["deltas"], [], "Delta files were not compacted")
+
+    def test_incremental_compaction(self):
+        """Test an incremental export replaces and removes issues"""
+        from datetime import datetime, timezone
+        from unittest import mock
+        from jiraone.exceptions import JiraOneErrors
+        from jiraone.reporting import Projects
+
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000%z")
+        old = "2020-01-01T00:00:00.000+0000"
+        searched = [
+            {"key": "A-1", "fields": {"updated": now}},
+            {"key": "A-2", "fields": {"updated": old}},
+            {"key": "A-4", "fields": {"updated": now}},
+        ]
+
+        def issue(key, summary):
+            return {"key": key, "summary": summary, "comments": [key]}
+
+        exports = {
+            "csv": [
+                [
+                    ["Issue key", "Summary", "Comment"],
+                    ["A-1", "One", "a"],
+                    ["A-2", "Two", "b"],
+                    ["A-3", "Three", "c"],
+                ],
+                [
+                    ["Issue key", "Summary", "Comment", "Comment"],
+                    ["A-1", "One changed", "a", "d"],
+                    ["A-4", "Four", "e", ""],
+                ],
+            ],
+            "json": [
+                {
+                    "links": [{"sourceId": "A-1", "destinationId": "A-3"}],
+                    "projects": [
+                        {
+                            "key": "A",
+                            "issues": [
+                                issue("A-1", "One"),
+                                issue("A-2", "Two"),
+                                issue("A-3", "Three"),
+                            ],
+                        }
+                    ],
+                },
+                {
+                    "links": [{"sourceId": "A-4", "destinationId": "A-1"}],
+                    "projects": [
+                        {
+                            "key": "A",
+                            "issues": [
+                                issue("A-1", "One changed"),
+                                issue("A-4", "Four"),
+                            ],
+                        },
+                        {"key": "B", "issues": [issue("B-1", "Other")]},
+                    ],
+                    "users": [{"name": "jira"}],
+                },
+            ],
+        }
+        for extension, pages in exports.items():
+            output = f"test_incremental_compaction.{extension}"
+            for name in (output, "compaction_watermark.json"):
+                if os.path.isfile(path_builder("TEST", name)):
+                    os.remove(path_builder("TEST", name))
+
+            def fake_export(folder, final_file, **kwargs):
+                page = pages.pop(0)
+                if extension == "csv":
+                    file_writer(folder, final_file, data=page, mark="many")
+                else:
+                    with open(path_builder(folder, final_file), "w+") as f:
+                        json.dump(page, f, indent=4, sort_keys=True)
+
+            with mock.patch.object(
+                PROJECT, "export_issues", side_effect=fake_export
+            ), mock.patch.object(
+                LOGIN, "iter_shards"
+            ) as search, mock.patch.object(
+                LOGIN, "iter_issues", return_value=[]
+            ) as changes:
+                search.return_value.issues.return_value = searched
+                # the second run prunes, the third finds no change.
+                for prune in (False, True, False):
+                    Projects.export_issues(
+                        jql="ORDER BY created",
+                        extension=extension,
+                        folder="TEST",
+                        final_file=output,
+                        incremental=True,
+                        watermark_file="compaction_watermark.json",
+                        prune=prune,
+                    )
+            self.assertEqual(search.call_count, 1, "The keys were searched")
+            self.assertEqual(
+                search.call_args[0][0], "ORDER BY created", "Wrong key search"
+            )
+            self.assertEqual(changes.call_count, 1, "Wrong change search")
+            self.assertRegex(
+                changes.call_args[0][0],
+                r'^updated >= "-\d+m" ORDER BY created$',
+                "Wrong change search",
+            )
+            with open(path_builder("TEST", "compaction_watermark.json")) as f:
+                state = list(json.load(f).values())[0]
+            if extension == "json":
+                self.assertEqual(state["keys"], ["A-1", "A-2", "A-4", "B-1"])
+            else:
+                self.assertEqual(state["keys"], ["A-1", "A-2", "A-4"])
+            self.assertEqual(state["removed"], [], "A-3 was not removed")
+            if extension == "csv":
+                rows = file_reader(folder="TEST", file_name=output)
+                self.assertEqual(
+                    rows,
+                    [
+                        ["Issue key", "Summary", "Comment", "Comment"],
+                        ["A-2", "Two", "b", ""],
+                        ["A-1", "One changed", "a", "d"],
+                        ["A-4", "Four", "e", ""],
+                    ],
+                    "The changed rows were not replaced",
+                )
+                continue
+            expected = {
+                "links": [{"destinationId": "A-1", "sourceId": "A-4"}],
+                "projects": [
+                    {
+                        "key": "A",
+                        "issues": [
+                            issue("A-1", "One changed"),
+                            issue("A-2", "Two"),
+                            issue("A-4", "Four"),
+                        ],
+                    },
+                    {"key": "B", "issues": [issue("B-1", "Other")]},
+                ],
+                "users": [{"name": "jira"}],
+            }
+            with open(path_builder("TEST", output)) as f:
+                self.assertEqual(
+                    f.read(),
+                    json.dumps(expected, indent=4, sort_keys=True),
+                    "The changed issues were not replaced",
+                )
+        with self.assertRaises(JiraOneErrors):
+            Projects.export_issues(
+                jql="ORDER BY created",
+                folder="TEST",
+                incremental=True,
+                include_fields=["Summary"],
+            )
+
+    def test_sub_task_index(self):
+        """Test the sub-task links of a synthetic project"""
+        from jiraone.utils import SubTaskIndex
+
+        index = SubTaskIndex(["Sub-task"])
+        for number in range(100000):
+            if number % 5:
+                issue = {"id": str(number), "key": f"A-{number}"}
+            else:
+                issue = {
+                    "id": str(number),
+                    "key": f"A-{number}",
+                    "issueType": "Sub-task",
+                    "parent": str(number + 1),
+                }
+            index.add(number // 50000, issue)
+        index.add(2, {"id": "1", "key": "B-1"})
+        index.add(2, {"key": "B-2", "issueType": "Sub-task", "parent": "x"})
+        links = index.links()
+        self.assertEqual(len(links), 20001, "Every sub-task is not linked")
+        self.assertEqual(
+            links[0],
+            {
+                "name": "jira_subtask_link",
+                "destinationId": "A-0",
+                "sourceId": "A-1",
+            },
+        )
+        self.assertTrue(
+            all(
+                link["sourceId"] == "A-{}".format(
+                    int(link["destinationId"][2:]) + 1
+                )
+                for link in links[:-1]
+            ),
+            "A sub-task is linked to the wrong parent",
+        )
+        self.assertEqual(links[-1]["sourceId"], "", "Unknown parent linked")
+
     def test_time_in_status(self):
         """Test for time in status for CSV or JSON"""
         key = self.issue_key
@@ -144,6 +625,75 @@ class JiraOne(unittest.TestCase):
                 "Unable to detect CSV file for time in status",
             )
 
+    def test_status_transitions(self):
+        """Test for the columnar time in status engine"""
+        from datetime import datetime
+        from jiraone.module import StatusTransitions
+
+        rows = [
+            ["T-1", "", "", "2024-01-01T10:00:00.000+0000", "",
+             "", "", "To Do", "", "To Do"],
+            ["T-1", "", "", "2024-01-01T11:30:00.000+0100", "jira",
+             "", "", "To Do", "", "Done"],
+            ["T-2", "", "", "2024-01-02T00:00:00.000+0000", "",
+             "", "", "To Do", "", "To Do"],
+        ]
+        now = datetime.fromisoformat("2024-01-03T00:00:00.000+00:00")
+        frame = StatusTransitions.from_rows(rows, api=False, now=now)
+        self.assertEqual(
+            list(frame.durations()),
+            [1800000000, 135000000000, 86400000000],
+            "Unexpected time in status",
+        )
+        self.assertEqual(
+            frame.statuses(), ["To Do", "Done", "To Do"], "Wrong statuses"
+        )
+        summary = frame.summary()
+        self.assertEqual(summary["issues"][0]["leadTime"], 1800.0)
+        self.assertIsNone(summary["issues"][0]["cycleTime"])
+        self.assertEqual(summary["statuses"]["To Do"]["issues"], 2)
+        self.assertEqual(summary["statuses"]["To Do"]["total"], 88200.0)
+        self.assertAlmostEqual(
+            summary["statuses"]["To Do"]["p50"], 1800, delta=18
+        )
+        # a naive ``now`` is read as the local time
+        naive = StatusTransitions.from_rows(
+            rows, api=False, now=datetime(2024, 1, 3)
+        )
+        self.assertIsNotNone(naive.now.tzinfo, "Expected an aware datetime")
+        self.assertEqual(len(naive.durations()), 3)
+
+    def test_work_calendar(self):
+        """Test the working time of a business hours calendar"""
+        from datetime import datetime, timezone
+        from jiraone.utils import WorkCalendar
+        from jiraone.exceptions import JiraOneErrors
+
+        def instant(value):
+            moment = datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+            return int(moment.timestamp()) * 1000000
+
+        calendar = WorkCalendar(
+            hours=["09:00-12:00", "13:00-17:00"], holidays=["2024-01-09"]
+        )
+        # Friday 16:00 to Wednesday 10:00, a holiday on Tuesday
+        self.assertEqual(
+            calendar.working(
+                instant("2024-01-05 16:00"), instant("2024-01-10 10:00")
+            ),
+            (1 + 7 + 1) * 3600000000,
+        )
+        # a timestamp CSV output has no duration to measure
+        with self.assertRaises(JiraOneErrors):
+            time_in_status(
+                PROJECT,
+                self.issue_key,
+                reader=file_reader,
+                output_format="csv",
+                login=LOGIN,
+                calendar=calendar,
+            )
+
     def test_history_extraction(self):
         """Test for issue history extraction"""
         jql = "key = {}".format(self.issue_key)